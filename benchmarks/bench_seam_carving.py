@@ -0,0 +1,325 @@
+"""
+Benchmarks for the seam carving engines (see engines.py).
+
+For every engine and synthetic image size this times the four steps of
+a seam removal (energy, cumulative DP, backtrack, removal) and full
+carves of several seam counts, and reports
+
+    ns_per_px        best time per call / pixels of the input image
+                     (full carves: median over seams of seam time /
+                     pixels of the image that seam was carved from)
+    peak_alloc_mb    peak memory traced by tracemalloc during one call
+                     (NumPy buffers included), above what was live before;
+                     traced in a separate, untimed run
+    retained_mb      traced memory still allocated after the call
+    peak_rss_mb      peak RSS of the benchmark process so far
+
+Results are written as JSON; --save stores them as a named baseline in
+benchmarks/baselines/ and --check compares ns/pixel against one,
+exiting non-zero on regressions beyond --tolerance. Baselines are only
+comparable on the machine (and NumPy/SciPy build) that produced them;
+the host is recorded in the file.
+
+Full carves at large sizes take a long time with the reference engine:
+each case stops after --budget seconds and reports the seams it got
+through ("seams_timed") with per-seam cost, marked as extrapolated.
+
+Usage (from the repo root):
+    python benchmarks/bench_seam_carving.py --preset quick
+    python benchmarks/bench_seam_carving.py --preset quick --check quick
+    python benchmarks/bench_seam_carving.py --preset full --save full
+    python benchmarks/bench_seam_carving.py --sizes 1920x1080 --seams 1 0.1
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from engines import ENGINES, get_engine
+
+try:
+    import resource
+except ImportError:   # Windows
+    resource = None
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+PRESETS = {
+    # (sizes as (H, W), seam counts: ints are absolute, floats fractions of W)
+    "quick": ([(256, 256), (512, 512), (1024, 1024)], [1, 0.01, 0.1]),
+    "full": (
+        [(256, 256), (512, 512), (1024, 1024), (2048, 2048),
+         (1080, 1920), (2160, 3840), (4320, 7680)],
+        [1, 0.01, 0.1, 0.3],
+    ),
+}
+
+STEPS = ("energy_map", "cumulative_min_energy_vertical", "find_vertical_seam", "remove_vertical_seam")
+
+
+# ==========================================================
+# Inputs
+# ==========================================================
+def synthetic_image(h, w, seed=0, dtype=np.float32):
+    """
+    Deterministic (h, w, 3) image in [0, 1]: smooth gradients, some hard
+    edges and mild noise, so seams have structure to follow.
+    """
+    rng = np.random.default_rng(seed)
+    y = np.linspace(0, 1, h, dtype=dtype)[:, None]
+    x = np.linspace(0, 1, w, dtype=dtype)[None, :]
+    img = np.empty((h, w, 3), dtype=dtype)
+    img[..., 0] = 0.5 + 0.5 * np.sin(6 * x + 3 * y)
+    img[..., 1] = (x + y) / 2
+    img[..., 2] = ((x * 7).astype(int) + (y * 5).astype(int)) % 2   # checker blocks
+    img += rng.normal(0, 0.02, size=img.shape).astype(dtype)
+    return np.clip(img, 0, 1, out=img)
+
+
+def seam_count(spec, width):
+    if isinstance(spec, float):
+        return max(1, round(spec * width))
+    return spec
+
+
+def parse_size(text):
+    w, h = text.lower().split("x") if "x" in text.lower() else (text, text)
+    return int(h), int(w)
+
+
+def parse_seams(text):
+    return float(text) if "." in text else int(text)
+
+
+# ==========================================================
+# Measurement
+# ==========================================================
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def time_call(fn, repeat, min_time):
+    """Best and median wall time of fn() over at least `repeat` calls / `min_time` s."""
+    times = []
+    start = time.perf_counter()
+    while len(times) < repeat or time.perf_counter() - start < min_time:
+        gc.collect()
+        t0 = time.perf_counter_ns()
+        fn()
+        times.append(time.perf_counter_ns() - t0)
+        if len(times) >= 100:
+            break
+    return min(times), float(np.median(times)), len(times)
+
+
+def memory_of_call(fn):
+    """(peak MB, retained MB) traced while running fn() once."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        current, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return (peak - before) / 2**20, (current - before) / 2**20
+
+
+def bench_steps(engine, img, repeat, min_time):
+    h, w = img.shape[:2]
+    E = engine.energy_map(img)
+    M, back = engine.cumulative_min_energy_vertical(E)
+    seam = engine.find_vertical_seam(M, back)
+    calls = {
+        "energy_map": lambda: engine.energy_map(img),
+        "cumulative_min_energy_vertical": lambda: engine.cumulative_min_energy_vertical(E),
+        "find_vertical_seam": lambda: engine.find_vertical_seam(M, back),
+        "remove_vertical_seam": lambda: engine.remove_vertical_seam(img, seam),
+    }
+    results = []
+    for step in STEPS:
+        best, median, n = time_call(calls[step], repeat, min_time)
+        peak, retained = memory_of_call(calls[step])
+        results.append({
+            "op": step,
+            "ns_per_px": best / (h * w),
+            "best_s": best / 1e9,
+            "median_s": median / 1e9,
+            "runs": n,
+            "peak_alloc_mb": peak,
+            "retained_mb": retained,
+        })
+    return results
+
+
+def bench_carve(engine, img, k, budget, repeat):
+    """
+    Carve up to k seams, stopping once `budget` seconds are spent. Seams
+    are timed one by one; for k < repeat the first seam is carved again
+    from the same image so the median has `repeat` samples.
+    """
+    h, w = img.shape[:2]
+    # tracemalloc slows the per-row Python loops down several times, so
+    # memory is traced on a separate one-seam carve
+    peak, _ = memory_of_call(lambda: engine.carve(img, 1))
+
+    gc.collect()
+    per_px = []   # seconds per pixel of each timed seam
+    elapsed = 0.0
+    current = img
+    while len(per_px) < k and elapsed <= budget:
+        t0 = time.perf_counter()
+        current = engine.carve(current, 1)
+        dt = time.perf_counter() - t0
+        elapsed += dt
+        per_px.append(dt / (h * (w - len(per_px))))
+    done = len(per_px)
+    while len(per_px) < repeat:
+        t0 = time.perf_counter()
+        engine.carve(img, 1)
+        per_px.append((time.perf_counter() - t0) / (h * w))
+
+    return {
+        "op": "carve",
+        "seams": k,
+        "seams_timed": done,
+        "extrapolated": done < k,
+        "ns_per_px": float(np.median(per_px)) * 1e9,
+        "seconds_per_seam": elapsed / done,
+        "total_s": elapsed / done * k,
+        "peak_alloc_mb": peak,
+    }
+
+
+def run(engines, sizes, seam_specs, repeat, min_time, budget, dtype):
+    results = []
+    for name in engines:
+        engine = get_engine(name)
+        for h, w in sizes:
+            img = synthetic_image(h, w, dtype=dtype)
+            cases = bench_steps(engine, img, repeat, min_time)
+            for spec in seam_specs:
+                cases.append(bench_carve(engine, img, seam_count(spec, w), budget, repeat))
+            for case in cases:
+                case.update(engine=name, height=h, width=w, peak_rss_mb=peak_rss_mb())
+                results.append(case)
+                print(format_case(case), flush=True)
+            del img
+    return results
+
+
+# ==========================================================
+# Reporting + baselines
+# ==========================================================
+def case_key(case):
+    op = case["op"] if case["op"] != "carve" else f"carve[{case['seams']}]"
+    return f"{case['engine']}:{op}:{case['width']}x{case['height']}"
+
+
+def format_case(case):
+    extra = ""
+    if case["op"] == "carve":
+        extra = f"  {case['seams_timed']}/{case['seams']} seams, {case['total_s']:.2f}s total"
+        if case["extrapolated"]:
+            extra += " (extrapolated)"
+    return (f"{case_key(case):<58}{case['ns_per_px']:>10.2f} ns/px"
+            f"{case['peak_alloc_mb']:>10.1f} MB peak{extra}")
+
+
+def host_info():
+    import scipy
+
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+    }
+
+
+def check(results, baseline, tolerance):
+    """Cases whose ns/pixel grew by more than `tolerance` over the baseline."""
+    reference = {case_key(c): c for c in baseline["results"]}
+    regressions = []
+    for case in results:
+        old = reference.get(case_key(case))
+        if old is None:
+            continue
+        ratio = case["ns_per_px"] / old["ns_per_px"]
+        marker = "REGRESSION" if ratio > 1 + tolerance else ""
+        print(f"{case_key(case):<58}{old['ns_per_px']:>10.2f} -> {case['ns_per_px']:>10.2f} ns/px"
+              f"  x{ratio:.2f} {marker}")
+        if marker:
+            regressions.append((case_key(case), ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark seam carving engines")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--sizes", nargs="+", type=parse_size,
+                        help="Image sizes as WxH (or N for NxN); overrides the preset")
+    parser.add_argument("--seams", nargs="+", type=parse_seams,
+                        help="Seam counts: integers, or fractions of the width like 0.1")
+    parser.add_argument("--engine", nargs="+", default=sorted(ENGINES), choices=sorted(ENGINES))
+    parser.add_argument("--repeat", type=int, default=3, help="Minimum timed runs per step")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds spent per step")
+    parser.add_argument("--budget", type=float, default=30.0, help="Seconds per full-carve case")
+    parser.add_argument("--dtype", choices=["float32", "float64"], default="float32")
+    parser.add_argument("-o", "--output", help="Write results JSON here")
+    parser.add_argument("--save", metavar="NAME", help="Store results as baselines/NAME.json")
+    parser.add_argument("--check", metavar="NAME", help="Compare against baselines/NAME.json")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed ns/pixel slowdown before --check fails (default: 15%%)")
+    args = parser.parse_args()
+
+    sizes, seams = PRESETS[args.preset]
+    report = {
+        "preset": args.preset,
+        "dtype": args.dtype,
+        "host": host_info(),
+        "results": run(
+            args.engine,
+            args.sizes or sizes,
+            args.seams or seams,
+            args.repeat,
+            args.min_time,
+            args.budget,
+            np.dtype(args.dtype),
+        ),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text)
+    if args.save:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        (BASELINE_DIR / f"{args.save}.json").write_text(text)
+        print(f"Saved baseline {args.save}")
+    if args.check:
+        baseline = json.loads((BASELINE_DIR / f"{args.check}.json").read_text())
+        if baseline["host"] != report["host"]:
+            print("Warning: baseline was recorded on a different host/toolchain")
+        regressions = check(report["results"], baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+            sys.exit(1)
+        print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Seam carving engines known to the benchmarks.
+
+An engine bundles the four steps of one seam removal. The reference
+engine is utils/seam_carving_core; a faster implementation is added by
+registering another Engine with the same call signatures:
+
+    energy_map(img)                       (H, W, 3) float -> (H, W) energy
+    cumulative_min_energy_vertical(E)     -> (M, back)
+    find_vertical_seam(M, back)           -> (H,) column per row
+    remove_vertical_seam(img, seam)       -> (H, W - 1, 3)
+
+bench_seam_carving.py times every step and full carves per engine, and
+equivalence.py checks each engine's seams against the reference
+implementations.
+"""
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from seamcarving_manim.utils import seam_carving_core  # noqa: E402
+
+ENGINES = {}
+
+
+@dataclass(frozen=True)
+class Engine:
+    name: str
+    energy_map: Callable
+    cumulative_min_energy_vertical: Callable
+    find_vertical_seam: Callable
+    remove_vertical_seam: Callable
+    description: str = ""
+
+    def carve(self, img, k):
+        """Remove `k` vertical seams one at a time, recomputing energy each time."""
+        for _ in range(k):
+            M, back = self.cumulative_min_energy_vertical(self.energy_map(img))
+            img = self.remove_vertical_seam(img, self.find_vertical_seam(M, back))
+        return img
+
+
+def register(engine):
+    if engine.name in ENGINES:
+        raise ValueError(f"Engine {engine.name!r} is already registered")
+    ENGINES[engine.name] = engine
+    return engine
+
+
+def get_engine(name):
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise KeyError(f"Unknown engine {name!r}; known: {', '.join(ENGINES)}") from None
+
+
+register(Engine(
+    name="core",
+    energy_map=seam_carving_core.energy_map,
+    cumulative_min_energy_vertical=seam_carving_core.cumulative_min_energy_vertical,
+    find_vertical_seam=seam_carving_core.find_vertical_seam,
+    remove_vertical_seam=seam_carving_core.remove_vertical_seam,
+    description="utils/seam_carving_core (row-wise NumPy DP, per-row seam removal)",
+))
@@ -0,0 +1,220 @@
+"""
+Golden-output equivalence check for seam finders.
+
+The repo has three reference implementations of the minimum-energy
+vertical seam, all the same 8-connected dynamic program:
+
+    core      utils/seam_carving_core: top-down cumulative map + offsets
+    failure   pregen/failure_pregen.find_vertical_seam: top-down, per pixel
+    purple    pregen/purple_seam_pregen.compute_dp_energy (bottom-up) +
+              find_min_energy_seam
+
+Every engine registered in engines.py is a candidate. Each image (repo
+assets, downscaled, plus random images) is turned into an energy map,
+and every finder carves --seams seams from it, removing each seam from
+its own copy of the energy like purple_seam_pregen does. Per seam the
+finders are compared to --reference:
+
+    match      the seam has the same column in every row
+    rows       fraction of rows where the columns agree
+    cost diff  relative difference of the seam's total energy (the
+               cumulative minimum); non-zero means a wrong seam, while
+               match == False with zero cost diff is a tie broken
+               differently
+
+Random images use integer values, so ties are common and expose
+tie-breaking differences. Timings are the total over all seams.
+
+Usage (from the repo root):
+    python benchmarks/equivalence.py
+    python benchmarks/equivalence.py --energy failure --seams 10 --asset-height 120
+    python benchmarks/equivalence.py --reference purple -o equivalence.json
+
+Exits non-zero if any finder's seam costs differ from the reference by
+more than --rtol (or, with --strict, if any seam differs at all).
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from engines import ENGINES, PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT / "pregen"))
+
+import failure_pregen  # noqa: E402
+import purple_seam_pregen  # noqa: E402
+from seamcarving_manim.utils import seam_carving_core  # noqa: E402
+
+ASSETS_DIR = PROJECT_ROOT / "src" / "seamcarving_manim" / "assets" / "images"
+ASSETS = ["memory.jpg", "beach.jpg"]
+RANDOM_SIZES = [(24, 32), (61, 47), (90, 120)]
+
+
+# ==========================================================
+# Energies: uint8 RGB image -> (H, W) float energy
+# ==========================================================
+ENERGIES = {
+    "core": lambda img: seam_carving_core.energy_map(img / 255.0),
+    "failure": lambda img: failure_pregen.compute_energy(img),
+    "purple": lambda img: purple_seam_pregen.sobel_edgeness(np.mean(img, axis=2) / 255.0),
+}
+
+
+# ==========================================================
+# Seam finders: energy -> (seam columns (H,), seam cost)
+# ==========================================================
+def _core_finder(cumulative, find):
+    def finder(E):
+        M, back = cumulative(E)
+        seam = np.asarray(find(M, back))
+        return seam, float(M[-1, seam[-1]])
+    return finder
+
+
+def _failure_finder(E):
+    seam = failure_pregen.find_vertical_seam(E)
+    return seam, float(E[np.arange(len(seam)), seam].sum())
+
+
+def _purple_finder(E):
+    dp = purple_seam_pregen.compute_dp_energy(E)
+    seam = np.array([j for _, j in purple_seam_pregen.find_min_energy_seam(dp)])
+    return seam, float(dp[0, seam[0]])
+
+
+REFERENCES = {
+    "core": _core_finder(
+        seam_carving_core.cumulative_min_energy_vertical, seam_carving_core.find_vertical_seam
+    ),
+    "failure": _failure_finder,
+    "purple": _purple_finder,
+}
+
+
+def finders():
+    found = dict(REFERENCES)
+    for name, engine in ENGINES.items():
+        found[f"engine:{name}"] = _core_finder(
+            engine.cumulative_min_energy_vertical, engine.find_vertical_seam
+        )
+    return found
+
+
+def remove_column(E, seam):
+    keep = np.ones(E.shape, dtype=bool)
+    keep[np.arange(E.shape[0]), seam] = False
+    return E[keep].reshape(E.shape[0], E.shape[1] - 1)
+
+
+# ==========================================================
+# Inputs
+# ==========================================================
+def load_asset(name, height):
+    with Image.open(ASSETS_DIR / name) as im:
+        im = im.convert("RGB")
+        if im.height > height:
+            im = im.resize((max(3, round(im.width * height / im.height)), height), Image.LANCZOS)
+        return np.asarray(im, dtype=np.uint8)
+
+
+def test_images(asset_height, seed):
+    rng = np.random.default_rng(seed)
+    for name in ASSETS:
+        if (ASSETS_DIR / name).exists():
+            yield name, load_asset(name, asset_height)
+    for h, w in RANDOM_SIZES:
+        yield f"random{h}x{w}", rng.integers(0, 4, size=(h, w, 3)).astype(np.uint8) * 85
+
+
+# ==========================================================
+# Comparison
+# ==========================================================
+def carve(finder, E, k):
+    seams, costs = [], []
+    t0 = time.perf_counter()
+    for _ in range(k):
+        seam, cost = finder(E)
+        seams.append(seam)
+        costs.append(cost)
+        E = remove_column(E, seam)
+    return seams, costs, time.perf_counter() - t0
+
+
+def compare(image_name, E, all_finders, reference, k):
+    runs = {name: carve(f, E, k) for name, f in all_finders.items()}
+    ref_seams, ref_costs, _ = runs[reference]
+    rows = []
+    for name, (seams, costs, seconds) in runs.items():
+        agree = [float(np.mean(s == r)) for s, r in zip(seams, ref_seams)]
+        diffs = [abs(c - rc) / max(abs(rc), 1e-12) for c, rc in zip(costs, ref_costs)]
+        mismatched = [i for i, a in enumerate(agree) if a < 1.0]
+        rows.append({
+            "image": image_name,
+            "shape": list(E.shape),
+            "finder": name,
+            "seams": k,
+            "seams_matching": k - len(mismatched),
+            "first_mismatch": mismatched[0] if mismatched else None,
+            "min_row_agreement": min(agree),
+            "max_cost_rel_diff": max(diffs),
+            "seconds": seconds,
+        })
+    return rows
+
+
+def format_row(row):
+    first = "-" if row["first_mismatch"] is None else row["first_mismatch"]
+    return (f"{row['image']:<16}{row['finder']:<14}{row['seams_matching']:>4}/{row['seams']:<4}"
+            f"{first:>7}{row['min_row_agreement']:>10.3f}{row['max_cost_rel_diff']:>12.2e}"
+            f"{row['seconds']:>10.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare seam finders against a reference")
+    parser.add_argument("--reference", choices=sorted(REFERENCES), default="core")
+    parser.add_argument("--energy", choices=sorted(ENERGIES), default="core",
+                        help="Energy function applied to every test image")
+    parser.add_argument("--seams", type=int, default=5, help="Seams carved per image")
+    parser.add_argument("--asset-height", type=int, default=128,
+                        help="Assets are downscaled to this many rows (the per-pixel references are slow)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rtol", type=float, default=1e-9, help="Allowed relative seam cost difference")
+    parser.add_argument("--strict", action="store_true", help="Also fail on seams that differ only by ties")
+    parser.add_argument("-o", "--output", help="Write the rows as JSON here")
+    args = parser.parse_args()
+
+    all_finders = finders()
+    energy = ENERGIES[args.energy]
+    print(f"Reference: {args.reference}, energy: {args.energy}")
+    print(f"{'image':<16}{'finder':<14}{'match':>9}{'first':>7}{'rows':>10}{'cost diff':>12}{'time':>11}")
+
+    results = []
+    for name, img in test_images(args.asset_height, args.seed):
+        E = np.asarray(energy(img), dtype=float)
+        for row in compare(name, E, all_finders, args.reference, args.seams):
+            results.append(row)
+            print(format_row(row))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({
+            "reference": args.reference,
+            "energy": args.energy,
+            "results": results,
+        }, indent=2))
+
+    failed = [r for r in results if r["max_cost_rel_diff"] > args.rtol
+              or (args.strict and r["seams_matching"] < r["seams"])]
+    if failed:
+        print(f"{len(failed)} finder/image pair(s) disagree with {args.reference}")
+        sys.exit(1)
+    print("All finders agree with", args.reference)
+
+
+if __name__ == "__main__":
+    main()
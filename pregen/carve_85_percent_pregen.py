@@ -4,62 +4,86 @@ Run this script once to generate all intermediate frames.
 Save to: src/seamcarving_manim/assets/images/memory_carved/
 """
 
+import argparse
+import sys
 import numpy as np
 from PIL import Image
 from pathlib import Path
 import seam_carving
 
-def generate_frames():
-    # Setup paths
-    base_path = Path("src/seamcarving_manim/assets/images")
-    img_path = base_path / "memory.jpg"
-    output_dir = base_path / "memory_carved"
-    output_dir.mkdir(exist_ok=True)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from seamcarving_manim.utils.frame_sink import FrameSink  # noqa: E402
+from seamcarving_manim.utils.telemetry import Telemetry  # noqa: E402
+
+def generate_frames(jobs=4, quality=95):
+    tel = Telemetry("carve_85_percent_pregen")
+    # JPEGs are encoded on background threads while the next frame is carved
+    with FrameSink(jobs, telemetry=tel) as sink:
+        # Setup paths
+        base_path = Path("src/seamcarving_manim/assets/images")
+        img_path = base_path / "memory.jpg"
+        output_dir = base_path / "memory_carved"
+        output_dir.mkdir(exist_ok=True)
     
-    # Load original image
-    print(f"Loading image from {img_path}...")
-    img_original = np.array(Image.open(img_path).convert("RGB"), dtype=np.uint8)
-    original_h, original_w = img_original.shape[:2]
+        # Load original image
+        print(f"Loading image from {img_path}...")
+        with tel.span("load"):
+            img_original = np.array(Image.open(img_path).convert("RGB"), dtype=np.uint8)
+        original_h, original_w = img_original.shape[:2]
     
-    # Save original as frame 0
-    Image.fromarray(img_original).save(output_dir / "frame_000.jpg", quality=95)
-    print(f"Saved frame_000.jpg (original: {original_w}x{original_h})")
+        # Save original as frame 0
+        sink.save(img_original, output_dir / "frame_000.jpg", quality=quality)
+        print(f"Saved frame_000.jpg (original: {original_w}x{original_h})")
     
-    # Parameters
-    fx = 0.85  # 15% reduction
-    target_w = int(original_w * fx)
-    seams_to_remove = original_w - target_w
+        # Parameters
+        fx = 0.85  # 15% reduction
+        target_w = int(original_w * fx)
+        seams_to_remove = original_w - target_w
     
-    # Generate 60 intermediate frames
-    num_frames = 60
+        # Generate 60 intermediate frames
+        num_frames = 60
     
-    print(f"\nGenerating {num_frames} frames...")
-    print(f"Original width: {original_w}")
-    print(f"Target width: {target_w}")
-    print(f"Seams to remove: {seams_to_remove}\n")
+        print(f"\nGenerating {num_frames} frames...")
+        print(f"Original width: {original_w}")
+        print(f"Target width: {target_w}")
+        print(f"Seams to remove: {seams_to_remove}\n")
     
-    for i in range(1, num_frames + 1):
-        # Calculate target width for this frame
-        progress = i / num_frames
-        current_target_w = int(original_w - (seams_to_remove * progress))
+        for i in range(1, num_frames + 1):
+            # Calculate target width for this frame
+            progress = i / num_frames
+            current_target_w = int(original_w - (seams_to_remove * progress))
         
-        print(f"Frame {i:02d}/{num_frames}: Carving to width {current_target_w}...", end=" ")
+            print(f"Frame {i:02d}/{num_frames}: Carving to width {current_target_w}...", end=" ")
         
-        # Seam carve to target width
-        carved_img = seam_carving.resize(
-            img_original, 
-            (current_target_w, original_h),
-            energy_mode='backward',
-            order='width-first'
-        )
+            # Seam carve to target width (energy, DP and removal all happen
+            # inside seam_carving.resize, so they share one span)
+            seams = original_w - current_target_w
+            with tel.span("carve", pixels=original_h * original_w, seams=seams):
+                carved_img = seam_carving.resize(
+                    img_original, 
+                    (current_target_w, original_h),
+                    energy_mode='backward',
+                    order='width-first'
+                )
+            tel.count("seams", seams)
+            tel.count("pixels", seams * original_h * (original_w + current_target_w) // 2)
         
-        # Save frame
-        frame_filename = f"frame_{i:03d}.jpg"
-        Image.fromarray(carved_img).save(output_dir / frame_filename, quality=95)
-        print(f"✓ Saved {frame_filename}")
-    
+            # Save frame
+            frame_filename = f"frame_{i:03d}.jpg"
+            sink.save(carved_img, output_dir / frame_filename, copy=False, quality=quality)
+            print(f"✓ Queued {frame_filename}")
+
+        with tel.span("flush"):
+            sink.close()
     print(f"\n✅ Successfully generated {num_frames + 1} frames in {output_dir}")
     print(f"Total size reduction: {original_w} → {target_w} pixels ({(1-fx)*100:.0f}% reduction)")
+    tel.close()
 
 if __name__ == "__main__":
-    generate_frames()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Pregenerate the 85% carve frames")
+    parser.add_argument("--jobs", type=int, default=4, help="JPEG encoder threads (0: encode inline)")
+    parser.add_argument("--quality", type=int, default=95, help="JPEG quality (default: 95)")
+    args = parser.parse_args()
+    generate_frames(args.jobs, args.quality)
\ No newline at end of file
@@ -1,23 +1,105 @@
-import os
-from pathlib import Path
+"""
+Concatenate the rendered scenes into one video, in manifest order.
+
+Only the final movie file of each manifest scene at the chosen quality is
+used (no scanning of media/videos, so partial movie files and other
+quality variants are never picked up). All clips must share codec,
+resolution, pixel format and frame rate; they are then stream-copied in
+a single ffmpeg call.
+
+Usage (from the repo root):
+    python pregen/concat_manim_scenes.py -q h -o full_video.mp4
+"""
+
+import argparse
+import json
 import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from seamcarving_manim.manifest import QUALITIES, SCENES, find_scene, movie_path  # noqa: E402
+
+
+def probe(path: Path):
+    """Per-stream (type, codec, size, pixel format, rate) signature of a clip."""
+    out = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-show_entries", "stream=codec_type,codec_name,width,height,pix_fmt,r_frame_rate",
+            "-of", "json",
+            str(path),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    streams = json.loads(out)["streams"]
+    return tuple(
+        (
+            s.get("codec_type"),
+            s.get("codec_name"),
+            s.get("width"),
+            s.get("height"),
+            s.get("pix_fmt"),
+            s.get("r_frame_rate"),
+        )
+        for s in streams
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concatenate manifest scenes with ffmpeg stream copy")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("--media-dir", default="media", help="Manim media directory (default: media)")
+    parser.add_argument("--only", nargs="+", help="Module stems or Scene class names to include")
+    parser.add_argument("-o", "--output", default="full_video.mp4")
+    args = parser.parse_args()
+
+    media_dir = Path(args.media_dir)
+    if not media_dir.is_absolute():
+        media_dir = PROJECT_ROOT / media_dir
+
+    entries = [find_scene(n) for n in args.only] if args.only else list(SCENES)
+    clips = [movie_path(e, args.quality, media_dir) for e in entries]
+
+    missing = [c for c in clips if not c.exists()]
+    if missing:
+        sys.exit("Missing rendered scenes (run pregen/render_scenes.py first):\n  "
+                 + "\n  ".join(str(c) for c in missing))
+
+    signatures = {c: probe(c) for c in clips}
+    reference = signatures[clips[0]]
+    mismatched = [c for c in clips if signatures[c] != reference]
+    if mismatched:
+        lines = [f"{clips[0]}: {reference}"] + [f"{c}: {signatures[c]}" for c in mismatched]
+        sys.exit("Clips differ in codec/resolution/frame rate, cannot stream-copy:\n  "
+                 + "\n  ".join(lines))
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for c in clips:
+            f.write(f"file '{c.resolve().as_posix()}'\n")
+        list_path = f.name
+
+    print(f"Concatenating {len(clips)} scenes -> {args.output}")
+    try:
+        subprocess.run(
+            [
+                "ffmpeg", "-y",
+                "-f", "concat",
+                "-safe", "0",
+                "-i", list_path,
+                "-c", "copy",
+                args.output,
+            ],
+            check=True,
+        )
+    finally:
+        Path(list_path).unlink(missing_ok=True)
+
 
-root = Path("media/videos")
-
-# Find all rendered MP4s (sorted by name)
-clips = sorted(root.rglob("*.mp4"))
-
-# Make list file
-with open("concat_list.txt", "w") as f:
-    for c in clips:
-        f.write(f"file '{c.as_posix()}'\n")
-
-# Run ffmpeg
-subprocess.run([
-    "ffmpeg",
-    "-f", "concat",
-    "-safe", "0",
-    "-i", "concat_list.txt",
-    "-c", "copy",
-    "full_video.mp4"
-])
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,37 @@
-# tools/precompute_memory_edges.py
-
+# edge_on_memory_pregen.py
+#
+# Precompute the Sobel edge maps of memory.jpg in one pass:
+#   assets/images/memory_edges/memory_edge_x.png     (LIGHT_RED)
+#   assets/images/memory_edges/memory_edge_y.png     (BABY_BLUE)
+#   assets/images/memory_edges/memory_edge_mag.png   (LIME_GREEN)
+# plus the small gradient fields (gray, gx, gy, mag) s27 draws arrows and
+# blocks from, at every --grid size, as one memory-mappable pyramid
+# (see seamcarving_manim.utils.gradient_pyramid):
+#   assets/images/memory_edges/gradient_pyramid.npz
+#
+# memory.jpg is decoded once. gx, gy and the magnitude are stacked into
+# one (3, H, W) array so the blur and the max filter (which thicken the
+# strokes for display) run once over all three instead of once each.
+
+import argparse
+import sys
 from pathlib import Path
 import numpy as np
 from PIL import Image
 from scipy.ndimage import convolve, gaussian_filter, maximum_filter
 
-# -----------------------------------------
-# Resolve PROJECT ROOT (this file is at repo root)
-# -----------------------------------------
-PROJECT_ROOT = Path(__file__).resolve().parent
+# This file is at: carving-manim/pregen/edge_on_memory_pregen.py
+# So PROJECT_ROOT is the repo root: carving-manim/
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from seamcarving_manim.utils.colormap import colorize, tint_lut  # noqa: E402
+from seamcarving_manim.utils.gradient_pyramid import save_pyramid  # noqa: E402
+from seamcarving_manim.utils.telemetry import Telemetry  # noqa: E402
 
 ASSETS_DIR = PROJECT_ROOT / "src" / "seamcarving_manim" / "assets" / "images"
 SRC_PATH   = ASSETS_DIR / "memory.jpg"
-
 EDGES_DIR  = ASSETS_DIR / "memory_edges"
-EDGES_DIR.mkdir(parents=True, exist_ok=True)
-
-print("Project root:", PROJECT_ROOT)
-print("Reading from:", SRC_PATH)
-print("Saving to:", EDGES_DIR)
-
-# Load original as grayscale
-img = Image.open(SRC_PATH).convert("L")
-arr = np.array(img, dtype=float)
 
 # Sobel kernels
 KX = np.array([[-1, 0, 1],
@@ -32,86 +41,100 @@ KY = np.array([[-1, -2, -1],
                [ 0,  0,  0],
                [ 1,  2,  1]], dtype=float)
 
-# Raw gradients
-gx = convolve(arr, KX, mode="reflect")
-gy = convolve(arr, KY, mode="reflect")
-mag = np.sqrt(gx**2 + gy**2)
-
-# ---- THICKEN EDGES (blur + max filter) ----
-gx = gaussian_filter(gx, sigma=1.2)
-gy = gaussian_filter(gy, sigma=1.2)
-mag = gaussian_filter(mag, sigma=1.2)
-
-# make strokes fatter
-gx = maximum_filter(gx, size=5)
-gy = maximum_filter(gy, size=5)
-mag = maximum_filter(mag, size=5)
-
-
-def norm255(a, gamma=0.45, floor=90, clip_low=10):
-    """
-    Map gradient magnitudes to 0–255 with:
-      - hard suppression of tiny responses (clip_low)
-      - gamma < 1 to boost midtones
-      - 'floor' only applied to nonzero edges
-    Background stays pure black.
-    """
-    a_abs = np.abs(a)
-    m = np.max(a_abs)
-    if m == 0:
-        return np.zeros_like(a, dtype=np.uint8)
-
-    # normalize
-    n = a_abs / m
-
-    # suppress tiny gradient responses
-    n[n < (clip_low / 255.0)] = 0.0
-
-    # allocate output
-    out = np.zeros_like(a_abs, dtype=np.float32)
-
-    # only apply gamma + floor where there is an edge
-    mask = n > 0
-    if np.any(mask):
-        v = n[mask] ** gamma
-        v = floor + (255 - floor) * v
-        out[mask] = v
-
-    out = np.clip(out, 0, 255)
-    return out.astype(np.uint8)
-
-
-gx_n  = norm255(gx)
-gy_n  = norm255(gy)
-mag_n = norm255(mag)
+# Stroke thickening for the display PNGs
+BLUR_SIGMA = 1.2
+MAX_SIZE = 5
 
 # ======================================
 # Color palettes (pastel / bright)
 # ======================================
-
 LIGHT_RED  = np.array([255, 110, 110])   # soft light red
 BABY_BLUE  = np.array([120, 190, 255])   # baby blue
 LIME_GREEN = np.array([140, 255, 120])   # lime green
 
-# ======================================
-# Apply color on black background
-# ======================================
-
-gx_rgb  = np.zeros((*gx_n.shape, 3), dtype=np.uint8)
-gy_rgb  = np.zeros((*gy_n.shape, 3), dtype=np.uint8)
-mag_rgb = np.zeros((*mag_n.shape, 3), dtype=np.uint8)
-
-scale_gx  = gx_n.astype(np.float32) / 255.0
-scale_gy  = gy_n.astype(np.float32) / 255.0
-scale_mag = mag_n.astype(np.float32) / 255.0
-
-for c in range(3):
-    gx_rgb[..., c]  = (scale_gx  * LIGHT_RED[c]).astype(np.uint8)
-    gy_rgb[..., c]  = (scale_gy  * BABY_BLUE[c]).astype(np.uint8)
-    mag_rgb[..., c] = (scale_mag * LIME_GREEN[c]).astype(np.uint8)
-
-Image.fromarray(gx_rgb).save(EDGES_DIR / "memory_edge_x.png")
-Image.fromarray(gy_rgb).save(EDGES_DIR / "memory_edge_y.png")
-Image.fromarray(mag_rgb).save(EDGES_DIR / "memory_edge_mag.png")
-
-print("Saved edge maps to:", EDGES_DIR)
+# norm255 (clip tiny responses, gamma 0.45 to boost midtones, floor 90
+# on nonzero edges) and the tint, baked into one lookup table per color
+EDGE_STYLE = dict(levels=65536, gamma=0.45, floor=90, clip_low=10)
+
+OUTPUTS = [  # (channel in the gradient stack, file, color)
+    (0, "memory_edge_x.png", LIGHT_RED),
+    (1, "memory_edge_y.png", BABY_BLUE),
+    (2, "memory_edge_mag.png", LIME_GREEN),
+]
+
+# (columns, rows) of the small fields, all ~16:9 like memory.jpg's display
+DEFAULT_GRIDS = [(18, 10), (36, 20), (48, 27), (72, 40), (96, 54)]
+
+
+def sobel_stack(gray):
+    """(3, H, W) stack of gx, gy and the gradient magnitude."""
+    grads = np.empty((3, *gray.shape), dtype=float)
+    convolve(gray, KX, output=grads[0], mode="reflect")
+    convolve(gray, KY, output=grads[1], mode="reflect")
+    np.hypot(grads[0], grads[1], out=grads[2])
+    return grads
+
+
+def thicken(grads):
+    """Blur + max filter every channel in one call each (nothing runs across channels)."""
+    blurred = gaussian_filter(grads, sigma=(0, BLUR_SIGMA, BLUR_SIGMA))
+    return maximum_filter(blurred, size=(1, MAX_SIZE, MAX_SIZE), output=grads)
+
+
+def small_field(img, cols, rows):
+    """gray, gx, gy, mag of the image resized to a cols x rows grid (no thickening)."""
+    small = np.array(img.resize((cols, rows), Image.BICUBIC), dtype=float)
+    gx, gy, mag = sobel_stack(small)
+    return {"gray": small, "gx": gx, "gy": gy, "mag": mag}
+
+
+def parse_grid(text):
+    cols, rows = text.lower().split("x")
+    return int(cols), int(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute the memory.jpg edge maps and gradient fields")
+    parser.add_argument("--grid", nargs="+", type=parse_grid, default=DEFAULT_GRIDS, metavar="COLSxROWS",
+                        help="Small gradient field sizes in the pyramid (default: 18x10 36x20 48x27 72x40 96x54)")
+    parser.add_argument("--output", type=Path, default=EDGES_DIR, help="Output directory")
+    parser.add_argument("--trace", help="Write per-stage timing spans to this JSONL file")
+    args = parser.parse_args()
+    tel = Telemetry("edge_on_memory_pregen", trace=args.trace)
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    print("Project root:", PROJECT_ROOT)
+    print("Reading from:", SRC_PATH)
+    print("Saving to:", args.output)
+
+    with tel.span("load"):
+        img = Image.open(SRC_PATH).convert("L")
+        gray = np.array(img, dtype=float)
+    pixels = gray.size
+
+    # ---- full-res display maps ----
+    with tel.span("gradients", pixels=pixels):
+        grads = sobel_stack(gray)
+    with tel.span("thicken", pixels=3 * pixels):
+        grads = thicken(grads)
+    for channel, name, color in OUTPUTS:
+        with tel.span("colorize", pixels=pixels, file=name):
+            rgb = colorize(grads[channel], tint_lut(color, **EDGE_STYLE), absolute=True)
+        tel.save_image(rgb, args.output / name)
+    del grads
+    print("Saved full-res edge maps")
+
+    # ---- small gradient fields for arrows / blocks ----
+    levels = {}
+    for cols, rows in args.grid:
+        with tel.span("grid", pixels=cols * rows, grid=f"{cols}x{rows}"):
+            levels[(cols, rows)] = small_field(img, cols, rows)
+    with tel.span("write"):
+        save_pyramid(args.output / "gradient_pyramid.npz", levels)
+    print("Saved gradient fields:", ", ".join(f"{c}x{r}" for c, r in sorted(levels)))
+
+    tel.close()
+
+
+if __name__ == "__main__":
+    main()
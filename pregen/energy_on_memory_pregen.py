@@ -1,5 +1,6 @@
 # tools/precompute_memory_min_energy_bottom.py
 
+import sys
 from pathlib import Path
 import numpy as np
 from PIL import Image
@@ -16,6 +17,12 @@ SRC_PATH = ASSETS_DIR / "memory.jpg"
 MIN_EN_DIR = ASSETS_DIR / "min_energy_bottom"
 MIN_EN_DIR.mkdir(parents=True, exist_ok=True)
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from seamcarving_manim.utils.colormap import colorize, scale_lut  # noqa: E402
+from seamcarving_manim.utils.telemetry import Telemetry  # noqa: E402
+
+tel = Telemetry("energy_on_memory_pregen")
+
 print("Project root:", PROJECT_ROOT)
 print("Reading from:", SRC_PATH)
 print("Saving to:", MIN_EN_DIR)
@@ -25,8 +32,9 @@ print("Saving to:", MIN_EN_DIR)
 #    brightness(c) = 0.3 R + 0.59 G + 0.11 B
 #    (same as the Julia notebook)
 # -------------------------------------------------
-img_rgb = Image.open(SRC_PATH).convert("RGB")
-rgb = np.asarray(img_rgb, dtype=np.float32) / 255.0
+with tel.span("load"):
+    img_rgb = Image.open(SRC_PATH).convert("RGB")
+    rgb = np.asarray(img_rgb, dtype=np.float32) / 255.0
 
 R = rgb[..., 0]
 G = rgb[..., 1]
@@ -54,11 +62,12 @@ Sy = np.array(
 )
 
 # Convolve with clamp-style boundaries (nearest ≈ Julia's clamping)
-gx = convolve(brightness, Sx, mode="nearest")
-gy = convolve(brightness, Sy, mode="nearest")
+with tel.span("energy", pixels=H * W):
+    gx = convolve(brightness, Sx, mode="nearest")
+    gy = convolve(brightness, Sy, mode="nearest")
 
-# Edginess = gradient magnitude
-energy = np.sqrt(gx**2 + gy**2)  # this is E in the Julia code
+    # Edginess = gradient magnitude
+    energy = np.sqrt(gx**2 + gy**2)  # this is E in the Julia code
 
 # -------------------------------------------------
 # 3) Dynamic programming: least_edgy(E)
@@ -70,12 +79,13 @@ least_E = np.zeros_like(energy, dtype=np.float32)
 least_E[-1, :] = energy[-1, :]
 
 # Fill from bottom-2 up to top
-for i in range(H - 2, -1, -1):
-    for j in range(W):
-        j1 = max(0, j - 1)
-        j2 = min(W - 1, j + 1)
-        e_min = np.min(least_E[i + 1, j1 : j2 + 1])
-        least_E[i, j] = energy[i, j] + e_min
+with tel.span("dp", pixels=H * W):
+    for i in range(H - 2, -1, -1):
+        for j in range(W):
+            j1 = max(0, j - 1)
+            j2 = min(W - 1, j + 1)
+            e_min = np.min(least_E[i + 1, j1 : j2 + 1])
+            least_E[i, j] = energy[i, j] + e_min
 
 # -------------------------------------------------
 # 4) Color mapping: like show_colored_array(least_E),
@@ -87,17 +97,17 @@ for i in range(H - 2, -1, -1):
 #
 #    Here:
 #      pos_color = ORANGE (255, 165, 0) in 0–255 space
-#      We normalize least_E to [0,1] and multiply by ORANGE.
+#      We normalize least_E to [0,1] and multiply by ORANGE
+#      (as a lookup table that matches the float product exactly,
+#      brighter = more accumulated energy).
 # -------------------------------------------------
-max_val = float(np.max(least_E)) or 1.0
-norm = least_E / max_val  # 0..1, brighter = more accumulated energy
-
 ORANGE = np.array([255.0, 165.0, 0.0], dtype=np.float32)
 
-out_rgb = (norm[..., None] * ORANGE[None, None, :]).astype(np.uint8)
+with tel.span("colorize", pixels=H * W):
+    out_rgb = colorize(least_E, scale_lut(ORANGE))
 
-out_img = Image.fromarray(out_rgb)
 out_path = MIN_EN_DIR / "memory_min_energy_bottom.png"
-out_img.save(out_path)
+tel.save_image(out_rgb, out_path)
 
 print("Saved min-energy-to-bottom map to:", out_path)
+tel.close()
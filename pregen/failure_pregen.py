@@ -16,6 +16,19 @@ from PIL import Image
 from pathlib import Path
 from scipy.ndimage import convolve
 import argparse
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from seamcarving_manim.utils.colormap import colorize, ramp_lut  # noqa: E402
+from seamcarving_manim.utils.frame_pack import PackedFrames  # noqa: E402
+from seamcarving_manim.utils.frame_sequence import open_writer  # noqa: E402
+from seamcarving_manim.utils.frame_sink import FrameSink  # noqa: E402
+from seamcarving_manim.utils.telemetry import NullTelemetry, Telemetry  # noqa: E402
+
+# energy_map.png: low energy blue, high energy yellow
+ENERGY_LUT = ramp_lut((0, 0, 255), (255, 255, 0))
 
 
 def compute_energy(img_array: np.ndarray) -> np.ndarray:
@@ -201,19 +214,24 @@ def strategy_optimal_global(img: np.ndarray, num_pixels: int) -> np.ndarray:
     return result.astype(np.uint8)
 
 
-def strategy_seam(img: np.ndarray, num_seams: int, return_seam_overlay: bool = False) -> np.ndarray:
+def strategy_seam(img: np.ndarray, num_seams: int, return_seam_overlay: bool = False,
+                  telemetry: Telemetry = None) -> np.ndarray:
     """
     Strategy: Proper seam carving - the good approach.
     Optionally returns an overlay showing the seams.
     """
+    tel = telemetry or NullTelemetry()
     result = img.copy()
     
     if return_seam_overlay:
         overlay = img.copy()
         
     for i in range(num_seams):
-        energy = compute_energy(result)
-        seam = find_vertical_seam(energy)
+        pixels = result.shape[0] * result.shape[1]
+        with tel.span("energy", pixels=pixels):
+            energy = compute_energy(result)
+        with tel.span("dp", pixels=pixels):   # DP + backtrack
+            seam = find_vertical_seam(energy)
         
         if return_seam_overlay and i < 50:  # Show first 50 seams
             # Draw seam on overlay
@@ -224,7 +242,10 @@ def strategy_seam(img: np.ndarray, num_seams: int, return_seam_overlay: bool = F
                     else:
                         overlay[row, col] = 255
         
-        result = remove_vertical_seam(result, seam)
+        with tel.span("remove", pixels=pixels):
+            result = remove_vertical_seam(result, seam)
+        tel.count("seams")
+        tel.count("pixels", pixels)
     
     if return_seam_overlay:
         return result, overlay
@@ -254,181 +275,194 @@ def main():
     parser.add_argument("--reduction-percent", type=float, default=15.0, help="Percentage to reduce width by (default: 15%%)")
     parser.add_argument("--frames", type=int, default=50, help="Number of intermediate frames")
     parser.add_argument("--force", action="store_true", help="Force recompute even if files exist")
+    parser.add_argument("--format", choices=["pack", "png"], default="pack",
+                        help="pack: one <strategy>.frames file per strategy (default); png: <strategy>/frame_*.png")
+    parser.add_argument("--jobs", type=int, default=4, help="PNG encoder threads (0: encode inline)")
+    parser.add_argument("--png-level", type=int, default=1, choices=range(10), metavar="0-9",
+                        help="zlib level for frame PNGs with --format png (default: 1, fast)")
+    parser.add_argument("--final-png-level", type=int, default=9, choices=range(10), metavar="0-9",
+                        help="zlib level for original/energy/final_*.png (default: 9, smallest)")
+    parser.add_argument("--trace", help="Write per-stage timing spans to this JSONL file")
     args = parser.parse_args()
-    
-    # Load image
-    img_path = Path(args.input)
-    if not img_path.exists():
-        raise FileNotFoundError(f"Input image not found: {img_path}")
-    
-    img = np.array(Image.open(img_path).convert("RGB"), dtype=np.uint8)
-    original_width = img.shape[1]
-    original_height = img.shape[0]
-    print(f"Loaded image: {img.shape}")
-    
-    # Calculate reduction based on percentage
-    reduction = int(original_width * args.reduction_percent / 100.0)
-    print(f"Reducing width by {args.reduction_percent}% = {reduction} pixels (from {original_width} to {original_width - reduction})")
-    
-    # Create output directory
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create subdirectories for each strategy (no crop)
-    strategies = ['column', 'pixel', 'optimal', 'seam']
-    for strategy in strategies:
-        (output_dir / strategy).mkdir(exist_ok=True)
-    
-    # Helper to check if all frames exist
-    def frames_exist(subdir, num_frames):
-        for i in range(num_frames):
-            if not (output_dir / subdir / f"frame_{i:04d}.png").exists():
-                return False
-        return True
-    
-    num_frames = args.frames
-    
-    # Also save original and energy map (if not exist)
-    if not (output_dir / "original.png").exists() or args.force:
-        print("Saving original...")
-        Image.fromarray(img).save(output_dir / "original.png")
-    else:
-        print("Skipping original (already exists)")
-    
-    if not (output_dir / "energy_map.png").exists() or args.force:
-        print("Saving energy map...")
-        energy = compute_energy(img)
-        energy_normalized = (energy / energy.max() * 255).astype(np.uint8)
-        # Create colored energy map (blue-yellow gradient)
-        energy_colored = np.zeros((*energy.shape, 3), dtype=np.uint8)
-        energy_colored[:, :, 0] = energy_normalized  # Red channel
-        energy_colored[:, :, 1] = energy_normalized  # Green channel  
-        energy_colored[:, :, 2] = (255 - energy_normalized)  # Blue channel (inverted)
-        Image.fromarray(energy_colored).save(output_dir / "energy_map.png")
-    else:
-        print("Skipping energy map (already exists)")
-    
-    print(f"Generating {num_frames} frames, reducing width by {reduction} pixels ({args.reduction_percent}%)")
-    
-    # Generate frames for each strategy
-    steps = np.linspace(1, reduction, num_frames, dtype=int)
-    
-    # 1. COLUMN - remove columns iteratively
-    if not frames_exist("column", num_frames) or args.force:
-        print("Generating COLUMN frames...")
-        result_column = img.copy()
-        
-        for i, step in enumerate(steps):
-            frame_path = output_dir / "column" / f"frame_{i:04d}.png"
-            if frame_path.exists() and not args.force:
-                # Load existing result to continue from
-                if i == len(steps) - 1 or not (output_dir / "column" / f"frame_{i+1:04d}.png").exists():
-                    # Need to reconstruct state - just recompute from here
-                    pass
-                continue
-                
-            target_removed = step
-            current_removed = original_width - result_column.shape[1]
-            to_remove = target_removed - current_removed
-            
-            if to_remove > 0:
-                result_column = strategy_column(result_column, to_remove)
+    tel = Telemetry("failure_pregen", trace=args.trace)
+    # On an error the queued images are dropped instead of written
+    with FrameSink(args.jobs, telemetry=tel) as sink:
+        png = dict(sink=sink, compress_level=args.png_level) if args.format == "png" else {}
+        still = dict(compress_level=args.final_png_level)
+    
+        # Load image
+        img_path = Path(args.input)
+        if not img_path.exists():
+            raise FileNotFoundError(f"Input image not found: {img_path}")
+    
+        with tel.span("load"):
+            img = np.array(Image.open(img_path).convert("RGB"), dtype=np.uint8)
+        original_width = img.shape[1]
+        original_height = img.shape[0]
+        print(f"Loaded image: {img.shape}")
+    
+        # Calculate reduction based on percentage
+        reduction = int(original_width * args.reduction_percent / 100.0)
+        print(f"Reducing width by {args.reduction_percent}% = {reduction} pixels (from {original_width} to {original_width - reduction})")
+    
+        # Create output directory
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+    
+        # Helper to check if all frames exist
+        def frames_exist(subdir, num_frames):
+            if args.format == "pack":
+                pack = output_dir / f"{subdir}.frames"
+                try:
+                    return len(PackedFrames(pack)) == num_frames
+                except (OSError, ValueError):   # missing, or left unreadable by an older interrupted run
+                    return False
+            for i in range(num_frames):
+                if not (output_dir / subdir / f"frame_{i:04d}.png").exists():
+                    return False
+            return True
+    
+        num_frames = args.frames
+    
+        # Also save original and energy map (if not exist)
+        if args.force or not (output_dir / "original.png").exists():
+            print("Saving original...")
+            sink.save(img, output_dir / "original.png", **still)
+        else:
+            print("Skipping original (already exists)")
+    
+        if args.force or not (output_dir / "energy_map.png").exists():
+            print("Saving energy map...")
+            with tel.span("energy", pixels=img.shape[0] * img.shape[1]):
+                energy = compute_energy(img)
+            # Colored energy map (blue-yellow gradient)
+            energy_colored = colorize(energy, ENERGY_LUT)
+            sink.save(energy_colored, output_dir / "energy_map.png", **still)
+        else:
+            print("Skipping energy map (already exists)")
+    
+        print(f"Generating {num_frames} frames, reducing width by {reduction} pixels ({args.reduction_percent}%)")
+    
+        # Generate frames for each strategy
+        steps = np.linspace(1, reduction, num_frames, dtype=int)
+    
+        # 1. COLUMN - remove columns iteratively
+        if args.force or not frames_exist("column", num_frames):
+            print("Generating COLUMN frames...")
+            result_column = img.copy()
+            with open_writer(output_dir / "column", args.format, original_height, original_width, **png) as out:
+                for i, step in enumerate(steps):
+                    target_removed = step
+                    current_removed = original_width - result_column.shape[1]
+                    to_remove = target_removed - current_removed
             
-            padded = pad_to_width(result_column, original_width)
-            Image.fromarray(padded).save(frame_path)
+                    if to_remove > 0:
+                        with tel.span("strategy_column"):
+                            result_column = strategy_column(result_column, to_remove)
             
-            if (i + 1) % 10 == 0:
-                print(f"  Column frame {i+1}/{num_frames}")
-    else:
-        print("Skipping COLUMN frames (already exist)")
-    
-    # 2. PIXEL - remove lowest energy pixel per row
-    if not frames_exist("pixel", num_frames) or args.force:
-        print("Generating PIXEL frames...")
-        for i, step in enumerate(steps):
-            frame_path = output_dir / "pixel" / f"frame_{i:04d}.png"
-            if frame_path.exists() and not args.force:
-                continue
-                
-            result_pixel = strategy_pixel_per_row(img, step)
-            padded = pad_to_width(result_pixel, original_width)
-            Image.fromarray(padded).save(frame_path)
+                    padded = pad_to_width(result_column, original_width)
+                    with tel.span("emit", format=args.format):
+                        out.append(padded)
             
-            if (i + 1) % 10 == 0:
-                print(f"  Pixel frame {i+1}/{num_frames}")
-    else:
-        print("Skipping PIXEL frames (already exist)")
-    
-    # 3. OPTIMAL - global removal (show destruction)
-    if not frames_exist("optimal", num_frames) or args.force:
-        print("Generating OPTIMAL (global) frames...")
-        for i, step in enumerate(steps):
-            frame_path = output_dir / "optimal" / f"frame_{i:04d}.png"
-            if frame_path.exists() and not args.force:
-                continue
-            
-            # Scale the number of pixels to remove to match the visual effect
-            # We remove more pixels to make the effect visible since they're scattered
-            pixels_to_remove = step * original_height  # Remove proportionally more
-            result_optimal = strategy_optimal_global(img, pixels_to_remove)
-            Image.fromarray(result_optimal).save(frame_path)
+                    if (i + 1) % 10 == 0:
+                        print(f"  Column frame {i+1}/{num_frames}")
+                with tel.span("flush", format=args.format):
+                    out.close()
+        else:
+            print("Skipping COLUMN frames (already exist)")
+    
+        # 2. PIXEL - remove lowest energy pixel per row
+        if args.force or not frames_exist("pixel", num_frames):
+            print("Generating PIXEL frames...")
+            with open_writer(output_dir / "pixel", args.format, original_height, original_width, **png) as out:
+                for i, step in enumerate(steps):
+                    with tel.span("strategy_pixel", pixels=img.shape[0] * img.shape[1]):
+                        result_pixel = strategy_pixel_per_row(img, step)
+                    padded = pad_to_width(result_pixel, original_width)
+                    with tel.span("emit", format=args.format):
+                        out.append(padded)
             
-            if (i + 1) % 10 == 0:
-                print(f"  Optimal frame {i+1}/{num_frames}")
-    else:
-        print("Skipping OPTIMAL frames (already exist)")
-    
-    # 4. SEAM - proper seam carving
-    if not frames_exist("seam", num_frames) or args.force:
-        print("Generating SEAM frames...")
-        result_seam = img.copy()
-        
-        for i, step in enumerate(steps):
-            frame_path = output_dir / "seam" / f"frame_{i:04d}.png"
-            if frame_path.exists() and not args.force:
-                # Need to maintain state - load the frame and figure out current width
-                # For simplicity, just continue computing
-                pass
+                    if (i + 1) % 10 == 0:
+                        print(f"  Pixel frame {i+1}/{num_frames}")
+                with tel.span("flush", format=args.format):
+                    out.close()
+        else:
+            print("Skipping PIXEL frames (already exist)")
+    
+        # 3. OPTIMAL - global removal (show destruction)
+        if args.force or not frames_exist("optimal", num_frames):
+            print("Generating OPTIMAL (global) frames...")
+            with open_writer(output_dir / "optimal", args.format, original_height, original_width, **png) as out:
+                for i, step in enumerate(steps):
+                    # Scale the number of pixels to remove to match the visual effect
+                    # We remove more pixels to make the effect visible since they're scattered
+                    pixels_to_remove = step * original_height  # Remove proportionally more
+                    with tel.span("strategy_optimal", pixels=img.shape[0] * img.shape[1]):
+                        result_optimal = strategy_optimal_global(img, pixels_to_remove)
+                    with tel.span("emit", format=args.format):
+                        out.append(result_optimal)
             
-            target_removed = step
-            current_removed = original_width - result_seam.shape[1]
-            to_remove = target_removed - current_removed
+                    if (i + 1) % 10 == 0:
+                        print(f"  Optimal frame {i+1}/{num_frames}")
+                with tel.span("flush", format=args.format):
+                    out.close()
+        else:
+            print("Skipping OPTIMAL frames (already exist)")
+    
+        # 4. SEAM - proper seam carving
+        if args.force or not frames_exist("seam", num_frames):
+            print("Generating SEAM frames...")
+            result_seam = img.copy()
+            with open_writer(output_dir / "seam", args.format, original_height, original_width, **png) as out:
+                for i, step in enumerate(steps):
+                    target_removed = step
+                    current_removed = original_width - result_seam.shape[1]
+                    to_remove = target_removed - current_removed
             
-            if to_remove > 0:
-                result_seam = strategy_seam(result_seam, to_remove)
+                    if to_remove > 0:
+                        result_seam = strategy_seam(result_seam, to_remove, telemetry=tel)
             
-            padded = pad_to_width(result_seam, original_width)
-            Image.fromarray(padded).save(frame_path)
+                    padded = pad_to_width(result_seam, original_width)
+                    with tel.span("emit", format=args.format):
+                        out.append(padded)
             
-            if (i + 1) % 10 == 0:
-                print(f"  Seam frame {i+1}/{num_frames}")
-    else:
-        print("Skipping SEAM frames (already exist)")
-    
-    # Save final comparison images
-    print("Checking final comparison images...")
-    
-    if not (output_dir / "final_column.png").exists() or args.force:
-        print("  Computing final_column...")
-        final_column = strategy_column(img.copy(), reduction)
-        Image.fromarray(pad_to_width(final_column, original_width)).save(output_dir / "final_column.png")
-    
-    if not (output_dir / "final_pixel.png").exists() or args.force:
-        print("  Computing final_pixel...")
-        final_pixel = strategy_pixel_per_row(img, reduction)
-        Image.fromarray(pad_to_width(final_pixel, original_width)).save(output_dir / "final_pixel.png")
-    
-    if not (output_dir / "final_optimal.png").exists() or args.force:
-        print("  Computing final_optimal...")
-        final_optimal = strategy_optimal_global(img, reduction * original_height)
-        Image.fromarray(final_optimal).save(output_dir / "final_optimal.png")
-    
-    if not (output_dir / "final_seam.png").exists() or args.force:
-        print("  Computing final_seam...")
-        final_seam = strategy_seam(img.copy(), reduction)
-        Image.fromarray(pad_to_width(final_seam, original_width)).save(output_dir / "final_seam.png")
-    
+                    if (i + 1) % 10 == 0:
+                        print(f"  Seam frame {i+1}/{num_frames}")
+                with tel.span("flush", format=args.format):
+                    out.close()
+        else:
+            print("Skipping SEAM frames (already exist)")
+    
+        # Save final comparison images
+        print("Checking final comparison images...")
+    
+        if args.force or not (output_dir / "final_column.png").exists():
+            print("  Computing final_column...")
+            with tel.span("strategy_column"):
+                final_column = strategy_column(img.copy(), reduction)
+            sink.save(pad_to_width(final_column, original_width), output_dir / "final_column.png", **still)
+    
+        if args.force or not (output_dir / "final_pixel.png").exists():
+            print("  Computing final_pixel...")
+            with tel.span("strategy_pixel", pixels=img.shape[0] * img.shape[1]):
+                final_pixel = strategy_pixel_per_row(img, reduction)
+            sink.save(pad_to_width(final_pixel, original_width), output_dir / "final_pixel.png", **still)
+    
+        if args.force or not (output_dir / "final_optimal.png").exists():
+            print("  Computing final_optimal...")
+            with tel.span("strategy_optimal", pixels=img.shape[0] * img.shape[1]):
+                final_optimal = strategy_optimal_global(img, reduction * original_height)
+            sink.save(final_optimal, output_dir / "final_optimal.png", **still)
+    
+        if args.force or not (output_dir / "final_seam.png").exists():
+            print("  Computing final_seam...")
+            final_seam = strategy_seam(img.copy(), reduction, telemetry=tel)
+            sink.save(pad_to_width(final_seam, original_width), output_dir / "final_seam.png", **still)
+    
+        with tel.span("flush"):
+            sink.close()
     print(f"Done! Output saved to {output_dir}")
+    tel.close()
 
 
 if __name__ == "__main__":
@@ -6,11 +6,21 @@
 #   - memory.jpg          (original painting)
 #   - memory_min_energy_bottom.png (orange DP map)
 #
-# For each seam removal, we save:
+# For each seam removal we store one frame per view, with the seam
+# painted in MAGENTA on both. By default each view is stored as a
+# delta-encoded container (see seamcarving_manim.utils.frame_pack): the
+# uncarved image plus the journal of seams in original coordinates, from
+# which the scene rebuilds every frame on demand:
+#   assets/images/memory_dual/orig.frames
+#   assets/images/memory_dual/dp.frames
+# --format pack stores every frame in full in the same files instead, and
+# --format png writes the old per-frame files:
 #   assets/images/memory_dual/orig/frame_0000.png
 #   assets/images/memory_dual/dp/frame_0000.png
-# with the seam painted in MAGENTA on both.
 
+import argparse
+import contextlib
+import sys
 from pathlib import Path
 import numpy as np
 from PIL import Image
@@ -22,9 +32,15 @@ from scipy.ndimage import convolve, gaussian_filter, maximum_filter
 PCT_REDUCTION = 0.15  # remove 15% of columns
 MAGENTA = np.array([255, 0, 255], dtype=np.uint8)
 
-# This file is at: carving-manim/purple_seam_pregen.py
+# This file is at: carving-manim/pregen/purple_seam_pregen.py
 # So PROJECT_ROOT is the repo root: carving-manim/
-PROJECT_ROOT = Path(__file__).resolve().parent
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from seamcarving_manim.utils.frame_pack import SeamJournalWriter  # noqa: E402
+from seamcarving_manim.utils.frame_sequence import open_writer  # noqa: E402
+from seamcarving_manim.utils.frame_sink import FrameSink  # noqa: E402
+from seamcarving_manim.utils.telemetry import Telemetry  # noqa: E402
 
 ASSETS_DIR = PROJECT_ROOT / "src" / "seamcarving_manim" / "assets" / "images"
 
@@ -33,12 +49,6 @@ DP_PATH   = ASSETS_DIR / "min_energy_bottom" / "memory_min_energy_bottom.png"
 
 OUT_ORIG_DIR = ASSETS_DIR / "memory_dual" / "orig"
 OUT_DP_DIR   = ASSETS_DIR / "memory_dual" / "dp"
-OUT_ORIG_DIR.mkdir(parents=True, exist_ok=True)
-OUT_DP_DIR.mkdir(parents=True, exist_ok=True)
-
-print("Project root:", PROJECT_ROOT)
-print("Original image :", ORIG_PATH)
-print("DP map image   :", DP_PATH)
 
 # ==========================================================
 # Sobel + DP utilities
@@ -106,58 +116,125 @@ def remove_seam(arr, seam):
     return out
 
 
-# ==========================================================
-# LOAD INPUTS
-# ==========================================================
-orig = np.array(Image.open(ORIG_PATH).convert("RGB"), dtype=np.uint8)
-dp_img = np.array(Image.open(DP_PATH).convert("RGB"), dtype=np.uint8)
-
-if orig.shape[:2] != dp_img.shape[:2]:
-    raise ValueError(f"Original and DP map must have same HxW; got {orig.shape[:2]} vs {dp_img.shape[:2]}")
-
-H, W, _ = orig.shape
-
-# Energy used to pick seams comes ONLY from the original
-gray_orig = np.mean(orig, axis=2) / 255.0
-E_orig = sobel_edgeness(gray_orig)
-
-# How many seams to remove
-N = int(W * PCT_REDUCTION)
-print(f"Width = {W}, removing {N} seams (~{PCT_REDUCTION*100:.1f}%)")
-
-# ==========================================================
-# GENERATE FRAMES WITH SHARED SEAMS
-# ==========================================================
-cur_orig = orig.copy()
-cur_dp   = dp_img.copy()
-cur_E    = E_orig.copy()
-
-for k in range(N):
-    print(f"Seam {k+1}/{N}")
-
-    # DP on ORIGINAL energy only
-    dp = compute_dp_energy(cur_E)
-    seam = find_min_energy_seam(dp)
-
-    # Visual copies with magenta seam
-    o_vis = cur_orig.copy()
-    d_vis = cur_dp.copy()
-    for (i, j) in seam:
-        if 0 <= j < o_vis.shape[1]:
-            o_vis[i, j] = MAGENTA
-            d_vis[i, j] = MAGENTA
-
-    # Save frames (PNG)
-    Image.fromarray(o_vis).save(OUT_ORIG_DIR / f"frame_{k:04d}.png")
-    Image.fromarray(d_vis).save(OUT_DP_DIR   / f"frame_{k:04d}.png")
-
-    # Remove the seam from both images
-    cur_orig = remove_seam(cur_orig, seam)
-    cur_dp   = remove_seam(cur_dp,   seam)
-
-    # Remove the seam from energy (2D -> add dummy channel)
-    cur_E = remove_seam(cur_E[..., None], seam)[..., 0]
-
-print("Done. Frames written to:")
-print("  ", OUT_ORIG_DIR)
-print("  ", OUT_DP_DIR)
+def main():
+    parser = argparse.ArgumentParser(description="Precompute shared seams for the dual seam demo")
+    parser.add_argument("--format", choices=["seams", "pack", "png"], default="seams",
+                        help="seams: keyframe + seam journal per view (default); "
+                             "pack: every frame in a .frames file; png: one file per frame")
+    parser.add_argument("--jobs", type=int, default=4, help="PNG encoder threads for --format png (0: encode inline)")
+    parser.add_argument("--png-level", type=int, default=1, choices=range(10), metavar="0-9",
+                        help="zlib level for --format png (default: 1, fast)")
+    parser.add_argument("--trace", help="Write per-stage timing spans to this JSONL file")
+    args = parser.parse_args()
+    tel = Telemetry("purple_seam_pregen", trace=args.trace)
+
+    print("Project root:", PROJECT_ROOT)
+    print("Original image :", ORIG_PATH)
+    print("DP map image   :", DP_PATH)
+
+    # ==========================================================
+    # LOAD INPUTS
+    # ==========================================================
+    with tel.span("load"):
+        orig = np.array(Image.open(ORIG_PATH).convert("RGB"), dtype=np.uint8)
+        dp_img = np.array(Image.open(DP_PATH).convert("RGB"), dtype=np.uint8)
+
+    if orig.shape[:2] != dp_img.shape[:2]:
+        raise ValueError(f"Original and DP map must have same HxW; got {orig.shape[:2]} vs {dp_img.shape[:2]}")
+
+    H, W, _ = orig.shape
+
+    # Energy used to pick seams comes ONLY from the original
+    with tel.span("energy", pixels=H * W):
+        gray_orig = np.mean(orig, axis=2) / 255.0
+        E_orig = sobel_edgeness(gray_orig)
+
+    # How many seams to remove
+    N = int(W * PCT_REDUCTION)
+    print(f"Width = {W}, removing {N} seams (~{PCT_REDUCTION*100:.1f}%)")
+
+    journal = args.format == "seams"
+    # On an error the writers drop their .tmp files and the sink its queue
+    with contextlib.ExitStack() as stack:
+        sink = stack.enter_context(FrameSink(args.jobs, telemetry=tel))
+        if journal:
+            out_orig = stack.enter_context(SeamJournalWriter(OUT_ORIG_DIR.with_suffix(".frames"), orig, marker=MAGENTA))
+            out_dp   = stack.enter_context(SeamJournalWriter(OUT_DP_DIR.with_suffix(".frames"), dp_img, marker=MAGENTA))
+        else:
+            png = dict(sink=sink, compress_level=args.png_level) if args.format == "png" else {}
+            out_orig = stack.enter_context(open_writer(OUT_ORIG_DIR, args.format, H, W, **png))
+            out_dp   = stack.enter_context(open_writer(OUT_DP_DIR, args.format, H, W, **png))
+            # Only the full-frame formats carve the images themselves
+            cur_orig = orig.copy()
+            cur_dp   = dp_img.copy()
+
+        # ==========================================================
+        # GENERATE FRAMES WITH SHARED SEAMS
+        # ==========================================================
+        cur_E = E_orig.copy()
+
+        # index_map[i, j] = original column of the pixel currently at (i, j)
+        rows = np.arange(H)
+        index_map = np.tile(np.arange(W), (H, 1))
+
+        for k in range(N):
+            tel.progress("Seam", k, N)
+            pixels = cur_E.size
+
+            # DP on ORIGINAL energy only
+            with tel.span("dp", pixels=pixels):
+                dp = compute_dp_energy(cur_E)
+            with tel.span("backtrack"):
+                seam = find_min_energy_seam(dp)
+
+            if journal:
+                # Only the seam is stored, in original coordinates
+                with tel.span("emit", format=args.format):
+                    cols = np.array([j for _, j in seam])
+                    out_orig.append(index_map[rows, cols])
+                    out_dp.append(index_map[rows, cols])
+                with tel.span("remove", pixels=pixels):
+                    index_map = remove_seam(index_map[..., None], seam)[..., 0]
+            else:
+                # Visual copies with magenta seam
+                o_vis = cur_orig.copy()
+                d_vis = cur_dp.copy()
+                for (i, j) in seam:
+                    if 0 <= j < o_vis.shape[1]:
+                        o_vis[i, j] = MAGENTA
+                        d_vis[i, j] = MAGENTA
+
+                # pack: written here; png: queued for the encoder threads
+                with tel.span("emit", pixels=2 * pixels, format=args.format):
+                    out_orig.append(o_vis)
+                    out_dp.append(d_vis)
+
+                # Remove the seam from both images
+                with tel.span("remove", pixels=2 * pixels):
+                    cur_orig = remove_seam(cur_orig, seam)
+                    cur_dp   = remove_seam(cur_dp,   seam)
+
+            # Remove the seam from energy (2D -> add dummy channel)
+            with tel.span("remove", pixels=pixels):
+                cur_E = remove_seam(cur_E[..., None], seam)[..., 0]
+            tel.count("seams")
+            tel.count("pixels", pixels)
+        tel.progress("Seam", N, N)
+
+        with tel.span("flush", format=args.format):
+            out_orig.close()
+            out_dp.close()
+            sink.close()
+
+    print("Done. Frames written to:")
+    if args.format == "png":
+        print("  ", OUT_ORIG_DIR)
+        print("  ", OUT_DP_DIR)
+    else:
+        print("  ", OUT_ORIG_DIR.with_suffix(".frames"))
+        print("  ", OUT_DP_DIR.with_suffix(".frames"))
+    tel.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Render every scene in the manifest, several at a time.
+
+Each scene is rendered by its own `manim render` worker process. The
+number of concurrent workers is capped by CPU count and by available RAM
+(using the per-scene `mem_gb` estimate from the manifest). A scene is
+skipped when its source file, the shared package modules (style, utils)
+and the assets it consumes are unchanged since its last successful
+render at the same quality.
+
+Usage (from the repo root):
+    python pregen/render_scenes.py -q h
+    python pregen/render_scenes.py -q l --only s30_dynamic_programming
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from seamcarving_manim.manifest import (  # noqa: E402
+    QUALITIES,
+    SCENES,
+    find_scene,
+    movie_path,
+    shared_sources,
+)
+
+CACHE_NAME = ".render_cache.json"
+
+
+# ==========================================================
+# Change detection
+# ==========================================================
+def _hash_file(h, path: Path):
+    h.update(str(path.relative_to(PROJECT_ROOT)).encode())
+    h.update(path.read_bytes())
+
+
+def _stat_asset(h, path: Path):
+    # Assets can be hundreds of frames; size + mtime is enough to notice a
+    # pregen rerun without reading every byte.
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    for f in files:
+        if not f.exists():
+            h.update(f"{f}:missing".encode())
+            continue
+        st = f.stat()
+        h.update(f"{f.relative_to(PROJECT_ROOT)}:{st.st_size}:{st.st_mtime_ns}".encode())
+
+
+def scene_digest(entry, quality, shared):
+    h = hashlib.sha256()
+    h.update(f"{entry.module}:{entry.scene}:{quality}".encode())
+    _hash_file(h, entry.source)
+    for src in shared:
+        _hash_file(h, src)
+    for asset in entry.asset_paths():
+        _stat_asset(h, asset)
+    return h.hexdigest()
+
+
+def load_cache(media_dir: Path):
+    path = media_dir / CACHE_NAME
+    if path.exists():
+        return json.loads(path.read_text())
+    return {}
+
+
+def save_cache(media_dir: Path, cache):
+    path = media_dir / CACHE_NAME
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache, indent=2, sort_keys=True))
+    tmp.replace(path)
+
+
+# ==========================================================
+# Concurrency cap
+# ==========================================================
+def available_ram_gb():
+    """MemAvailable on Linux, total physical memory elsewhere, None if unknown."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / (1024 ** 2)
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / (1024 ** 3)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def default_jobs():
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+# ==========================================================
+# Workers
+# ==========================================================
+def render_command(entry, quality, media_dir):
+    _, _, fps = QUALITIES[quality]
+    return [
+        sys.executable, "-m", "manim", "render",
+        f"-q{quality}",
+        "--fps", str(fps),
+        "--media_dir", str(media_dir),
+        str(entry.source),
+        entry.scene,
+    ]
+
+
+def run_all(todo, quality, media_dir, jobs, ram_gb, on_done):
+    """Start workers while both the job cap and the RAM budget allow."""
+    log_dir = media_dir / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    pending = list(todo)
+    running = {}  # Popen -> (entry, log file, start time)
+    failed = []
+
+    def ram_in_use():
+        return sum(e.mem_gb for e, _, _ in running.values())
+
+    while pending or running:
+        for entry in list(pending):
+            if len(running) >= jobs:
+                break
+            fits = ram_gb is None or ram_in_use() + entry.mem_gb <= ram_gb
+            if running and not fits:
+                continue
+            log = open(log_dir / f"{entry.module}.log", "w")
+            proc = subprocess.Popen(
+                render_command(entry, quality, media_dir),
+                cwd=PROJECT_ROOT,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+            running[proc] = (entry, log, time.perf_counter())
+            pending.remove(entry)
+            print(f"[start] {entry.module}:{entry.scene}")
+
+        time.sleep(0.2)
+
+        for proc in [p for p in running if p.poll() is not None]:
+            entry, log, t0 = running.pop(proc)
+            log.close()
+            dt = time.perf_counter() - t0
+            if proc.returncode == 0:
+                print(f"[done ] {entry.module}:{entry.scene} ({dt:.1f}s)")
+                on_done(entry)
+            else:
+                print(f"[FAIL ] {entry.module}:{entry.scene} (exit {proc.returncode}, see {log.name})")
+                failed.append(entry)
+
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render all manifest scenes in parallel")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("--media-dir", default="media", help="Manim media directory (default: media)")
+    parser.add_argument("--only", nargs="+", help="Module stems or Scene class names to render")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Max concurrent workers (default: cores / 2)")
+    parser.add_argument("--ram-gb", type=float, default=None, help="RAM budget for workers (default: available RAM)")
+    parser.add_argument("--force", action="store_true", help="Render even if nothing changed")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be rendered")
+    args = parser.parse_args()
+
+    media_dir = Path(args.media_dir)
+    if not media_dir.is_absolute():
+        media_dir = PROJECT_ROOT / media_dir
+    media_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = [find_scene(n) for n in args.only] if args.only else list(SCENES)
+    shared = shared_sources()
+    cache = load_cache(media_dir)
+
+    todo, digests = [], {}
+    for entry in entries:
+        key = f"{entry.module}:{entry.scene}:{args.quality}"
+        digests[key] = scene_digest(entry, args.quality, shared)
+        up_to_date = (
+            cache.get(key) == digests[key]
+            and movie_path(entry, args.quality, media_dir).exists()
+        )
+        if up_to_date and not args.force:
+            print(f"[skip ] {entry.module}:{entry.scene} (unchanged)")
+        else:
+            todo.append(entry)
+
+    jobs = args.jobs or default_jobs()
+    ram_gb = args.ram_gb if args.ram_gb is not None else available_ram_gb()
+    ram_msg = f"{ram_gb:.1f} GB RAM" if ram_gb is not None else "unknown RAM"
+    print(f"{len(todo)} of {len(entries)} scenes to render, {jobs} workers, {ram_msg}")
+
+    if args.dry_run or not todo:
+        return
+
+    def on_done(entry):
+        key = f"{entry.module}:{entry.scene}:{args.quality}"
+        cache[key] = digests[key]
+        save_cache(media_dir, cache)
+
+    failed = run_all(todo, args.quality, media_dir, jobs, ram_gb, on_done)
+    if failed:
+        sys.exit(f"{len(failed)} scene(s) failed: " + ", ".join(e.module for e in failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Animations shared by the scenes.
+
+FrameSequencePlayback plays a pre-generated frame sequence inside a
+single play() call. Stepping through frames with one wait() per frame
+makes Manim write a separate partial movie file (and run ffmpeg) for
+every frame; here alpha is mapped to a frame index and the pixels of one
+persistent FrameImage are swapped in place as the animation runs.
+
+PathSweep does the same for the brute-force seam enumeration in s30:
+every path is flashed on a fixed pool of highlight boxes inside one
+play(), instead of two play() calls with fresh boxes per path.
+
+BlockReveal uncovers a RevealMask block by block following a schedule,
+again in one play() instead of one per block.
+
+GrowArrowField is LaggedStart(*[GrowArrow(a) ...]) for a
+GradientArrowField: the lagged per-arrow progress is computed as one
+array each frame.
+"""
+
+from manim import RIGHT, Animation, linear, smooth
+import numpy as np
+
+
+def _track(mobjects, updater):
+    # Mobjects changed by an animation but not part of its mobject are
+    # only redrawn by the Cairo renderer if they have an updater.
+    for m in mobjects:
+        m.add_updater(updater)
+
+
+def _untrack(mobjects, updater):
+    for m in mobjects:
+        m.remove_updater(updater)
+
+
+def _noop(mobject):
+    pass
+
+
+def _sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+def _smooth_array(t, inflection=10.0):
+    # manim's smooth() uses builtin min/max, so it only takes scalars
+    error = _sigmoid(-inflection / 2)
+    return np.clip((_sigmoid(inflection * (t - 0.5)) - error) / (1 - 2 * error), 0, 1)
+
+
+def _array_rate_func(func):
+    """`func` as a function of a NumPy array of alphas, evaluated in one call."""
+    if func is smooth:
+        return _smooth_array
+    probe = np.linspace(0, 1, 3)
+    try:
+        if np.shape(func(probe)) == probe.shape:
+            return func
+    except (TypeError, ValueError):
+        pass
+    return np.vectorize(func, otypes=[float])   # one Python call per element
+
+
+class FrameSequencePlayback(Animation):
+    """
+    Show frames[start:end] on a FrameImage over the run time of the animation.
+
+    The image's own anchor decides which edge stays put as frames narrow.
+    An optional `marker` mobject (e.g. a seam line) already in the scene is
+    kept on the image's `marker_edge` through a temporary updater.
+    """
+
+    def __init__(
+        self,
+        image,
+        frames,
+        start=0,
+        end=None,
+        marker=None,
+        marker_edge=RIGHT,
+        rate_func=linear,
+        **kwargs,
+    ):
+        self.image = image
+        self.frames = frames
+        self.start = start
+        self.end = len(frames) if end is None else min(end, len(frames))
+        if self.end <= self.start:
+            raise ValueError(f"Empty frame range [{start}, {self.end})")
+        self.marker = marker
+        self.marker_edge = int(np.sign(marker_edge[0]))
+        self._current = None
+
+        super().__init__(image, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        if self.marker is not None:
+            _track([self.marker], self._follow_edge)
+        super().begin()
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if self.marker is not None:
+            self._follow_edge(self.marker)
+            _untrack([self.marker], self._follow_edge)
+
+    def _follow_edge(self, marker):
+        left, right = self.image.points[0, 0], self.image.points[1, 0]
+        marker.set_x((left, (left + right) / 2, right)[self.marker_edge + 1])
+
+    def frame_index(self, alpha):
+        count = self.end - self.start
+        return self.start + min(max(int(alpha * count), 0), count - 1)
+
+    def interpolate_mobject(self, alpha):
+        # Overriding interpolate_mobject skips Animation's rate_func handling
+        k = self.frame_index(self.rate_func(alpha))
+        if k != self._current:
+            self._current = k
+            self.image.set_frame(self.frames[k])
+
+
+class PathSweep(Animation):
+    """
+    Flash `paths` one after another on a pool of highlight boxes.
+
+    `boxes` holds one box per path cell (copies of a grid square); for
+    path k they are moved onto `centers[(i, j)]` and colored `colors[k]`.
+    Each path is shown for the first `visible_fraction` of its time slot
+    and hidden for the rest. `on_path(k)` is called once per new path to
+    update counters etc.; pass those mobjects as `counters` so they are
+    redrawn during the sweep. The boxes are removed from the scene at the
+    end.
+    """
+
+    def __init__(
+        self,
+        boxes,
+        paths,
+        centers,
+        colors,
+        on_path=None,
+        counters=(),
+        visible_fraction=2 / 3,
+        fill_opacity=0.35,
+        stroke_width=4,
+        rate_func=linear,
+        **kwargs,
+    ):
+        if not paths:
+            raise ValueError("PathSweep needs at least one path")
+        if len(boxes) < max(len(p) for p in paths):
+            raise ValueError(f"Pool of {len(boxes)} boxes is smaller than the longest path")
+        self.paths = paths
+        self.centers = centers
+        self.colors = colors
+        self.on_path = on_path
+        self.counters = list(counters)
+        self.visible_fraction = visible_fraction
+        self.fill_opacity = fill_opacity
+        self.stroke_width = stroke_width
+        self._current = None
+        self._visible = None
+        super().__init__(boxes, rate_func=rate_func, remover=True, **kwargs)
+
+    def begin(self):
+        _track(self.counters, _noop)
+        super().begin()
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        _untrack(self.counters, _noop)
+
+    def path_index(self, alpha):
+        return min(max(int(alpha * len(self.paths)), 0), len(self.paths) - 1)
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)   # not applied for us: interpolate_mobject is overridden
+        k = self.path_index(alpha)
+        if k != self._current:
+            self._current = k
+            self._visible = None
+            path = self.paths[k]
+            for box, cell in zip(self.mobject, path):
+                box.move_to(self.centers[cell])
+            for box in self.mobject[len(path):]:
+                box.set_fill(opacity=0).set_stroke(opacity=0)
+            if self.on_path is not None:
+                self.on_path(k)
+
+        visible = alpha * len(self.paths) - k < self.visible_fraction
+        if visible != self._visible:
+            self._visible = visible
+            color = self.colors[k]
+            for box in self.mobject[: len(self.paths[k])]:
+                box.set_fill(color, opacity=self.fill_opacity if visible else 0)
+                box.set_stroke(color, width=self.stroke_width, opacity=1 if visible else 0)
+
+
+class BlockReveal(Animation):
+    """
+    Uncover the cells of a RevealMask in the order given by `steps`.
+
+    `steps` is a (rows, cols) int array: cells with step k are faded out
+    during the k-th time slot, over its last `fade_fraction`; cells with a
+    negative step stay covered. `on_step(k, t)` is called every frame with
+    the current slot k and t in [0, 1], the progress through the part of
+    the slot before its fade (e.g. to glide a kernel overlay from block
+    k - 1 onto block k); pass the mobjects it moves as `followers` so
+    they are redrawn during the sweep.
+    """
+
+    def __init__(
+        self,
+        mask,
+        steps,
+        on_step=None,
+        followers=(),
+        fade_fraction=0.5,
+        rate_func=linear,
+        **kwargs,
+    ):
+        self.steps = np.asarray(steps)
+        if self.steps.shape != (mask.rows, mask.cols):
+            raise ValueError(f"Schedule {self.steps.shape} does not match mask ({mask.rows}, {mask.cols})")
+        self.count = int(self.steps.max()) + 1
+        if self.count <= 0:
+            raise ValueError("BlockReveal needs at least one scheduled cell")
+        self.on_step = on_step
+        self.followers = list(followers)
+        self.fade_fraction = fade_fraction
+        super().__init__(mask, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        self._covered = self.mobject.cell_opacity
+        _track(self.followers, _noop)
+        super().begin()
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        _untrack(self.followers, _noop)
+
+    def step_index(self, alpha):
+        return min(max(int(alpha * self.count), 0), self.count - 1)
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)   # not applied for us: interpolate_mobject is overridden
+        k = self.step_index(alpha)
+        t = float(np.clip(alpha * self.count - k, 0, 1))
+        if self.on_step is not None:
+            lead_in = 1 - self.fade_fraction
+            self.on_step(k, min(t / lead_in, 1.0) if lead_in > 0 else 1.0)
+
+        fade = np.clip((t - (1 - self.fade_fraction)) / self.fade_fraction, 0, 1)
+        done = (self.steps >= 0) & (self.steps < k)
+        opacity = np.where(done, 0.0, self._covered)
+        opacity[self.steps == k] *= 1 - fade
+        self.mobject.set_cell_opacity(opacity)
+
+
+class GrowArrowField(Animation):
+    """
+    Grow the arrows of a GradientArrowField from their starts, staggered.
+
+    Timing matches LaggedStart(*[GrowArrow(a) for a in arrows],
+    lag_ratio=lag_ratio): arrow k starts k * lag_ratio unit durations in
+    and grows for one unit, with `arrow_rate_func` applied per arrow.
+    Both rate functions are applied: `rate_func` to the overall alpha,
+    then `arrow_rate_func` to every arrow's progress as one array.
+    """
+
+    def __init__(self, field, lag_ratio=0.004, arrow_rate_func=smooth, rate_func=linear, **kwargs):
+        self.lag_ratio = lag_ratio
+        self.arrow_rate_func = _array_rate_func(arrow_rate_func)
+        n = field.arrow_count
+        self._offsets = np.arange(n) * lag_ratio
+        self._span = 1 + max(n - 1, 0) * lag_ratio
+        super().__init__(field, rate_func=rate_func, introducer=True, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)   # not applied for us: interpolate_mobject is overridden
+        local = np.clip(alpha * self._span - self._offsets, 0, 1)
+        self.mobject.set_growth(self.arrow_rate_func(local))
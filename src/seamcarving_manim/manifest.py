@@ -0,0 +1,83 @@
+"""
+Ordered scene manifest for the full video.
+
+Each entry names the scene module, the Scene class to render and the
+assets (files or directories, relative to assets/images) that the scene
+reads at render time. Tools such as pregen/render_scenes.py use this
+list instead of hand-typed manim commands.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+SCENES_DIR = PACKAGE_DIR / "scenes"
+ASSETS_DIR = PACKAGE_DIR / "assets" / "images"
+
+# manim quality flag -> (pixel_width, pixel_height, frame_rate)
+QUALITIES = {
+    "l": (854, 480, 15),
+    "m": (1280, 720, 30),
+    "h": (1920, 1080, 60),
+    "p": (2560, 1440, 60),
+    "k": (3840, 2160, 60),
+}
+
+
+@dataclass(frozen=True)
+class SceneEntry:
+    module: str                 # file stem in scenes/, e.g. "s00_title"
+    scene: str                  # Scene class name inside that module
+    assets: tuple = ()          # paths relative to assets/images
+    mem_gb: float = 1.0         # rough peak RAM of one render worker
+
+    @property
+    def source(self) -> Path:
+        return SCENES_DIR / f"{self.module}.py"
+
+    def asset_paths(self):
+        return [ASSETS_DIR / a for a in self.assets]
+
+
+SCENES = [
+    SceneEntry("s00_title", "TitleScene"),
+    SceneEntry("s05_manim_intro", "ManimIntroShowcase", mem_gb=1.5),
+    SceneEntry("s10_problem_and_baselines", "BaselinesScene", ("memory.jpg",)),
+    SceneEntry("s15_intro_demo", "FirstDemoScene", ("memory_carved",), mem_gb=2.0),
+    SceneEntry("s17_sobel_intro", "SobelIntroScene"),
+    SceneEntry("s20_energy_map", "EdgeDetectionScene"),
+    SceneEntry("s25_edge_on_memory", "EdgeOnMemoryScene", ("memory.jpg", "memory_edges")),
+    SceneEntry("s27_edge_on_memory_v2", "MemoryEdgeWalkthroughScene", ("memory.jpg", "memory_edges")),
+    SceneEntry("s30_dynamic_programming", "EnergyGridSeamsScene"),
+    SceneEntry(
+        "s35_min_energy_memory",
+        "MemoryMinEnergyBottomScene",
+        ("memory.jpg", "memory_edges/memory_edge_mag.png", "min_energy_bottom"),
+    ),
+    SceneEntry("s40_purple_seam_demo", "DualSeamCarvingScene", ("memory_dual",), mem_gb=3.0),
+    SceneEntry("s45_failure_modes", "FailureModesScene", ("failure_modes",), mem_gb=4.0),
+    SceneEntry("s50_final_scene", "FinalCreditsScene", ("final_scene",)),
+]
+
+
+def shared_sources():
+    """Package modules every scene may import (style, utils, ...)."""
+    return sorted(
+        p for p in PACKAGE_DIR.rglob("*.py")
+        if SCENES_DIR not in p.parents
+        and p.name not in ("__init__.py", "manifest.py")
+    )
+
+
+def find_scene(name: str) -> SceneEntry:
+    """Look up an entry by module stem or Scene class name."""
+    for entry in SCENES:
+        if name in (entry.module, entry.scene):
+            return entry
+    raise KeyError(f"Unknown scene: {name}")
+
+
+def movie_path(entry: SceneEntry, quality: str, media_dir="media") -> Path:
+    """Final movie file manim writes for `entry` at `quality`."""
+    _, height, fps = QUALITIES[quality]
+    return Path(media_dir) / "videos" / entry.module / f"{height}p{fps}" / f"{entry.scene}.mp4"
@@ -0,0 +1,496 @@
+"""
+Mobjects shared by the scenes.
+
+FrameImage is an ImageMobject meant to live for a whole frame sequence:
+new frames are copied into one preallocated RGBA buffer and the corner
+quad is narrowed in place, instead of building (and sizing, aligning,
+converting) a fresh ImageMobject per frame.
+
+NumberLabel is a numeric label for values that change often (counters,
+grid cell values). Digit glyphs are rendered with Pango once per text
+style into a shared atlas; a new value only repositions cached glyph
+copies.
+
+CellGrid draws a rows x cols grid of colored cells as one image (one
+pixel per cell, nearest-neighbour scaled) plus one VMobject holding all
+grid lines, so building and recoloring a grid are array operations
+instead of one Square per cell.
+
+RevealMask is the same idea for occluders: a rows x cols alpha texture
+laid over an image, so hiding and uncovering blocks of it means writing
+one alpha channel instead of animating a Rectangle per cell.
+
+GradientArrowField draws a whole field of gradient arrows as a single
+VMobject whose points come from one array expression over (gx, gy);
+growing it is a per-arrow scale of that array rather than one GrowArrow
+per Arrow.
+
+PackedPoints is for updaters that move a whole mobject tree rigidly each
+frame (the pulsing sphere in s05): the family's points are packed into
+one array once, and a transform is a single matrix product written
+through views, instead of copying the tree and calling become().
+"""
+
+from manim import (
+    BLACK,
+    GRAY,
+    LEFT,
+    ORIGIN,
+    RESAMPLING_ALGORITHMS,
+    RIGHT,
+    Group,
+    ImageMobject,
+    ManimColor,
+    Square,
+    Text,
+    VGroup,
+    VMobject,
+    VectorizedPoint,
+)
+import numpy as np
+
+
+class FrameImage(ImageMobject):
+    """
+    ImageMobject whose pixels can be replaced in place by set_frame().
+
+    Frames must have the height of the first frame and be at most
+    `max_width` pixels wide (default: the first frame's width). The image
+    keeps its on-screen height; a narrower frame only moves the corners
+    away from `anchor` (LEFT: the image shrinks from the right).
+    """
+
+    def __init__(self, frame, max_width=None, anchor=LEFT, **kwargs):
+        frame = self._as_rgb(frame)
+        h, w = frame.shape[:2]
+        self.anchor = int(np.sign(anchor[0]))
+        self._buffer = np.full((h, max_width or w, 4), 255, dtype=np.uint8)
+        self._buffer[:, :w, :3] = frame
+        super().__init__(self._buffer[:, :w], **kwargs)
+        self.pixel_array = self._buffer[:, :w]
+
+    @staticmethod
+    def _as_rgb(frame):
+        frame = np.asarray(frame)
+        if frame.ndim == 2:
+            return np.repeat(frame[..., None], 3, axis=2)
+        return frame[..., :3]
+
+    @property
+    def frame_width(self):
+        """Width in pixels of the current frame."""
+        return self.pixel_array.shape[1]
+
+    def set_frame(self, frame):
+        """Show `frame`, keeping the height and the anchor edge fixed."""
+        frame = self._as_rgb(frame)
+        h, w = frame.shape[:2]
+        bh, bw = self._buffer.shape[:2]
+        if h != bh or w > bw:
+            raise ValueError(f"Frame {frame.shape} does not fit buffer ({bh}, <= {bw})")
+
+        # Keep the alpha of the current frame (opacity changes live there)
+        alpha = self.pixel_array[0, 0, 3]
+        self._buffer[:, :w, :3] = frame
+        self._buffer[:, :w, 3] = alpha
+        old_w = self.frame_width
+        self.pixel_array = self._buffer[:, :w]
+        if w != old_w:
+            self._fit_width(w / old_w)
+        return self
+
+    def _fit_width(self, factor):
+        # Corners are (UL, UR, DL, DR); only their x changes
+        corners = self.points
+        left, right = corners[0, 0], corners[1, 0]
+        width = (right - left) * factor
+        pin = (left, (left + right) / 2, right)[self.anchor + 1]
+        left = pin - (1 + self.anchor) / 2 * width
+        corners[[0, 2], 0] = left
+        corners[[1, 3], 0] = left + width
+
+
+# ==========================================================
+# Numbers from cached glyphs
+# ==========================================================
+GLYPH_CHARS = "0123456789.,+-–/%"
+
+_atlases = {}   # style key -> _GlyphAtlas
+
+
+class _GlyphAtlas:
+    """
+    Glyph outlines and advances for GLYPH_CHARS in one text style.
+
+    Everything is measured from two renders: "0" interleaved with every
+    character (so each advance is the distance between the surrounding
+    zeros minus one zero advance) and "0 0" for the space. Positions are
+    relative to the pen position on the baseline.
+    """
+
+    def __init__(self, make_text):
+        sample = "0" + "".join(c + "0" for c in GLYPH_CHARS)
+        glyphs = make_text(sample).submobjects
+        lefts = [g.get_left()[0] for g in glyphs]
+        self.baseline = glyphs[0].get_bottom()[1]
+        self.zero_advance = lefts[2] - lefts[0]   # GLYPH_CHARS starts with "0"
+
+        self.templates = {}   # char -> glyph with points relative to its pen position
+        self.advances = {}
+        for k, c in enumerate(GLYPH_CHARS):
+            before, glyph, after = 2 * k, 2 * k + 1, 2 * k + 2
+            pen = lefts[before] + self.zero_advance
+            tpl = glyphs[glyph].copy()
+            tpl.shift([-pen, -self.baseline, 0])
+            self.templates[c] = tpl
+            self.advances[c] = lefts[after] - lefts[before] - self.zero_advance
+
+        zeros = make_text("0 0").submobjects
+        self.advances[" "] = zeros[1].get_left()[0] - zeros[0].get_left()[0] - self.zero_advance
+
+
+def _atlas_for(make_text, text_kwargs):
+    key = (make_text, tuple(sorted((k, repr(v)) for k, v in text_kwargs.items())))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _GlyphAtlas(make_text or (lambda s: Text(s, **text_kwargs)))
+        _atlases[key] = atlas
+    return atlas
+
+
+class NumberLabel(VMobject):
+    """
+    Text label showing `prefix` followed by a formatted number.
+
+    Text style comes from `make_text` (e.g. style.caption) or from Text
+    keyword arguments. The prefix is rendered once; set_value() reshapes
+    a fixed pool of glyph slots in place in O(digits), keeping the
+    label's left end fixed. The family never changes after construction,
+    so set_value() is safe while an animation is playing (the renderer
+    snapshots the family when the animation begins). The pool holds
+    `max_chars` glyphs, by default just enough for the initial value, so
+    static labels cost no extra mobjects; live counters pass the widest
+    value they will show. Unused slots have no points. Values may also be
+    given as strings made of GLYPH_CHARS.
+    """
+
+    _UNIT = 1e-3   # length of the scale probe, kept inside the bounding box
+
+    def __init__(self, value=0, fmt="{}", prefix="", make_text=None, max_chars=None, **text_kwargs):
+        super().__init__()
+        self.fmt = fmt
+        self.value = None
+        self._atlas = _atlas_for(make_text, text_kwargs)
+
+        if prefix:
+            # Render the prefix with a trailing zero: the zero marks where
+            # the number's pen position and baseline are.
+            head = (make_text or (lambda s: Text(s, **text_kwargs)))(prefix + "0")
+            zero = head.submobjects[-1]
+            head.remove(zero)
+            origin = [zero.get_left()[0], zero.get_bottom()[1], 0]
+            prefix_mobs = [head]
+        else:
+            origin = ORIGIN
+            prefix_mobs = []
+
+        if max_chars is None:
+            max_chars = sum(c in self._atlas.templates for c in self._text(value))
+        style = self._atlas.templates["0"]
+        self._slots = [VMobject().match_style(style) for _ in range(max_chars)]
+
+        self._origin = VectorizedPoint(origin)
+        self._probe = VectorizedPoint(np.add(origin, RIGHT * self._UNIT))
+        self.add(self._origin, self._probe, *prefix_mobs, *self._slots)
+        self.set_value(value)
+
+    def _text(self, value):
+        return value if isinstance(value, str) else self.fmt.format(value)
+
+    def set_value(self, value):
+        text = self._text(value)
+        atlas = self._atlas
+        origin = self._origin.get_center()
+        scale = np.linalg.norm(self._probe.get_center() - origin) / self._UNIT
+
+        for c in text:
+            if c not in atlas.advances:
+                raise ValueError(f"NumberLabel cannot draw {c!r}; allowed: {GLYPH_CHARS!r} and space")
+        if sum(c in atlas.templates for c in text) > len(self._slots):
+            raise ValueError(f"{text!r} needs more than max_chars={len(self._slots)} glyphs")
+
+        n = 0
+        x = 0.0
+        for c in text:
+            tpl = atlas.templates.get(c)
+            if tpl is not None:
+                self._slots[n].points = tpl.points * scale + origin + [x * scale, 0, 0]
+                n += 1
+            x += atlas.advances[c]
+        for slot in self._slots[n:]:
+            slot.clear_points()
+
+        self.value = value
+        return self
+
+
+# ==========================================================
+# Raster cell grids
+# ==========================================================
+def ramp_colors(t, low, high):
+    """Vectorized interpolate_color: (..., 3) RGB floats for t in [0, 1]."""
+    low = np.asarray(ManimColor(low).to_rgb())
+    high = np.asarray(ManimColor(high).to_rgb())
+    t = np.asarray(t, dtype=float)[..., None]
+    return low + t * (high - low)
+
+
+class CellGrid(Group):
+    """
+    Grid of filled cells backed by a (rows, cols) RGBA image.
+
+    Cell (i, j) is row i from the top, column j from the left. Fills are
+    set for the whole grid with set_fills() (works with .animate) or per
+    cell with set_cell_fill(). Geometry is derived from the image corners,
+    so cell_center()/cell_square() follow any shift or scale.
+    """
+
+    def __init__(self, rows, cols, cell_size=1.0, stroke_color=GRAY, stroke_width=1, **kwargs):
+        self.rows = rows
+        self.cols = cols
+
+        self.image = ImageMobject(np.zeros((rows, cols, 4), dtype=np.uint8))
+        self.image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        self.image.set_height(rows * cell_size)
+        self.image.stretch_to_fit_width(cols * cell_size)
+
+        w, h = cols * cell_size, rows * cell_size
+        self.lines = VMobject(stroke_color=stroke_color, stroke_width=stroke_width)
+        for i in range(rows + 1):
+            y = h / 2 - i * cell_size
+            self.lines.start_new_path([-w / 2, y, 0])
+            self.lines.add_line_to([w / 2, y, 0])
+        for j in range(cols + 1):
+            x = -w / 2 + j * cell_size
+            self.lines.start_new_path([x, h / 2, 0])
+            self.lines.add_line_to([x, -h / 2, 0])
+
+        self.labels = None
+        super().__init__(self.image, self.lines, **kwargs)
+
+    # ------------------------------------------------------
+    # Geometry
+    # ------------------------------------------------------
+    def _frame(self):
+        ul, ur, dl = self.image.points[:3]
+        return ul, (ur - ul) / self.cols, (dl - ul) / self.rows
+
+    def cell_centers(self):
+        """(rows, cols, 3) array of cell centers."""
+        ul, right, down = self._frame()
+        i = np.arange(self.rows)[:, None, None] + 0.5
+        j = np.arange(self.cols)[None, :, None] + 0.5
+        return ul + j * right + i * down
+
+    def cell_center(self, i, j):
+        ul, right, down = self._frame()
+        return ul + (j + 0.5) * right + (i + 0.5) * down
+
+    def cell_square(self, i, j, **kwargs):
+        """A Square over cell (i, j) with the cell's current fill."""
+        _, right, _ = self._frame()
+        r, g, b, a = self.image.pixel_array[i, j] / 255.0
+        style = dict(fill_color=ManimColor.from_rgb((r, g, b)), fill_opacity=a, stroke_width=0)
+        style.update(kwargs)
+        return Square(side_length=np.linalg.norm(right), **style).move_to(self.cell_center(i, j))
+
+    # ------------------------------------------------------
+    # Fills
+    # ------------------------------------------------------
+    def set_fills(self, colors, opacity=1.0):
+        """Set every cell from a (rows, cols, 3) RGB array (floats in [0, 1] or uint8)."""
+        colors = np.asarray(colors)
+        if colors.dtype != np.uint8:
+            colors = np.clip(np.round(colors * 255), 0, 255).astype(np.uint8)
+        rgba = np.empty((self.rows, self.cols, 4), dtype=np.uint8)
+        rgba[..., :3] = colors
+        rgba[..., 3] = np.clip(np.round(np.asarray(opacity) * 255), 0, 255)
+        self.image.pixel_array = rgba
+        return self
+
+    def set_cell_fill(self, i, j, color=None, opacity=None):
+        px = self.image.pixel_array
+        if color is not None:
+            px[i, j, :3] = np.round(np.asarray(ManimColor(color).to_rgb()) * 255)
+        if opacity is not None:
+            px[i, j, 3] = round(opacity * 255)
+        return self
+
+    def add_labels(self, values, fmt="{}", colors=None, **text_kwargs):
+        """
+        Put a NumberLabel with values[i][j] on every cell; `colors` is an
+        optional per-cell array of text colors. Returns the labels VGroup.
+        """
+        centers = self.cell_centers()
+        labels = VGroup()
+        for i in range(self.rows):
+            for j in range(self.cols):
+                kw = dict(text_kwargs)
+                if colors is not None:
+                    kw["color"] = colors[i][j]
+                label = NumberLabel(values[i][j], fmt, **kw)
+                labels.add(label.move_to(centers[i, j]))
+        self.labels = labels
+        self.add(labels)
+        return labels
+
+
+# ==========================================================
+# Occluders
+# ==========================================================
+class RevealMask(ImageMobject):
+    """
+    Opaque rows x cols mask, one texture pixel per cell.
+
+    Built over `image` (if given) it is stretched to cover it exactly.
+    Cell opacities live in the alpha channel: set_cell_opacity() takes a
+    (rows, cols) array in [0, 1], reveal() clears a block of cells.
+    """
+
+    def __init__(self, rows, cols, image=None, color=BLACK, **kwargs):
+        self.rows = rows
+        self.cols = cols
+        rgba = np.empty((rows, cols, 4), dtype=np.uint8)
+        rgba[..., :3] = np.round(np.asarray(ManimColor(color).to_rgb()) * 255)
+        rgba[..., 3] = 255
+        super().__init__(rgba, **kwargs)
+        self.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        if image is not None:
+            self.cover(image)
+
+    def cover(self, image):
+        """Stretch and move the mask onto `image`."""
+        self.stretch_to_fit_width(image.width)
+        self.stretch_to_fit_height(image.height)
+        self.move_to(image)
+        return self
+
+    @property
+    def cell_opacity(self):
+        """(rows, cols) float array of current cell opacities."""
+        return self.pixel_array[..., 3] / 255.0
+
+    def set_cell_opacity(self, opacity):
+        self.pixel_array[..., 3] = np.clip(np.round(np.asarray(opacity) * 255), 0, 255)
+        return self
+
+    def reveal(self, rows=slice(None), cols=slice(None)):
+        self.pixel_array[rows, cols, 3] = 0
+        return self
+
+
+# ==========================================================
+# Vector fields
+# ==========================================================
+class GradientArrowField(VMobject):
+    """
+    Arrows for a (rows, cols) gradient field, one per cell of `image`.
+
+    Each arrow starts at its cell center and points along (gx, -gy)
+    (image rows grow downwards), with length `scale` for the strongest
+    gradient; cells below `threshold` times the maximum magnitude get no
+    arrow. An arrow is one line curve plus a three-curve triangular tip
+    `tip_ratio` of its length long, so the whole field is a single
+    (arrows * 16, 3) points array. set_growth() scales every arrow about
+    its start, with one factor per arrow if given an array.
+    """
+
+    def __init__(
+        self,
+        gx,
+        gy,
+        image,
+        threshold=0.05,
+        scale=0.45,
+        tip_ratio=0.3,
+        stroke_width=1.5,
+        **kwargs,
+    ):
+        kwargs.setdefault("fill_opacity", 1.0)
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        gx = np.asarray(gx, dtype=float)
+        gy = np.asarray(gy, dtype=float)
+        rows, cols = gx.shape
+
+        mag = np.hypot(gx, gy)
+        maxmag = mag.max() or 1.0
+        i, j = np.nonzero(mag >= threshold * maxmag)   # row-major, like nested loops
+
+        ul = np.array([image.get_left()[0], image.get_top()[1], 0.0])
+        cell = np.array([image.width / cols, -image.height / rows, 0.0])
+        starts = ul + np.stack([j + 0.5, i + 0.5, np.zeros_like(i, dtype=float)], axis=1) * cell
+        vec = np.stack([gx[i, j], -gy[i, j], np.zeros(len(i))], axis=1) * (scale / maxmag)
+        normal = np.stack([-vec[:, 1], vec[:, 0], vec[:, 2]], axis=1)
+
+        end = starts + vec
+        base = end - tip_ratio * vec
+        wing = tip_ratio / 2 * normal
+        # Anchors of the four straight curves: shaft, then the closed tip
+        anchors = np.stack(
+            [starts, base, base + wing, end, end, base - wing, base - wing, base + wing],
+            axis=1,
+        ).reshape(-1, 2, 1, 3)
+        t = np.linspace(0, 1, 4)[None, None, :, None]   # straight-line Bézier handles
+        points = anchors[:, :1] + t * (anchors[:, 1:] - anchors[:, :1])
+
+        self.starts = starts
+        self._full = points.reshape(len(starts), -1, 3) - starts[:, None]
+        self.set_growth(1.0)
+
+    @property
+    def arrow_count(self):
+        return len(self.starts)
+
+    def set_growth(self, growth):
+        """Scale arrows about their starts: a scalar, or one value per arrow."""
+        growth = np.broadcast_to(np.asarray(growth, dtype=float), (len(self.starts),))
+        points = self.starts[:, None] + growth[:, None, None] * self._full
+        self.set_points(points.reshape(-1, 3))
+        return self
+
+
+# ==========================================================
+# Rigid transforms of whole trees
+# ==========================================================
+class PackedPoints:
+    """
+    Points of every mobject in `mobject`'s family packed into one array.
+
+    The current points are kept as the reference pose; each member's
+    `points` becomes a view into one shared live array. apply_matrix()
+    maps the reference pose through a 3x3 matrix about `about_point`
+    (default: the current center) in one product, so the cost depends on
+    the vertex count only. Anything that assigns new `points` to a member
+    (e.g. a Transform) detaches it from the live array; call relink() to
+    reattach after such animations.
+    """
+
+    def __init__(self, mobject, about_point=None):
+        self.members = [m for m in mobject.get_family() if m.has_points()]
+        self.about_point = np.array(mobject.get_center() if about_point is None else about_point, dtype=float)
+        sizes = [len(m.points) for m in self.members]
+        self._slices = [slice(a, a + n) for a, n in zip(np.cumsum([0, *sizes[:-1]]), sizes)]
+        reference = np.concatenate([m.points for m in self.members]) if self.members else np.zeros((0, 3))
+        self.reference = reference - self.about_point
+        self.live = reference.copy()
+        self.relink()
+
+    def relink(self):
+        for m, sl in zip(self.members, self._slices):
+            m.points = self.live[sl]
+        return self
+
+    def apply_matrix(self, matrix):
+        np.matmul(self.reference, np.asarray(matrix, dtype=float).T, out=self.live)
+        self.live += self.about_point
+        return self
@@ -0,0 +1,265 @@
+"""
+Opt-in render profiler for the scenes.
+
+Set SEAMCARVING_PROFILE to profile every scene rendered in the process:
+
+    SEAMCARVING_PROFILE=1 manim -qh src/seamcarving_manim/scenes/s27_edge_on_memory_v2.py MemoryEdgeWalkthroughScene
+    SEAMCARVING_PROFILE=/tmp/prof python pregen/render_scenes.py -q l --force
+
+"1" writes to <media_dir>/profiles/, any other value is taken as the
+output directory. For every play() and wait() the profiler records wall
+time, frames written, the number of family mobjects in the scene, and
+how that time splits into
+
+    animate   Animation.interpolate (Scene.update_to_time minus updaters)
+    updaters  mobject updaters (Scene.update_mobjects)
+    raster    Cairo rasterization (renderer.update_frame)
+    encode    video encoding and partial-movie file handling
+    other     everything else (compiling animations, begin/clean up)
+
+plus the peak RSS of the process so far. Each scene gets
+<Scene>.json and <Scene>.folded; the latter is in collapsed-stack format
+(`scene;call site;bucket microseconds`) for flamegraph.pl or speedscope.
+A top-N summary of the slowest calls is logged at the end of the render.
+
+Scenes opt in by deriving from ProfiledScene / ProfiledThreeDScene (or
+mixing ProfilingMixin into another Scene class). With the variable unset
+the mixin only adds one attribute check per play().
+"""
+
+import functools
+import inspect
+import json
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from manim import Animation, Scene, ThreeDScene, config, logger
+
+try:
+    import resource
+except ImportError:   # Windows
+    resource = None
+
+ENV_VAR = "SEAMCARVING_PROFILE"
+BUCKETS = ("animate", "updaters", "raster", "encode", "other")
+SUMMARY_TOP = 10
+
+
+def profile_dir():
+    """Output directory from SEAMCARVING_PROFILE, or None when profiling is off."""
+    value = os.environ.get(ENV_VAR, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return Path(config.media_dir) / "profiles"
+    return Path(value)
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def _describe(arg):
+    if isinstance(arg, Animation):
+        return type(arg).__name__
+    if hasattr(arg, "build") and hasattr(arg, "mobject"):   # mobject.animate builder
+        return f"{type(arg.mobject).__name__}.animate"
+    return type(arg).__name__
+
+
+def _label(args):
+    counts = Counter(_describe(a) for a in args)
+    return ",".join(name if n == 1 else f"{name}x{n}" for name, n in counts.items())
+
+
+def _frames_written(args, kwargs):
+    # write_frame(frame, num_frames=N) writes N copies in one call (static
+    # wait() segments); manim 0.22 calls the argument `repeat`
+    n = kwargs.get("num_frames") or kwargs.get("repeat")
+    if n is None and len(args) > 1:
+        n = args[1]
+    return n or 1
+
+
+class _Timers:
+    def __init__(self):
+        self.seconds = dict.fromkeys(("update", "updaters", "raster", "encode"), 0.0)
+        self.frames = 0
+
+    def wrap(self, fn, bucket, counts_frame=False):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.seconds[bucket] += time.perf_counter() - t0
+                if counts_frame:
+                    self.frames += _frames_written(args, kwargs)
+        return timed
+
+    def snapshot(self):
+        return dict(self.seconds), self.frames
+
+
+class ProfilingMixin:
+    """Scene mixin recording per-play timings when SEAMCARVING_PROFILE is set."""
+
+    _profile = None
+
+    def setup(self):
+        super().setup()
+        out = profile_dir()
+        if out is None:
+            return
+        timers = _Timers()
+        renderer = self.renderer
+        writer = renderer.file_writer
+        # Instance attributes shadow the methods the render loop looks up
+        self.update_to_time = timers.wrap(self.update_to_time, "update")
+        self.update_mobjects = timers.wrap(self.update_mobjects, "updaters")
+        renderer.update_frame = timers.wrap(renderer.update_frame, "raster")
+        writer.write_frame = timers.wrap(writer.write_frame, "encode", counts_frame=True)
+        writer.begin_animation = timers.wrap(writer.begin_animation, "encode")
+        writer.end_animation = timers.wrap(writer.end_animation, "encode")
+
+        self._profile = {
+            "out": out,
+            "timers": timers,
+            "records": [],
+            "kind": "play",
+            "source": inspect.getsourcefile(type(self)),
+            "start": time.perf_counter(),
+        }
+
+    def wait(self, *args, **kwargs):
+        if self._profile is not None:
+            self._profile["kind"] = "wait"
+        try:
+            return super().wait(*args, **kwargs)
+        finally:
+            if self._profile is not None:
+                self._profile["kind"] = "play"
+
+    def play(self, *args, **kwargs):
+        prof = self._profile
+        if prof is None:
+            return super().play(*args, **kwargs)
+
+        kind = prof["kind"]
+        line = self._call_site()
+        label = _label(args)
+        if kind == "wait" and label == "Wait":
+            label = ""
+
+        before, frames_before = prof["timers"].snapshot()
+        t0 = time.perf_counter()
+        try:
+            return super().play(*args, **kwargs)
+        finally:
+            wall = time.perf_counter() - t0
+            after, frames_after = prof["timers"].snapshot()
+            spent = {k: after[k] - before[k] for k in after}
+            split = {
+                "animate": spent["update"] - spent["updaters"],
+                "updaters": spent["updaters"],
+                "raster": spent["raster"],
+                "encode": spent["encode"],
+            }
+            split["other"] = max(wall - sum(split.values()), 0.0)
+            prof["records"].append({
+                "index": len(prof["records"]),
+                "kind": kind,
+                "label": label,
+                "line": line,
+                "wall_s": wall,
+                "frames": frames_after - frames_before,
+                "mobjects": len(self.get_mobject_family_members()),
+                **{f"{k}_s": v for k, v in split.items()},
+                "peak_rss_mb": peak_rss_mb(),
+            })
+
+    def _call_site(self):
+        # Line in the scene file that led to this play()/wait()
+        frame = sys._getframe(2)
+        while frame is not None:
+            if frame.f_code.co_filename == self._profile["source"]:
+                return frame.f_lineno
+            frame = frame.f_back
+        return None
+
+    def tear_down(self):
+        super().tear_down()
+        if self._profile is not None:
+            self._write_profile()
+
+    # ------------------------------------------------------
+    # Output
+    # ------------------------------------------------------
+    def _write_profile(self):
+        prof = self._profile
+        name = type(self).__name__
+        records = prof["records"]
+        totals = {f"{k}_s": sum(r[f"{k}_s"] for r in records) for k in BUCKETS}
+        report = {
+            "scene": name,
+            "source": prof["source"],
+            "pixel_width": config.pixel_width,
+            "pixel_height": config.pixel_height,
+            "frame_rate": config.frame_rate,
+            "render_s": time.perf_counter() - prof["start"],
+            "frames": sum(r["frames"] for r in records),
+            "peak_rss_mb": peak_rss_mb(),
+            "totals": totals,
+            "calls": records,
+        }
+
+        out = prof["out"]
+        out.mkdir(parents=True, exist_ok=True)
+        (out / f"{name}.json").write_text(json.dumps(report, indent=2))
+
+        folded = Counter()
+        for r in records:
+            site = f"L{r['line']} {r['kind']}" + (f" {r['label']}" if r["label"] else "")
+            for k in BUCKETS:
+                folded[f"{name};{site};{k}"] += round(r[f"{k}_s"] * 1e6)
+        lines = [f"{stack} {us}" for stack, us in folded.items() if us > 0]
+        (out / f"{name}.folded").write_text("\n".join(lines) + "\n")
+
+        logger.info(self._summary(report))
+        logger.info(f"Profile written to {out / name}.json")
+
+    @staticmethod
+    def _summary(report):
+        head = f"{'call':<44}{'wall':>8}{'frames':>8}{'mobj':>7}" + "".join(f"{k:>10}" for k in BUCKETS)
+        rows = [
+            f"Profile of {report['scene']}: {report['render_s']:.1f} s, "
+            f"{report['frames']} frames, peak RSS {report['peak_rss_mb'] or 0:.0f} MB",
+            head,
+        ]
+        slowest = sorted(report["calls"], key=lambda r: r["wall_s"], reverse=True)[:SUMMARY_TOP]
+        for r in slowest:
+            call = f"#{r['index']} L{r['line']} {r['kind']} {r['label']}"[:43]
+            rows.append(
+                f"{call:<44}{r['wall_s']:>8.2f}{r['frames']:>8}{r['mobjects']:>7}"
+                + "".join(f"{r[f'{k}_s']:>10.2f}" for k in BUCKETS)
+            )
+        total = report["totals"]
+        rows.append(f"{'total':<44}{sum(total.values()):>8.2f}{report['frames']:>8}{'':>7}"
+                    + "".join(f"{total[f'{k}_s']:>10.2f}" for k in BUCKETS))
+        return "\n".join(rows)
+
+
+class ProfiledScene(ProfilingMixin, Scene):
+    pass
+
+
+class ProfiledThreeDScene(ProfilingMixin, ThreeDScene):
+    pass
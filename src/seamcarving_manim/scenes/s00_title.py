@@ -1,7 +1,8 @@
 from manim import *
+from seamcarving_manim.profiling import ProfiledScene
 from seamcarving_manim.style import H1, H2, caption
 
-class TitleScene(Scene):
+class TitleScene(ProfiledScene):
     def construct(self):
         self.camera.background_color = BLACK
 
@@ -1,8 +1,10 @@
 from manim import *
+from seamcarving_manim.mobjects import PackedPoints
+from seamcarving_manim.profiling import ProfiledThreeDScene
 from seamcarving_manim.style import H1, caption
 
 
-class ManimIntroShowcase(ThreeDScene):
+class ManimIntroShowcase(ProfiledThreeDScene):
     def construct(self):
         self.camera.background_color = "#050509"
         self.set_camera_orientation(phi=0 * DEGREES, theta=-90 * DEGREES)
@@ -220,19 +222,20 @@ class ManimIntroShowcase(ThreeDScene):
         self.play(FadeIn(sphere_group, shift=0.1 * UP), run_time=PANEL_INTRO_RT)
 
         t_sphere = ValueTracker(0.0)
-        base_sphere_group = sphere_group.copy()
+        sphere_points = PackedPoints(sphere_group)
 
         def update_sphere_group(m, dt):
             t_sphere.increment_value(dt)
             t = t_sphere.get_value()
 
+            # scale, then rotate about RIGHT, then about OUT, as one matrix
             scale_factor = 0.8 + 0.2 * np.sin(t)
-            new_group = base_sphere_group.copy()
-            new_group.scale(scale_factor, about_point=base_sphere_group.get_center())
-            new_group.rotate(0.6 * t, axis=RIGHT)
-            new_group.rotate(0.4 * t, axis=OUT)
-
-            m.become(new_group)
+            matrix = (
+                rotation_matrix(0.4 * t, OUT)
+                @ rotation_matrix(0.6 * t, RIGHT)
+                * scale_factor
+            )
+            sphere_points.apply_matrix(matrix)
 
         sphere_group.add_updater(update_sphere_group)
 
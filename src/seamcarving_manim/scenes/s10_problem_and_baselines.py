@@ -1,12 +1,13 @@
 from manim import *
 import numpy as np
-from PIL import Image
 from importlib.resources import files
 
+from seamcarving_manim.profiling import ProfiledScene
 from seamcarving_manim.style import H1, caption
+from seamcarving_manim.utils.image_io import load_image
 
 
-class BaselinesScene(Scene):
+class BaselinesScene(ProfiledScene):
     def construct(self):
         # ---- look & pacing ----
         self.camera.background_color = "#0a0a0a"
@@ -26,12 +27,13 @@ class BaselinesScene(Scene):
         self.play(Write(title), run_time=TITLE_RT)
 
         # ---- load image ----
+        DISP_H   = 4.5
+        CENTER   = ORIGIN
+
         img_path = files("seamcarving_manim.assets.images").joinpath("memory.jpg")
-        img_u8   = np.array(Image.open(img_path).convert("RGB"), dtype=np.uint8)
+        img_u8   = load_image(str(img_path), DISP_H)
 
         # ---- centered display with enhanced frame ----
-        DISP_H   = 4.5
-        CENTER   = ORIGIN
 
         img_mobj = ImageMobject(img_u8).set_height(DISP_H).move_to(CENTER)
         self.add(img_mobj)
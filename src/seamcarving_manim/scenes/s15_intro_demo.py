@@ -1,13 +1,17 @@
 from manim import *
 import numpy as np
-from PIL import Image
 from importlib.resources import files
 from pathlib import Path
 
+from seamcarving_manim.animations import FrameSequencePlayback
+from seamcarving_manim.mobjects import FrameImage
+from seamcarving_manim.profiling import ProfiledScene
 from seamcarving_manim.style import H1, caption
+from seamcarving_manim.utils.frame_sequence import FrameSequence
+from seamcarving_manim.utils.image_io import display_pixel_height
 
 
-class FirstDemoScene(Scene):
+class FirstDemoScene(ProfiledScene):
     def construct(self):
         # ---- look & pacing ----
         self.camera.background_color = "#0a0a0a"
@@ -20,33 +24,27 @@ class FirstDemoScene(Scene):
         title = H1("Seam Carving: Content-Aware Resizing").to_edge(UP, buff=0.5)
         self.play(Write(title), run_time=TITLE_RT)
 
-        # ---- load pre-generated frames ----
+        # ---- centered display ----
+        DISP_H = 4.5
+        CENTER = ORIGIN
+
+        # ---- pre-generated frames (decoded lazily at on-screen size while playing) ----
         frames_dir = files("seamcarving_manim.assets.images").joinpath("memory_carved")
-        
-        # Load all frames
-        print("Loading pre-generated seam carving frames...")
-        frames = []
-        frame_files = sorted(Path(str(frames_dir)).glob("frame_*.jpg"))
-        
-        for frame_file in frame_files:
-            img = np.array(Image.open(frame_file).convert("RGB"), dtype=np.uint8)
-            frames.append(img)
-        
-        print(f"Loaded {len(frames)} frames")
-        
-        if len(frames) == 0:
+
+        try:
+            frames = FrameSequence.from_dir(
+                Path(str(frames_dir)), "frame_*.jpg",
+                max_height=display_pixel_height(DISP_H),
+            )
+        except FileNotFoundError:
             raise FileNotFoundError(
                 "No frames found! Please run the pregenerate_frames.py script first to generate frames."
             )
+        print(f"Found {len(frames)} frames")
 
-        # ---- centered display ----
-        DISP_H = 4.5
-        CENTER = ORIGIN
+        # One image mobject for the whole sequence; frames are swapped in place
+        img_mobj = FrameImage(frames[0]).set_height(DISP_H).move_to(CENTER)
 
-        # Create initial image mobject
-        img_mobj = ImageMobject(frames[0]).set_height(DISP_H).move_to(CENTER)
-        start_left_x = img_mobj.get_left()[0]
-        
         self.add(img_mobj)
 
         # Enhanced frame with fixed width
@@ -90,46 +88,23 @@ class FirstDemoScene(Scene):
         seam_glow = seam_line.copy().set_stroke(width=10, opacity=0.3)
         seam_glow.set_z_index(104)
 
-        self.add(seam_glow, seam_line)
+        seam_marker = VGroup(seam_glow, seam_line)
+        self.add(seam_marker)
 
-        # Animate through frames by removing and adding new ImageMobjects
+        # Play all frames in one animation: the image shrinks from the right
+        # and the seam line follows its right edge
         num_frames = len(frames)
         dt = CARVE_TIME / num_frames  # Time per frame
-        
-        for i in range(1, num_frames):
-            # Create new image for this frame
-            new_img = ImageMobject(frames[i]).set_height(DISP_H)
-            new_img.align_to(img_mobj, LEFT)
-            new_img.shift(RIGHT * (start_left_x - new_img.get_left()[0]))
-            
-            # Keep frame rectangles fixed (don't update them)
-            
-            # Update seam line position
-            right_x = new_img.get_right()[0]
-            new_seam_line = Line(
-                start=np.array([right_x, new_img.get_top()[1], 0]),
-                end=np.array([right_x, new_img.get_bottom()[1], 0]),
-                stroke_color=RED,
-                stroke_width=3,
-                stroke_opacity=0.9
+
+        if num_frames > 1:
+            self.play(
+                FrameSequencePlayback(
+                    img_mobj, frames, start=1,
+                    marker=seam_marker,
+                ),
+                run_time=dt * (num_frames - 1),
             )
-            new_seam_line.set_z_index(105)
-            
-            new_seam_glow = new_seam_line.copy().set_stroke(width=10, opacity=0.3)
-            new_seam_glow.set_z_index(104)
-            
-            # Remove old image and seam line, add new ones (keep frame fixed)
-            self.remove(img_mobj, seam_line, seam_glow)
-            self.add(new_img, new_seam_glow, new_seam_line)
-            
-            # Update references
-            img_mobj = new_img
-            seam_line = new_seam_line
-            seam_glow = new_seam_glow
-            
-            # Wait for next frame
-            self.wait(dt)
-        
+
         # Remove seam line
         self.play(FadeOut(seam_line), FadeOut(seam_glow), run_time=0.4)
         self.wait(HOLD)
@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from seamcarving_manim.mobjects import NumberLabel
+from seamcarving_manim.profiling import ProfiledScene
+
 # Import style if available, otherwise define locally
 try:
     from seamcarving_manim.style import H1, caption
@@ -12,7 +15,7 @@ except ImportError:
         return Text(text, font_size=24, color=GRAY_B)
 
 
-class SobelIntroScene(Scene):
+class SobelIntroScene(ProfiledScene):
     """
     Introductory scene explaining Sobel filters in detail.
     Target duration: ~1.5 minutes with pauses for voiceover.
@@ -180,8 +183,9 @@ class SobelIntroScene(Scene):
                     ])
                 )
                 
-                val_text = Text(
-                    f"{val:+d}" if val != 0 else "0",
+                val_text = NumberLabel(
+                    val,
+                    "{:+d}" if val != 0 else "{}",
                     font_size=28,
                     color=BLACK,
                     weight=BOLD
@@ -471,7 +475,7 @@ class SobelIntroScene(Scene):
                 
                 # Value text
                 text_color = WHITE if val < 128 else BLACK
-                val_text = Text(str(val), font_size=28, color=text_color, weight=BOLD)
+                val_text = NumberLabel(val, font_size=28, color=text_color, weight=BOLD)
                 val_text.move_to(square.get_center())
                 
                 num_pixel_squares[(i, j)] = square
@@ -530,8 +534,9 @@ class SobelIntroScene(Scene):
                     ])
                 )
                 
-                val_text = Text(
-                    f"{val:+d}" if val != 0 else "0",
+                val_text = NumberLabel(
+                    val,
+                    "{:+d}" if val != 0 else "{}",
                     font_size=28,
                     color=WHITE,
                     weight=BOLD
@@ -718,8 +723,9 @@ class SobelIntroScene(Scene):
                     ])
                 )
                 
-                val_text = Text(
-                    f"{val:+d}" if val != 0 else "0",
+                val_text = NumberLabel(
+                    val,
+                    "{:+d}" if val != 0 else "{}",
                     font_size=28,
                     color=BLACK,
                     weight=BOLD
@@ -818,8 +824,8 @@ class SobelIntroScene(Scene):
                     )
                     sq.move_to(position + RIGHT * (j - 1) * 0.55 + DOWN * (i - 1) * 0.55)
                     
-                    txt = Text(
-                        str(val) if val >= 0 else str(val),
+                    txt = NumberLabel(
+                        val,
                         font_size=18,
                         color=WHITE,
                     )
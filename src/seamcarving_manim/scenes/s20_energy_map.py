@@ -2,10 +2,12 @@ from manim import *
 import numpy as np
 from scipy.ndimage import convolve
 
+from seamcarving_manim.mobjects import CellGrid, NumberLabel, ramp_colors
+from seamcarving_manim.profiling import ProfiledScene
 from seamcarving_manim.style import H1, caption
 
 
-class EdgeDetectionScene(Scene):
+class EdgeDetectionScene(ProfiledScene):
     def construct(self):
         # ---- look & pacing ----
         self.camera.background_color = "#0a0a0a"
@@ -39,41 +41,13 @@ class EdgeDetectionScene(Scene):
 
         # ---- Display pixel grid LEFT ----
         pixel_size = 0.45
-        grid = VGroup()
-        pixel_squares = {}
-        intensity_texts = VGroup()
-
-        for i in range(size):
-            for j in range(size):
-                val = circle_pattern[i, j]
-                color = interpolate_color(BLACK, WHITE, val / 255.0)
-                square = Square(
-                    side_length=pixel_size,
-                    fill_color=color,
-                    fill_opacity=1.0,
-                    stroke_color=GRAY,
-                    stroke_width=1,
-                )
-                square.move_to(
-                    np.array(
-                        [
-                            (j - center) * pixel_size,
-                            (center - i) * pixel_size,
-                            0,
-                        ]
-                    )
-                )
-
-                intensity_text = Text(
-                    str(val),
-                    font_size=12,
-                    color=RED if val < 128 else BLACK,
-                )
-                intensity_text.move_to(square.get_center())
-
-                pixel_squares[(i, j)] = square
-                grid.add(square, intensity_text)
-                intensity_texts.add(intensity_text)
+        grid = CellGrid(size, size, cell_size=pixel_size, stroke_color=GRAY, stroke_width=1)
+        grid.set_fills(ramp_colors(circle_pattern / 255.0, BLACK, WHITE))
+        intensity_texts = grid.add_labels(
+            circle_pattern,
+            colors=np.where(circle_pattern < 128, RED, BLACK),
+            font_size=12,
+        )
 
         grid.shift(LEFT * 4.5)
 
@@ -249,7 +223,7 @@ class EdgeDetectionScene(Scene):
         example_region = VGroup()
         for di in [-1, 0, 1]:
             for dj in [-1, 0, 1]:
-                h = pixel_squares[(example_i + di, example_j + dj)].copy()
+                h = grid.cell_square(example_i + di, example_j + dj)
                 h.set_stroke(color=PURPLE, width=4)
                 example_region.add(h)
 
@@ -328,8 +302,6 @@ class EdgeDetectionScene(Scene):
         )
         self.wait(HOLD * 0.5)
 
-        result_x_grid = VGroup()
-        result_x_squares = {}
         result_x_texts = VGroup()
 
         sobel_x_kernel = np.array(sobel_x_values)
@@ -340,31 +312,10 @@ class EdgeDetectionScene(Scene):
             np.abs(grad_x) / grad_x_max * 255, 0, 255
         ).astype(np.uint8)
 
-        for i in range(size):
-            for j in range(size):
-                val = grad_x_normalized[i, j]
-                color = interpolate_color(BLACK, RED, val / 255.0)
-                square = Square(
-                    side_length=pixel_size,
-                    fill_color=color,
-                    fill_opacity=0.0,  # start hidden
-                    stroke_color=GRAY,
-                    stroke_width=1,
-                )
-                square.move_to(
-                    np.array(
-                        [
-                            (j - center) * pixel_size,
-                            (center - i) * pixel_size,
-                            0,
-                        ]
-                    )
-                )
-                result_x_squares[(i, j)] = square
-                result_x_grid.add(square)
-
+        # cells start transparent and are revealed one by one below
+        result_x_grid = CellGrid(size, size, cell_size=pixel_size, stroke_color=GRAY, stroke_width=1)
+        result_x_grid.set_fills(ramp_colors(grad_x_normalized / 255.0, BLACK, RED), opacity=0.0)
         result_x_grid.shift(RIGHT * 1.5)
-        result_x_grid.set_opacity(0)  # group opacity
         self.add(result_x_grid)
 
         result_x_label = Text("∂I/∂x", font_size=24, color=RED).next_to(result_x_grid, UP, buff=0.25)
@@ -376,36 +327,37 @@ class EdgeDetectionScene(Scene):
             run_time=0.5,
         )
 
+        # one "[k]" tag per distinct kernel weight, copied onto each window
+        kernel_tags_x = {
+            v: Text(f"[{v}]", font_size=10, color=RED, weight=BOLD)
+            for v in {v for row in sobel_x_values for v in row}
+        }
+
         for i in range(1, size - 1):
             for j in range(1, size - 1):
                 kernel_overlay = VGroup()
                 for di in [-1, 0, 1]:
                     for dj in [-1, 0, 1]:
-                        pos = pixel_squares[(i + di, j + dj)].get_center()
+                        pos = grid.cell_center(i + di, j + dj)
                         kernel_val = sobel_x_values[di + 1][dj + 1]
 
-                        h = pixel_squares[(i + di, j + dj)].copy()
+                        h = grid.cell_square(i + di, j + dj)
                         h.set_stroke(color=RED, width=3)
 
-                        kernel_text = Text(
-                            f"[{kernel_val}]",
-                            font_size=10,
-                            color=RED,
-                            weight=BOLD,
-                        ).move_to(pos + UP * 0.15)
+                        kernel_text = kernel_tags_x[kernel_val].copy().move_to(pos + UP * 0.15)
 
                         kernel_overlay.add(h, kernel_text)
 
                 self.add(kernel_overlay)
 
                 result_val = int(grad_x[i, j])
-                result_text = Text(
-                    str(result_val),
+                result_text = NumberLabel(
+                    result_val,
                     font_size=12,
                     color=WHITE,
-                ).move_to(result_x_squares[(i, j)].get_center())
+                ).move_to(result_x_grid.cell_center(i, j))
 
-                result_x_squares[(i, j)].set_opacity(1)
+                result_x_grid.set_cell_fill(i, j, opacity=1)
                 self.add(result_text)
                 result_x_texts.add(result_text)
 
@@ -430,7 +382,7 @@ class EdgeDetectionScene(Scene):
             for j in range(1, size - 1):
                 gx_val = grad_x[i, j]
                 if abs(gx_val) > 20:
-                    pos = result_x_squares[(i, j)].get_center()
+                    pos = result_x_grid.cell_center(i, j)
                     mag = gx_val / grad_x_max * 0.8
                     vec = Arrow(
                         start=pos,
@@ -485,8 +437,6 @@ class EdgeDetectionScene(Scene):
         )
         self.wait(HOLD * 0.5)
 
-        result_y_grid = VGroup()
-        result_y_squares = {}
         result_y_texts = VGroup()
 
         sobel_y_kernel = np.array(sobel_y_values)
@@ -497,31 +447,10 @@ class EdgeDetectionScene(Scene):
             np.abs(grad_y) / grad_y_max * 255, 0, 255
         ).astype(np.uint8)
 
-        for i in range(size):
-            for j in range(size):
-                val = grad_y_normalized[i, j]
-                color = interpolate_color(BLACK, BLUE, val / 255.0)
-                square = Square(
-                    side_length=pixel_size,
-                    fill_color=color,
-                    fill_opacity=0.0,  # start hidden
-                    stroke_color=GRAY,
-                    stroke_width=1,
-                )
-                square.move_to(
-                    np.array(
-                        [
-                            (j - center) * pixel_size,
-                            (center - i) * pixel_size,
-                            0,
-                        ]
-                    )
-                )
-                result_y_squares[(i, j)] = square
-                result_y_grid.add(square)
-
+        # cells start transparent and are revealed one by one below
+        result_y_grid = CellGrid(size, size, cell_size=pixel_size, stroke_color=GRAY, stroke_width=1)
+        result_y_grid.set_fills(ramp_colors(grad_y_normalized / 255.0, BLACK, BLUE), opacity=0.0)
         result_y_grid.shift(RIGHT * 1.5)
-        result_y_grid.set_opacity(0)
         self.add(result_y_grid)
 
         result_y_label = Text("∂I/∂y", font_size=24, color=BLUE).next_to(result_y_grid, UP, buff=0.25)
@@ -534,36 +463,37 @@ class EdgeDetectionScene(Scene):
             run_time=0.5,
         )
 
+        # one "[k]" tag per distinct kernel weight, copied onto each window
+        kernel_tags_y = {
+            v: Text(f"[{v}]", font_size=10, color=BLUE, weight=BOLD)
+            for v in {v for row in sobel_y_values for v in row}
+        }
+
         for i in range(1, size - 1):
             for j in range(1, size - 1):
                 kernel_overlay = VGroup()
                 for di in [-1, 0, 1]:
                     for dj in [-1, 0, 1]:
-                        pos = pixel_squares[(i + di, j + dj)].get_center()
+                        pos = grid.cell_center(i + di, j + dj)
                         kernel_val = sobel_y_values[di + 1][dj + 1]
 
-                        h = pixel_squares[(i + di, j + dj)].copy()
+                        h = grid.cell_square(i + di, j + dj)
                         h.set_stroke(color=BLUE, width=3)
 
-                        kernel_text = Text(
-                            f"[{kernel_val}]",
-                            font_size=10,
-                            color=BLUE,
-                            weight=BOLD,
-                        ).move_to(pos + UP * 0.15)
+                        kernel_text = kernel_tags_y[kernel_val].copy().move_to(pos + UP * 0.15)
 
                         kernel_overlay.add(h, kernel_text)
 
                 self.add(kernel_overlay)
 
                 result_val = int(grad_y[i, j])
-                result_text = Text(
-                    str(result_val),
+                result_text = NumberLabel(
+                    result_val,
                     font_size=12,
                     color=WHITE,
-                ).move_to(result_y_squares[(i, j)].get_center())
+                ).move_to(result_y_grid.cell_center(i, j))
 
-                result_y_squares[(i, j)].set_opacity(1)
+                result_y_grid.set_cell_fill(i, j, opacity=1)
                 self.add(result_text)
                 result_y_texts.add(result_text)
 
@@ -588,7 +518,7 @@ class EdgeDetectionScene(Scene):
             for j in range(1, size - 1):
                 gy_val = grad_y[i, j]
                 if abs(gy_val) > 20:
-                    pos = result_y_squares[(i, j)].get_center()
+                    pos = result_y_grid.cell_center(i, j)
                     mag = gy_val / grad_y_max * 0.8
                     vec = Arrow(
                         start=pos,
@@ -637,7 +567,7 @@ class EdgeDetectionScene(Scene):
             for j in range(1, size - 1):
                 gx_val = grad_x[i, j]
                 if abs(gx_val) > 20:
-                    pos = pixel_squares[(i, j)].get_center()
+                    pos = grid.cell_center(i, j)
                     mag = gx_val / grad_x_max * 0.8
                     vec = Arrow(
                         start=pos,
@@ -664,7 +594,7 @@ class EdgeDetectionScene(Scene):
             for j in range(1, size - 1):
                 gy_val = grad_y[i, j]
                 if abs(gy_val) > 20:
-                    pos = pixel_squares[(i, j)].get_center()
+                    pos = grid.cell_center(i, j)
                     mag = gy_val / grad_y_max * 0.8
                     vec = Arrow(
                         start=pos,
@@ -702,7 +632,7 @@ class EdgeDetectionScene(Scene):
                 magnitude_val = np.sqrt(gx_val**2 + gy_val**2)
 
                 if magnitude_val > 30:
-                    pos = pixel_squares[(i, j)].get_center()
+                    pos = grid.cell_center(i, j)
                     scale = magnitude_val / grad_mag_max * 0.7
                     vec = Arrow(
                         start=pos,
@@ -740,18 +670,7 @@ class EdgeDetectionScene(Scene):
         self.play(FadeOut(gradient_vectors), run_time=0.8)
 
         self.play(
-            *[
-                pixel_squares[(i, j)].animate.set_fill(
-                    interpolate_color(
-                        BLACK,
-                        YELLOW,
-                        magnitude_normalized[i, j] / 255.0,
-                    ),
-                    opacity=1.0,
-                )
-                for i in range(size)
-                for j in range(size)
-            ],
+            grid.animate.set_fills(ramp_colors(magnitude_normalized / 255.0, BLACK, YELLOW)),
             run_time=2.0,
         )
         self.wait(HOLD * 2)
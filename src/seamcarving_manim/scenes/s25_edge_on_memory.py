@@ -1,16 +1,16 @@
 from manim import *
 from pathlib import Path
-from PIL import Image
-import numpy as np
 
+from seamcarving_manim.profiling import ProfiledScene
 from seamcarving_manim.style import H1, caption
+from seamcarving_manim.utils.image_io import load_image
 
 # Resolve project root: .../carving-manim/
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 ASSETS_DIR   = PROJECT_ROOT / "src" / "seamcarving_manim" / "assets" / "images"
 
 
-class EdgeOnMemoryScene(Scene):
+class EdgeOnMemoryScene(ProfiledScene):
     def construct(self):
         self.camera.background_color = BLACK
 
@@ -35,10 +35,12 @@ class EdgeOnMemoryScene(Scene):
         print("  edgeY:", ey_path)
         print("  edgeM:", em_path)
 
-        orig_arr     = np.array(Image.open(orig_path).convert("RGB"), dtype=np.uint8)
-        edge_x_arr   = np.array(Image.open(ex_path).convert("RGB"), dtype=np.uint8)
-        edge_y_arr   = np.array(Image.open(ey_path).convert("RGB"), dtype=np.uint8)
-        edge_mag_arr = np.array(Image.open(em_path).convert("RGB"), dtype=np.uint8)
+        # decoded at the on-screen size for the current quality
+        DISP_H = 4.2
+        orig_arr     = load_image(orig_path, DISP_H)
+        edge_x_arr   = load_image(ex_path, DISP_H)
+        edge_y_arr   = load_image(ey_path, DISP_H)
+        edge_mag_arr = load_image(em_path, DISP_H)
 
         orig    = ImageMobject(orig_arr).set_z_index(100)
         edge_x  = ImageMobject(edge_x_arr).set_z_index(100)
@@ -50,7 +52,6 @@ class EdgeOnMemoryScene(Scene):
             m.set_z_index(100)
 
         # unify sizes
-        DISP_H = 4.2
         for m in [orig, edge_x, edge_y, edge_mag]:
             m.set_height(DISP_H)
 
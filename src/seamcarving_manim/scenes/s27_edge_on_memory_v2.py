@@ -2,7 +2,12 @@ from manim import *
 import numpy as np
 from pathlib import Path
 
+from seamcarving_manim.animations import BlockReveal, GrowArrowField
+from seamcarving_manim.mobjects import GradientArrowField, RevealMask
+from seamcarving_manim.profiling import ProfiledScene
 from seamcarving_manim.style import H1, caption
+from seamcarving_manim.utils.gradient_pyramid import load_pyramid
+from seamcarving_manim.utils.image_io import load_image
 
 # =================== TIMING CONSTANTS ===================
 TITLE_RT         = 0.8
@@ -20,7 +25,11 @@ MAG_CROSSFADE_RT = 2.0
 # =======================================================
 
 
-class MemoryEdgeWalkthroughScene(Scene):
+class MemoryEdgeWalkthroughScene(ProfiledScene):
+    # (columns, rows) of the arrow/block grid; any grid in the pyramid
+    # written by pregen/edge_on_memory_pregen.py
+    GRID = (36, 20)
+
     def construct(self):
         self.camera.background_color = BLACK
 
@@ -44,22 +53,21 @@ class MemoryEdgeWalkthroughScene(Scene):
         sobel_y_path  = EDGES_DIR / "memory_edge_y.png"
         mag_path      = EDGES_DIR / "memory_edge_mag.png"
 
-        gx_small  = np.load(EDGES_DIR / "gx_small.npy")
-        gy_small  = np.load(EDGES_DIR / "gy_small.npy")
-        mag_small = np.load(EDGES_DIR / "mag_small.npy")
-        small_gray = np.load(EDGES_DIR / "small_gray.npy")
+        field = load_pyramid(EDGES_DIR / "gradient_pyramid.npz").level(*self.GRID)
+        gx_small = field["gx"]
+        gy_small = field["gy"]
 
-        Hs, Ws = small_gray.shape  # small grid resolution
+        Hs, Ws = field["gray"].shape  # small grid resolution
 
         # -------------------------------------------------------
-        # Base images (full-res)
+        # Base images (downsampled to on-screen size)
         # -------------------------------------------------------
-        orig = ImageMobject(str(orig_img_path))
-        sobel_x_img = ImageMobject(str(sobel_x_path))
-        sobel_y_img = ImageMobject(str(sobel_y_path))
-        mag_img = ImageMobject(str(mag_path))
-
         DISP_H = 4.5
+        orig = ImageMobject(load_image(orig_img_path, DISP_H))
+        sobel_x_img = ImageMobject(load_image(sobel_x_path, DISP_H))
+        sobel_y_img = ImageMobject(load_image(sobel_y_path, DISP_H))
+        mag_img = ImageMobject(load_image(mag_path, DISP_H))
+
         for m in [orig, sobel_x_img, sobel_y_img, mag_img]:
             m.set_height(DISP_H)
 
@@ -89,28 +97,18 @@ class MemoryEdgeWalkthroughScene(Scene):
             y = y0 - (i + 0.5) * cell_h
             return np.array([x, y, 0.0])
 
-        def build_mask_grid_for_image(image_mob):
-            """Create a Ws x Hs grid of black rectangles over an image."""
-            mask_blocks = {}
-            group = VGroup()
-            w = image_mob.width
-            h = image_mob.height
-            cell_w = w / Ws
-            cell_h = h / Hs
+        def glide(centers, k, t):
+            """Point t of the way from block centers[k-1] to centers[k] (on orig)."""
+            a = cell_center_on_image(orig, *centers[max(k - 1, 0)])
+            b = cell_center_on_image(orig, *centers[k])
+            return a + t * (b - a)
 
-            for i in range(Hs):
-                for j in range(Ws):
-                    r = Rectangle(
-                        width=cell_w,
-                        height=cell_h,
-                        fill_color=BLACK,
-                        fill_opacity=1.0,
-                        stroke_width=0,
-                    )
-                    r.move_to(cell_center_on_image(image_mob, i, j))
-                    mask_blocks[(i, j)] = r
-                    group.add(r)
-            return group, mask_blocks
+        def block_schedule(centers):
+            """Step map for a RevealMask: 3×3 block around centers[k] opens at step k."""
+            steps = np.full((Hs, Ws), -1)
+            for k, (i, j) in enumerate(centers):
+                steps[max(i - 1, 0) : i + 2, max(j - 1, 0) : j + 2] = k
+            return steps
 
         # 3x3 kernel overlay on original (in small-grid coordinates)
         def build_kernel_overlay(color):
@@ -156,42 +154,6 @@ class MemoryEdgeWalkthroughScene(Scene):
             stroke_width=0.5,
         )
 
-        # -------------------------------------------------------
-        # Arrow field helpers (using small gradients)
-        # -------------------------------------------------------
-        def create_arrow_field_on_image(
-            image_mob, gx_arr, gy_arr, color, threshold=0.05, scale=0.45
-        ):
-            arrows = VGroup()
-            mag_arr = np.sqrt(gx_arr**2 + gy_arr**2)
-            maxmag = np.max(mag_arr) or 1.0
-
-            for i in range(Hs):
-                for j in range(Ws):
-                    dvx = gx_arr[i, j]
-                    dvy = gy_arr[i, j]
-                    mag_val = np.sqrt(dvx**2 + dvy**2)
-                    if mag_val < threshold * maxmag:
-                        continue
-
-                    dvx /= maxmag
-                    dvy /= maxmag
-
-                    start = cell_center_on_image(image_mob, i, j)
-                    end = start + np.array([dvx, -dvy, 0.0]) * scale
-                    arrows.add(
-                        Arrow(
-                            start,
-                            end,
-                            buff=0,
-                            stroke_width=1.5,
-                            color=color,
-                            max_tip_length_to_length_ratio=0.3,
-                            max_stroke_width_to_length_ratio=10,
-                        )
-                    )
-            return arrows
-
         # -------------------------------------------------------
         # Title + original
         # -------------------------------------------------------
@@ -213,8 +175,8 @@ class MemoryEdgeWalkthroughScene(Scene):
         # =======================================================
         # Put Sobel-X image on the right, fully masked
         self.add(sobel_x_img)
-        mask_x_group, mask_x_blocks = build_mask_grid_for_image(sobel_x_img)
-        self.add(mask_x_group)
+        mask_x = RevealMask(Hs, Ws, image=sobel_x_img)
+        self.add(mask_x)
 
         self.play(FadeOut(cap, shift=DOWN * 0.1), run_time=0.3)
         cap = caption(
@@ -236,48 +198,36 @@ class MemoryEdgeWalkthroughScene(Scene):
         self.add(v_band, kernel_x)
 
         # Sweep: columns (j) in steps of 3, rows (i) in steps of 3
-        for j in range(1, Ws - 1, 3):
-            col_center = cell_center_on_image(orig, 1, j)
-            self.play(
-                v_band.animate.set_x(col_center[0]),
-                run_time=BLOCK_RT_X,
-                rate_func=linear,
-            )
-            for i in range(1, Hs - 1, 3):
-                block_center = cell_center_on_image(orig, i, j)
-                self.play(
-                    kernel_x.animate.move_to(block_center),
-                    run_time=BLOCK_RT_X,
-                    rate_func=linear,
-                )
-
-                # Reveal corresponding 3×3 block on Sobel-X image
-                blocks_to_reveal = []
-                for di in [-1, 0, 1]:
-                    for dj in [-1, 0, 1]:
-                        ii = i + di
-                        jj = j + dj
-                        if 0 <= ii < Hs and 0 <= jj < Ws:
-                            blocks_to_reveal.append(mask_x_blocks[(ii, jj)])
-
-                if blocks_to_reveal:
-                    self.play(
-                        *[b.animate.set_fill(opacity=0.0) for b in blocks_to_reveal],
-                        run_time=BLOCK_RT_X,
-                    )
+        blocks_x = [(i, j) for j in range(1, Ws - 1, 3) for i in range(1, Hs - 1, 3)]
+
+        # Each block's slot: the kernel (and band) glide over, then it is revealed
+        def follow_block_x(k, t):
+            block_center = glide(blocks_x, k, t)
+            v_band.set_x(block_center[0])
+            kernel_x.move_to(block_center)
+
+        self.play(
+            BlockReveal(
+                mask_x,
+                block_schedule(blocks_x),
+                on_step=follow_block_x,
+                followers=[v_band, kernel_x],
+            ),
+            run_time=2 * BLOCK_RT_X * len(blocks_x),
+        )
 
         self.wait(HOLD)
         self.play(FadeOut(v_band), FadeOut(kernel_x), run_time=0.5)
 
         # Arrow field on Sobel-X image
-        arrows_x = create_arrow_field_on_image(
+        arrows_x = GradientArrowField(
+            gx_small,
+            np.zeros_like(gy_small),  # X component only
             sobel_x_img,
-            gx_arr=gx_small,
-            gy_arr=np.zeros_like(gy_small),  # X component only
             color=GRAD_COLOR_X,
         )
         self.play(
-            LaggedStart(*[GrowArrow(a) for a in arrows_x], lag_ratio=0.004),
+            GrowArrowField(arrows_x, lag_ratio=0.004),
             run_time=ARROWS_RT_X,
         )
         self.wait(HOLD * 1.2)
@@ -288,14 +238,14 @@ class MemoryEdgeWalkthroughScene(Scene):
         self.play(
             FadeOut(arrows_x),
             FadeOut(sobel_x_img),
-            FadeOut(mask_x_group),
+            FadeOut(mask_x),
             FadeOut(cap),
             run_time=0.8,
         )
 
         self.add(sobel_y_img)
-        mask_y_group, mask_y_blocks = build_mask_grid_for_image(sobel_y_img)
-        self.add(mask_y_group)
+        mask_y = RevealMask(Hs, Ws, image=sobel_y_img)
+        self.add(mask_y)
 
         cap = caption(
             "Sobel Y: building horizontal-edge response block by block"
@@ -315,47 +265,35 @@ class MemoryEdgeWalkthroughScene(Scene):
         self.add(h_band, kernel_y)
 
         # Sweep: rows (i) in steps of 3, columns (j) in steps of 3
-        for i in range(1, Hs - 1, 3):
-            row_center = cell_center_on_image(orig, i, 1)
-            self.play(
-                h_band.animate.set_y(row_center[1]),
-                run_time=BLOCK_RT_Y,
-                rate_func=linear,
-            )
-            for j in range(1, Ws - 1, 3):
-                block_center = cell_center_on_image(orig, i, j)
-                self.play(
-                    kernel_y.animate.move_to(block_center),
-                    run_time=BLOCK_RT_Y,
-                    rate_func=linear,
-                )
-
-                blocks_to_reveal = []
-                for di in [-1, 0, 1]:
-                    for dj in [-1, 0, 1]:
-                        ii = i + di
-                        jj = j + dj
-                        if 0 <= ii < Hs and 0 <= jj < Ws:
-                            blocks_to_reveal.append(mask_y_blocks[(ii, jj)])
-
-                if blocks_to_reveal:
-                    self.play(
-                        *[b.animate.set_fill(opacity=0.0) for b in blocks_to_reveal],
-                        run_time=BLOCK_RT_Y,
-                    )
+        blocks_y = [(i, j) for i in range(1, Hs - 1, 3) for j in range(1, Ws - 1, 3)]
+
+        def follow_block_y(k, t):
+            block_center = glide(blocks_y, k, t)
+            h_band.set_y(block_center[1])
+            kernel_y.move_to(block_center)
+
+        self.play(
+            BlockReveal(
+                mask_y,
+                block_schedule(blocks_y),
+                on_step=follow_block_y,
+                followers=[h_band, kernel_y],
+            ),
+            run_time=2 * BLOCK_RT_Y * len(blocks_y),
+        )
 
         self.wait(HOLD)
         self.play(FadeOut(h_band), FadeOut(kernel_y), run_time=0.5)
 
         # Arrow field on Sobel-Y image
-        arrows_y = create_arrow_field_on_image(
+        arrows_y = GradientArrowField(
+            np.zeros_like(gx_small),
+            gy_small,  # Y component only
             sobel_y_img,
-            gx_arr=np.zeros_like(gx_small),
-            gy_arr=gy_small,  # Y component only
             color=GRAD_COLOR_Y,
         )
         self.play(
-            LaggedStart(*[GrowArrow(a) for a in arrows_y], lag_ratio=0.004),
+            GrowArrowField(arrows_y, lag_ratio=0.004),
             run_time=ARROWS_RT_Y,
         )
         self.wait(HOLD * 1.2)
@@ -366,7 +304,7 @@ class MemoryEdgeWalkthroughScene(Scene):
         self.play(
             FadeOut(arrows_y),
             FadeOut(sobel_y_img),
-            FadeOut(mask_y_group),
+            FadeOut(mask_y),
             FadeOut(cap),
             run_time=0.8,
         )
@@ -380,14 +318,14 @@ class MemoryEdgeWalkthroughScene(Scene):
         cap.set_color(GRAD_COLOR_COMB)
         self.play(FadeIn(cap, shift=UP * 0.1), run_time=CAP_RT)
 
-        arrows_comb = create_arrow_field_on_image(
+        arrows_comb = GradientArrowField(
+            gx_small,
+            gy_small,
             orig,
-            gx_arr=gx_small,
-            gy_arr=gy_small,
             color=GRAD_COLOR_COMB,
         )
         self.play(
-            LaggedStart(*[GrowArrow(a) for a in arrows_comb], lag_ratio=0.004),
+            GrowArrowField(arrows_comb, lag_ratio=0.004),
             run_time=ARROWS_RT_COMB,
         )
         self.wait(HOLD * 2)
@@ -1,9 +1,12 @@
 from manim import *
+from seamcarving_manim.animations import PathSweep
+from seamcarving_manim.mobjects import NumberLabel
+from seamcarving_manim.profiling import ProfiledScene
 from seamcarving_manim.style import H1, caption
 import random
 
 
-class EnergyGridSeamsScene(Scene):
+class EnergyGridSeamsScene(ProfiledScene):
     def construct(self):
         self.camera.background_color = BLACK
 
@@ -78,8 +81,9 @@ class EnergyGridSeamsScene(Scene):
                 y = ((n_rows - 1) / 2 - i) * cell_size
                 sq.move_to([x, y, 0])
 
-                txt = Text(
-                    f"{v:.1f}",
+                txt = NumberLabel(
+                    v,
+                    fmt="{:.1f}",
                     font_size=32,
                     color=WHITE if v > 0.35 else GRAY_A,
                 )
@@ -138,7 +142,11 @@ class EnergyGridSeamsScene(Scene):
 
         # Running sum text to the side of the grid
         running_sum = 0.0
-        sum_text = caption(f"Greedy energy = {running_sum:.1f}")
+        greedy_total = sum(values[i][j] for (i, j) in g_path)
+        sum_text = NumberLabel(
+            running_sum, "{:.1f}", prefix="Greedy energy = ", make_text=caption,
+            max_chars=len(f"{greedy_total:.1f}"),
+        )
         sum_text.next_to(grid_group, RIGHT, buff=1.0)
         sum_text.align_to(grid_group, UP)
         self.play(FadeIn(sum_text, shift=LEFT * 0.1), run_time=0.5)
@@ -158,13 +166,9 @@ class EnergyGridSeamsScene(Scene):
             hl.move_to(sq.get_center())
             greedy_highlights.add(hl)
 
-            new_sum = caption(f"Greedy energy = {running_sum:.1f}")
-            new_sum.move_to(sum_text.get_center())
+            sum_text.set_value(running_sum)
 
-            self.play(
-                FadeIn(hl, run_time=GREEDY_STEP_TIME),
-                Transform(sum_text, new_sum),
-            )
+            self.play(FadeIn(hl, run_time=GREEDY_STEP_TIME))
             self.wait(GREEDY_WAIT_TIME)
 
         self.wait(HOLD * 1.2)
@@ -216,11 +220,13 @@ class EnergyGridSeamsScene(Scene):
         best_path = None
 
         # Live text showing number of seams and best energy so far
-        count_text = caption(
-            f"Enumerating seams: 0 / {total_paths}"
+        count_text = NumberLabel(
+            0, f"{{}} / {total_paths}", prefix="Enumerating seams: ", make_text=caption,
+            max_chars=len(f"{total_paths}/{total_paths}"),
         ).next_to(sum_text, DOWN, buff=0.2)
-        best_text = caption(
-            "Best energy so far = –"
+        best_text = NumberLabel(
+            "–", "{:.1f}", prefix="Best energy so far = ", make_text=caption,
+            max_chars=max(len(f"{path_cost(p):.1f}") for p in paths),
         ).next_to(count_text, DOWN, buff=0.15)
         self.play(
             FadeIn(count_text, shift=UP * 0.1),
@@ -242,34 +248,38 @@ class EnergyGridSeamsScene(Scene):
                 g.add(box)
             return g
 
-        # Fast sweep through all seams in tree (DFS) order
-        for idx, path in enumerate(paths):
+        # Colors and running best for every seam in tree (DFS) order:
+        # purple by default, yellow when it improves on the best so far
+        seam_colors = []
+        best_so_far = []
+        for path in paths:
             seam_cost = path_cost(path)
-
-            # Default seam color: purple; highlight if it's the best so far
             seam_color = PURPLE
             if seam_cost < best_cost:
                 best_cost = seam_cost
                 best_path = list(path)
                 seam_color = YELLOW
+            seam_colors.append(seam_color)
+            best_so_far.append(best_cost)
 
-            seam = make_seam_boxes(path, color=seam_color)
-
-            new_count = caption(
-                f"Enumerating seams: {idx+1} / {total_paths}"
-            )
-            new_count.move_to(count_text.get_center())
-
-            new_best = caption(f"Best energy so far = {best_cost:.1f}")
-            new_best.move_to(best_text.get_center())
+        def show_counts(idx):
+            count_text.set_value(idx + 1)
+            best_text.set_value(best_so_far[idx])
 
-            self.play(
-                FadeIn(seam),
-                Transform(count_text, new_count),
-                Transform(best_text, new_best),
-                run_time=BRUTE_FORCE_IN_TIME,
-            )
-            self.play(FadeOut(seam), run_time=BRUTE_FORCE_OUT_TIME)
+        # Fast sweep through all seams in one animation, reusing one box per row
+        box_pool = VGroup(*[cell_squares[(0, 0)].copy() for _ in range(n_rows)])
+        self.play(
+            PathSweep(
+                box_pool,
+                paths,
+                cell_centers,
+                seam_colors,
+                on_path=show_counts,
+                counters=[count_text, best_text],
+                visible_fraction=BRUTE_FORCE_IN_TIME / (BRUTE_FORCE_IN_TIME + BRUTE_FORCE_OUT_TIME),
+            ),
+            run_time=total_paths * (BRUTE_FORCE_IN_TIME + BRUTE_FORCE_OUT_TIME),
+        )
 
         self.wait(HOLD)
 
@@ -379,7 +389,7 @@ class EnergyGridSeamsScene(Scene):
         # --- Bottom row with orange gradient ---
         for j in range(n_cols):
             val = dp[n_rows - 1][j]
-            txt = Text(f"{val:.1f}", font_size=28, color=YELLOW)
+            txt = NumberLabel(val, "{:.1f}", font_size=28, color=YELLOW)
             txt.move_to(dp_squares[(n_rows - 1, j)].get_center())
             dp_texts[(n_rows - 1, j)] = txt
 
@@ -486,7 +496,7 @@ class EnergyGridSeamsScene(Scene):
             )
 
             # Replace with final DP text and orange gradient fill
-            txt = Text(f"{val:.1f}", font_size=28, color=YELLOW)
+            txt = NumberLabel(val, "{:.1f}", font_size=28, color=YELLOW)
             txt.move_to(dp_squares[(i, j)].get_center())
             dp_texts[(i, j)] = txt
 
@@ -515,7 +525,7 @@ class EnergyGridSeamsScene(Scene):
         # Fill the rest of the second-to-last row quickly, with the same orange gradient logic
         for j in range(2, n_cols):
             val = dp[row_i][j]
-            txt = Text(f"{val:.1f}", font_size=28, color=YELLOW)
+            txt = NumberLabel(val, "{:.1f}", font_size=28, color=YELLOW)
             txt.move_to(dp_squares[(row_i, j)].get_center())
             dp_texts[(row_i, j)] = txt
 
@@ -535,7 +545,7 @@ class EnergyGridSeamsScene(Scene):
         for i in range(n_rows - 3, -1, -1):
             for j in range(n_cols):
                 val = dp[i][j]
-                txt = Text(f"{val:.1f}", font_size=28, color=YELLOW)
+                txt = NumberLabel(val, "{:.1f}", font_size=28, color=YELLOW)
                 txt.move_to(dp_squares[(i, j)].get_center())
                 dp_texts[(i, j)] = txt
 
@@ -1,9 +1,11 @@
 from manim import *
+from seamcarving_manim.profiling import ProfiledScene
 from seamcarving_manim.style import H1, caption
+from seamcarving_manim.utils.image_io import load_image
 from pathlib import Path
 
 
-class MemoryMinEnergyBottomScene(Scene):
+class MemoryMinEnergyBottomScene(ProfiledScene):
     def construct(self):
         self.camera.background_color = BLACK
 
@@ -53,9 +55,14 @@ class MemoryMinEnergyBottomScene(Scene):
         edge_path = base_dir / "memory_edges" / "memory_edge_mag.png"
         dp_path   = base_dir / "min_energy_bottom" / "memory_min_energy_bottom.png"
 
-        orig_img = ImageMobject(str(orig_path))
-        edge_img = ImageMobject(str(edge_path))
-        dp_img   = ImageMobject(str(dp_path))
+        # decoded once; the side-by-side view below reuses the same arrays
+        orig_arr = load_image(orig_path, 5.0)
+        edge_arr = load_image(edge_path, 5.0)
+        dp_arr   = load_image(dp_path, 5.0)
+
+        orig_img = ImageMobject(orig_arr)
+        edge_img = ImageMobject(edge_arr)
+        dp_img   = ImageMobject(dp_arr)
 
         for im in [orig_img, edge_img, dp_img]:
             im.height = 5.0
@@ -87,9 +94,9 @@ class MemoryMinEnergyBottomScene(Scene):
         # --------------------------------------------------
         # Final view: all three side by side
         # --------------------------------------------------
-        orig_small = ImageMobject(str(orig_path))
-        edge_small = ImageMobject(str(edge_path))
-        dp_small   = ImageMobject(str(dp_path))
+        orig_small = ImageMobject(orig_arr)
+        edge_small = ImageMobject(edge_arr)
+        dp_small   = ImageMobject(dp_arr)
 
         for im in [orig_small, edge_small, dp_small]:
             im.height = 3.0
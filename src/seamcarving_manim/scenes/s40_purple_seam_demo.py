@@ -1,11 +1,13 @@
 from manim import *
+from seamcarving_manim.animations import FrameSequencePlayback
+from seamcarving_manim.mobjects import FrameImage
+from seamcarving_manim.profiling import ProfiledScene
 from seamcarving_manim.style import H1, caption
+from seamcarving_manim.utils.frame_sequence import open_frames
 from pathlib import Path
-import numpy as np
-from PIL import Image
 
 
-class DualSeamCarvingScene(Scene):
+class DualSeamCarvingScene(ProfiledScene):
     def construct(self):
         self.camera.background_color = "#0a0a0a"
 
@@ -57,22 +59,16 @@ class DualSeamCarvingScene(Scene):
         orig_dir = frames_root / "orig"
         dp_dir   = frames_root / "dp"
 
-        orig_files = sorted(orig_dir.glob("frame_*.png"))
-        dp_files   = sorted(dp_dir.glob("frame_*.png"))
-
-        if not orig_files or not dp_files:
+        try:
+            # memory_dual/{orig,dp}.frames packs if present, else the PNG
+            # folders (decoded on demand with read-ahead)
+            orig_frames = open_frames(orig_dir)
+            dp_frames   = open_frames(dp_dir)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Did not find frames in:\n{orig_dir}\n{dp_dir}\n"
             )
 
-        # Preload arrays (avoids disk hit per frame)
-        orig_frames = [
-            np.array(Image.open(f).convert("RGB"), dtype=np.uint8) for f in orig_files
-        ]
-        dp_frames = [
-            np.array(Image.open(f).convert("RGB"), dtype=np.uint8) for f in dp_files
-        ]
-
         # Use the minimum count in case of any mismatch
         num_frames = min(len(orig_frames), len(dp_frames))
         if num_frames == 0:
@@ -80,16 +76,13 @@ class DualSeamCarvingScene(Scene):
 
         # ---------------- Initial stacked display ----------------
         # IMPORTANT: orange DP map on TOP, original on BOTTOM
-        dp_img   = ImageMobject(dp_frames[0]).set_height(DISP_H)
-        orig_img = ImageMobject(orig_frames[0]).set_height(DISP_H)
+        dp_img   = FrameImage(dp_frames[0]).set_height(DISP_H)
+        orig_img = FrameImage(orig_frames[0]).set_height(DISP_H)
 
         pair = Group(dp_img, orig_img).arrange(DOWN, buff=0.5)
         pair.move_to(ORIGIN)
 
-        # Compute anchors so images always shrink from the RIGHT within fixed frames
-        dp_left   = dp_img.get_left()[0]
-        dp_center = dp_img.get_center()
-        orig_left   = orig_img.get_left()[0]
+        dp_center   = dp_img.get_center()
         orig_center = orig_img.get_center()
 
         initial_width = dp_img.width  # same for both
@@ -141,34 +134,14 @@ class DualSeamCarvingScene(Scene):
 
         dt = CARVE_TIME / num_frames  # time per step (now slower)
 
-        # We'll keep frames + labels, just swap the images inside and
-        # always anchor them to the same left edge so they shrink from the right.
-        for k in range(1, num_frames):
-            new_dp   = ImageMobject(dp_frames[k]).set_height(DISP_H)
-            new_orig = ImageMobject(orig_frames[k]).set_height(DISP_H)
-
-            # Anchor DP image to fixed left edge and center-y
-            new_dp.move_to([
-                dp_left + new_dp.width / 2.0,
-                dp_center[1],
-                0,
-            ])
-
-            # Anchor original image likewise
-            new_orig.move_to([
-                orig_left + new_orig.width / 2.0,
-                orig_center[1],
-                0,
-            ])
-
-            # Replace old images with new ones (frames & labels stay put)
-            self.remove(dp_img, orig_img)
-            self.add(new_dp, new_orig)
-
-            dp_img = new_dp
-            orig_img = new_orig
-
-            self.wait(dt)
+        # Both views play in one animation; frames + labels stay put and the
+        # images are anchored to their left edge so they shrink from the right.
+        if num_frames > 1:
+            self.play(
+                FrameSequencePlayback(dp_img, dp_frames, start=1, end=num_frames),
+                FrameSequencePlayback(orig_img, orig_frames, start=1, end=num_frames),
+                run_time=dt * (num_frames - 1),
+            )
 
         self.wait(HOLD_AFTER)
 
@@ -3,6 +3,11 @@ import numpy as np
 from PIL import Image
 from pathlib import Path
 
+from seamcarving_manim.animations import FrameSequencePlayback
+from seamcarving_manim.mobjects import FrameImage
+from seamcarving_manim.profiling import ProfiledScene
+from seamcarving_manim.utils.frame_sequence import open_frames
+
 # Import style if available, otherwise define locally
 try:
     from seamcarving_manim.style import H1, caption
@@ -14,7 +19,7 @@ except ImportError:
         return Text(text, font_size=24, color=GRAY_B)
 
 
-class FailureModesScene(Scene):
+class FailureModesScene(ProfiledScene):
     """
     Scene showing why naive approaches fail and seam carving succeeds.
     Animates through frames like DualSeamCarvingScene for each strategy.
@@ -45,15 +50,8 @@ class FailureModesScene(Scene):
         )
         
         def load_frames(subdir):
-            """Load all frames from a subdirectory."""
-            frame_dir = frames_root / subdir
-            frame_files = sorted(frame_dir.glob("frame_*.png"))
-            if not frame_files:
-                raise FileNotFoundError(f"No frames in {frame_dir}")
-            return [
-                np.array(Image.open(f).convert("RGB"), dtype=np.uint8)
-                for f in frame_files
-            ]
+            """Frames from <subdir>.frames, or lazily decoded PNGs in <subdir>/."""
+            return open_frames(frames_root / subdir)
         
         # Load all strategy frames
         column_frames = load_frames("column")
@@ -97,12 +95,9 @@ class FailureModesScene(Scene):
             dt = anim_time / num_frames
             
             # Create initial image
-            img = ImageMobject(frames[0]).set_height(DISP_H)
+            img = FrameImage(frames[0]).set_height(DISP_H)
             img.move_to(ORIGIN)
             
-            # Compute anchor for left-aligned shrinking
-            img_left = img.get_left()[0]
-            img_center_y = img.get_center()[1]
             initial_width = img.width
             
             # Frame rectangle
@@ -131,22 +126,12 @@ class FailureModesScene(Scene):
                 run_time=0.8,
             )
             
-            # Animate through frames
-            for k in range(1, num_frames):
-                new_img = ImageMobject(frames[k]).set_height(DISP_H)
-                
-                # Anchor to fixed left edge
-                new_img.move_to([
-                    img_left + new_img.width / 2.0,
-                    img_center_y,
-                    0,
-                ])
-                
-                self.remove(img)
-                self.add(new_img)
-                img = new_img
-                
-                self.wait(dt)
+            # Animate through frames, shrinking from the right
+            if num_frames > 1:
+                self.play(
+                    FrameSequencePlayback(img, frames, start=1),
+                    run_time=dt * (num_frames - 1),
+                )
             
             return img, frame_rect, frame_glow, label
         
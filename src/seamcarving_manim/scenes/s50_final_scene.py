@@ -1,5 +1,6 @@
 from manim import *
 from pathlib import Path
+from seamcarving_manim.profiling import ProfiledScene
 
 try:
     from seamcarving_manim.style import H1, caption
@@ -8,7 +9,7 @@ except:
     def caption(t): return Text(t, font_size=26, color=GRAY_B)
 
 
-class FinalCreditsScene(Scene):
+class FinalCreditsScene(ProfiledScene):
     def construct(self):
         self.camera.background_color = "#0a0a0a"
 
@@ -1,14 +1,59 @@
 from manim import *
+from collections import OrderedDict
 
 ACCENT = YELLOW  # shared accent color
 
-def H1(txt: str):
+# Building a Text runs Pango and parses the resulting SVG. Scenes ask for
+# the same headings and captions over and over (s30 builds two captions
+# per enumerated path), so each (style, text) is built once and callers
+# get copies of the cached template.
+TEMPLATE_CACHE_SIZE = 512
+
+_templates = OrderedDict()   # (style, text) -> Text, LRU order
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _styled(style, txt, build):
+    key = (style, txt)
+    tpl = _templates.get(key)
+    if tpl is None:
+        _stats["misses"] += 1
+        tpl = build(txt)
+        _templates[key] = tpl
+        if len(_templates) > TEMPLATE_CACHE_SIZE:
+            _templates.popitem(last=False)
+            _stats["evictions"] += 1
+    else:
+        _stats["hits"] += 1
+        _templates.move_to_end(key)
+    return tpl.copy()
+
+
+def style_cache_info():
+    """Hit/miss/eviction counters and current size of the template cache."""
+    return dict(_stats, size=len(_templates))
+
+
+def clear_style_cache():
+    _templates.clear()
+
+
+def _h1(txt):
     return Text(txt, weight=BOLD).scale(0.9)
 
-def H2(txt: str):
+def _h2(txt):
     return Text(txt).scale(0.6)
 
-def caption(txt: str):
+def _caption(txt):
     t = Text(txt).scale(0.45)
     t.set_opacity(0.8)
-    return t
\ No newline at end of file
+    return t
+
+def H1(txt: str):
+    return _styled("H1", txt, _h1)
+
+def H2(txt: str):
+    return _styled("H2", txt, _h2)
+
+def caption(txt: str):
+    return _styled("caption", txt, _caption)
@@ -0,0 +1,108 @@
+"""
+Lookup-table colorization for the edge, energy and DP visualizations.
+
+The pregen scripts used to colorize float maps step by step: normalize,
+mask out tiny values, apply a gamma and a floor, clip, then fill the
+three channels one at a time. Each step is a full pass over a 2000x1446
+map (plus temporaries). Here the map is quantized once to an integer
+index (uint8 for 256 levels, uint16 for up to 65536) and a precomputed
+(levels, 3) uint8 RGB table is applied with a single take():
+
+    lut = tint_lut(LIGHT_RED, levels=65536, gamma=0.45, floor=90, clip_low=10)
+    rgb = colorize(gx, lut, absolute=True)        # (H, W, 3) uint8
+
+Gamma, floor and the low clip only change table entries, so they cost
+nothing per pixel. 256 levels reproduce maps that were already
+truncated to uint8 (e.g. failure_pregen's energy map) exactly; 65536
+keep the gamma curve smooth near black. scale_lut() sizes its table so
+a plain `n * color` tint comes out exactly as well.
+"""
+
+import math
+
+import numpy as np
+
+
+def index_dtype(levels):
+    if not 2 <= levels <= 65536:
+        raise ValueError(f"levels must be in [2, 65536], got {levels}")
+    return np.uint8 if levels <= 256 else np.uint16
+
+
+def quantize(values, levels=256, vmax=None, absolute=False):
+    """
+    values / vmax -> LUT index in [0, levels - 1], truncated like
+    astype(np.uint8). vmax defaults to the maximum of the (absolute)
+    values; negative values map to 0 unless `absolute`.
+    """
+    a = np.abs(values) if absolute else np.maximum(values, 0)
+    a = np.array(a, dtype=np.float64)
+    if vmax is None:
+        vmax = float(a.max()) if a.size else 0.0
+    dtype = index_dtype(levels)
+    if vmax <= 0:
+        return np.zeros(a.shape, dtype=dtype)
+    a /= vmax
+    a *= levels - 1
+    np.clip(a, 0, levels - 1, out=a)
+    return a.astype(dtype)
+
+
+def apply_lut(lut, index):
+    """(levels, 3) uint8 table + integer index map -> (H, W, 3) uint8 image."""
+    return lut.take(index, axis=0)
+
+
+def colorize(values, lut, vmax=None, absolute=False):
+    """Quantize `values` to len(lut) levels and look them up in `lut`."""
+    return apply_lut(lut, quantize(values, len(lut), vmax, absolute))
+
+
+# ==========================================================
+# Tables
+# ==========================================================
+def _levels(levels):
+    index_dtype(levels)
+    return np.arange(levels, dtype=np.float64) / (levels - 1)
+
+
+def tint_lut(color, levels=256, gamma=1.0, floor=0, clip_low=0):
+    """
+    Black -> `color`. The intensity of a normalized value n is
+
+        0                                   if n == 0 or n < clip_low / 255
+        floor + (255 - floor) * n ** gamma  otherwise
+
+    truncated to an integer like the edge pregens' norm255, and the
+    entry is intensity / 255 * color, truncated. The background stays
+    pure black.
+    """
+    n = _levels(levels)
+    v = floor + (255 - floor) * n ** gamma
+    v[(n == 0) | (n < clip_low / 255.0)] = 0.0
+    v = np.floor(np.clip(v, 0, 255))
+    v /= 255.0
+    return (v[:, None] * np.asarray(color, dtype=np.float64)[None, :]).astype(np.uint8)
+
+
+def scale_lut(color):
+    """
+    Black -> integer RGB `color`, reproducing (n * color).astype(np.uint8)
+    exactly. With L = lcm of the nonzero channels the table has L + 1
+    levels, and floor(n * c) == floor(n * L) // (L // c) for every channel
+    c, so no pixel is off by one at a level boundary.
+    """
+    color = [int(c) for c in color]
+    span = math.lcm(*(c for c in color if c)) if any(color) else 1
+    index_dtype(span + 1)
+    index = np.arange(span + 1)
+    return np.stack([index // (span // c) if c else np.zeros_like(index) for c in color],
+                    axis=-1).astype(np.uint8)
+
+
+def ramp_lut(start, end, levels=256):
+    """Linear ramp from RGB `start` (value 0) to `end` (value vmax), rounded."""
+    t = _levels(levels)[:, None]
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    return np.rint(start * (1 - t) + end * t).astype(np.uint8)
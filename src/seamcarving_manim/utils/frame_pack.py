@@ -0,0 +1,313 @@
+"""
+Packed frame-sequence container (*.frames).
+
+All frames of a sequence live in one file as raw uint8 pixels, each
+padded on the right to the widest frame, so the whole pixel block can be
+memory-mapped as a (count, height, max_width, channels) array. Producers
+append frames as they are computed; scenes get zero-copy views.
+
+Layout (little endian):
+
+    header   32 bytes   magic, version, kind, count, height, max_width,
+                        channels, widths_offset
+    data     count * height * max_width * channels bytes
+    widths   count * uint32 (true width of each frame)
+
+The widths table sits after the data so a writer never has to know the
+frame count up front; the header is patched on close. Writers build the
+file as <name>.tmp and only rename it onto <name> in close(), so an
+interrupted run never leaves a half-written pack under the real name.
+
+Seam-carving sequences where each frame is the previous one minus a
+single seam can instead be stored delta-encoded (kind = KIND_SEAMS):
+
+    header   32 bytes   as above, count = number of seams, max_width = W,
+                        widths_offset -> start of the seam journal
+    key      height * W * channels bytes (the uncarved image)
+    journal  count * height * uint32 (seam k as ORIGINAL column indices)
+    marker   4 bytes: has_marker, r, g, b
+
+Frame k is the keyframe after removing seams 0..k-1, with seam k painted
+in the marker color. That is O(H*W + N*H) bytes instead of O(N*H*W).
+"""
+
+import os
+import struct
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b"SCFRAMES"
+VERSION = 1
+KIND_RAW = 0
+KIND_SEAMS = 1
+
+_HEADER = struct.Struct("<8sHHIIIII")   # 32 bytes
+HEADER_SIZE = _HEADER.size
+
+
+def _read_header(f):
+    raw = f.read(HEADER_SIZE)
+    if len(raw) != HEADER_SIZE:
+        raise ValueError("Truncated frame pack header")
+    magic, version, kind, count, height, max_width, channels, widths_offset = _HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError("Not a frame pack (bad magic)")
+    if version != VERSION:
+        raise ValueError(f"Unsupported frame pack version {version}")
+    return dict(
+        kind=kind,
+        count=count,
+        height=height,
+        max_width=max_width,
+        channels=channels,
+        widths_offset=widths_offset,
+    )
+
+
+def _temp_path(path):
+    return path.with_name(path.name + ".tmp")
+
+
+class _AtomicWriter(ABC):
+    """Writes to <path>.tmp; close() finishes the file and renames it onto path."""
+
+    def _open(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = _temp_path(self.path)
+        self._f = open(self._tmp, "wb")
+        self._f.write(b"\0" * HEADER_SIZE)   # patched in close()
+
+    @abstractmethod
+    def _finish(self):
+        """Write the trailer and the real header (the file is still open)."""
+
+    def close(self):
+        if self._f is None:
+            return
+        self._finish()
+        self._f.close()
+        self._f = None
+        os.replace(self._tmp, self.path)
+
+    def discard(self):
+        """Drop the partial file; the previous pack at path (if any) is kept."""
+        if self._f is None:
+            return
+        self._f.close()
+        self._f = None
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class PackWriter(_AtomicWriter):
+    """Stream frames of a fixed height into a .frames file."""
+
+    def __init__(self, path, height, max_width, channels=3):
+        self.height = height
+        self.max_width = max_width
+        self.channels = channels
+        self.widths = []
+
+        self._open(path)
+        self._pad = np.zeros((height, max_width, channels), dtype=np.uint8)
+
+    def append(self, frame):
+        frame = np.asarray(frame, dtype=np.uint8)
+        if frame.ndim == 2:
+            frame = frame[..., None]
+        h, w, c = frame.shape
+        if h != self.height or c != self.channels or w > self.max_width:
+            raise ValueError(
+                f"Frame {frame.shape} does not fit pack "
+                f"({self.height}, <= {self.max_width}, {self.channels})"
+            )
+        if w == self.max_width:
+            self._f.write(np.ascontiguousarray(frame).tobytes())
+        else:
+            self._pad[:, :w] = frame
+            self._pad[:, w:] = 0
+            self._f.write(self._pad.tobytes())
+        self.widths.append(w)
+
+    def _finish(self):
+        widths_offset = self._f.tell()
+        self._f.write(np.asarray(self.widths, dtype="<u4").tobytes())
+        self._f.seek(0)
+        self._f.write(_HEADER.pack(
+            MAGIC, VERSION, KIND_RAW, len(self.widths),
+            self.height, self.max_width, self.channels, widths_offset,
+        ))
+
+
+class SeamJournalWriter(_AtomicWriter):
+    """Stream a keyframe plus one seam per frame into a delta-encoded .frames file."""
+
+    def __init__(self, path, keyframe, marker=None):
+        keyframe = np.asarray(keyframe, dtype=np.uint8)
+        if keyframe.ndim == 2:
+            keyframe = keyframe[..., None]
+        self.height, self.width, self.channels = keyframe.shape
+        self.marker = None if marker is None else np.asarray(marker, dtype=np.uint8)
+        self.count = 0
+
+        self._open(path)
+        self._f.write(np.ascontiguousarray(keyframe).tobytes())
+        self._journal_offset = self._f.tell()
+
+    def append(self, seam_cols):
+        """Add the next seam, given as one ORIGINAL column index per row."""
+        seam_cols = np.asarray(seam_cols)
+        if seam_cols.shape != (self.height,):
+            raise ValueError(f"Seam must have {self.height} entries, got {seam_cols.shape}")
+        self._f.write(seam_cols.astype("<u4").tobytes())
+        self.count += 1
+
+    def _finish(self):
+        marker = bytes(4) if self.marker is None else bytes([1, *self.marker[:3].tolist()])
+        self._f.write(marker)
+        self._f.seek(0)
+        self._f.write(_HEADER.pack(
+            MAGIC, VERSION, KIND_SEAMS, self.count,
+            self.height, self.width, self.channels, self._journal_offset,
+        ))
+
+
+class SeamJournalFrames:
+    """Frames of a delta-encoded .frames file, rebuilt on the fly by seam replay."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            info = _read_header(f)
+            if info["kind"] != KIND_SEAMS:
+                raise ValueError(f"Not a seam-journal pack (kind {info['kind']})")
+            n, h = info["count"], info["height"]
+            f.seek(info["widths_offset"])
+            self.journal = np.frombuffer(f.read(4 * n * h), dtype="<u4").reshape(n, h)
+            marker = f.read(4)
+
+        self.height = h
+        self.max_width = info["max_width"]
+        self.channels = info["channels"]
+        self.marker = np.frombuffer(marker[1:], dtype=np.uint8) if marker[0] else None
+        self.widths = self.max_width - np.arange(n)
+        self._key = np.memmap(
+            self.path, dtype=np.uint8, mode="r", offset=HEADER_SIZE,
+            shape=(h, self.max_width, self.channels),
+        )
+        self._step = None
+        self._pixels = None
+
+    @property
+    def removal_step(self):
+        """(H, W) map: index of the seam that removes each original pixel (N if never)."""
+        if self._step is None:
+            n = len(self.journal)
+            step = np.full((self.height, self.max_width), n, dtype=np.int32)
+            step[np.arange(self.height)[None, :], self.journal] = np.arange(n, dtype=np.int32)[:, None]
+            self._step = step
+        return self._step
+
+    def _packed_pixels(self):
+        # One uint32 per pixel: a boolean gather over 4-byte items is an
+        # order of magnitude faster than over (H, W, 3) uint8.
+        if self._pixels is None:
+            px = np.zeros((self.height, self.max_width, 4), dtype=np.uint8)
+            px[..., : self.channels] = self._key
+            self._pixels = px.view(np.uint32)[..., 0]
+            if self.marker is not None:
+                mark = np.zeros(4, dtype=np.uint8)
+                mark[: self.channels] = self.marker[: self.channels]
+                self._mark = mark.view(np.uint32)[0]
+        return self._pixels
+
+    def __len__(self):
+        return len(self.journal)
+
+    def __getitem__(self, k):
+        n = len(self.journal)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError(k)
+        step = self.removal_step
+        keep = step >= k                   # pixels still present in frame k
+        w = self.max_width - k
+        frame = self._packed_pixels()[keep].reshape(self.height, w)
+        if self.marker is not None:
+            frame[step[keep].reshape(self.height, w) == k] = self._mark
+        return frame.view(np.uint8).reshape(self.height, w, 4)[..., : self.channels]
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+    def size(self, k):
+        return int(self.widths[k]), self.height
+
+
+class PackedFrames:
+    """Read-only, memory-mapped view of a .frames file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            info = _read_header(f)
+            if info["kind"] != KIND_RAW:
+                raise ValueError(f"Unknown frame pack kind {info['kind']}")
+            f.seek(info["widths_offset"])
+            self.widths = np.frombuffer(f.read(4 * info["count"]), dtype="<u4").astype(int)
+
+        self.height = info["height"]
+        self.max_width = info["max_width"]
+        self.channels = info["channels"]
+        shape = (info["count"], self.height, self.max_width, self.channels)
+        self._data = np.memmap(self.path, dtype=np.uint8, mode="r", offset=HEADER_SIZE, shape=shape)
+
+    def __len__(self):
+        return len(self.widths)
+
+    def __getitem__(self, i):
+        """Frame i as a zero-copy (height, width, channels) view."""
+        return self._data[i, :, : self.widths[i]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def size(self, i):
+        return int(self.widths[i]), self.height
+
+
+def open_pack(path):
+    """PackedFrames or SeamJournalFrames, depending on the file's kind."""
+    with open(path, "rb") as f:
+        kind = _read_header(f)["kind"]
+    if kind == KIND_SEAMS:
+        return SeamJournalFrames(path)
+    return PackedFrames(path)
+
+
+def write_pack(path, frames):
+    """Write an iterable of equal-height frames; returns the frame count."""
+    frames = iter(frames)
+    first = np.asarray(next(frames), dtype=np.uint8)
+    channels = 1 if first.ndim == 2 else first.shape[2]
+    # Carving only ever shrinks, so the first frame is the widest. Callers
+    # with growing sequences should use PackWriter with an explicit width.
+    with PackWriter(path, first.shape[0], first.shape[1], channels) as w:
+        w.append(first)
+        for frame in frames:
+            w.append(frame)
+    return len(w.widths)
@@ -0,0 +1,198 @@
+"""
+Lazy access to a pre-generated sequence of frames.
+
+Scenes used to decode every frame_*.png into memory before the first
+play() call. FrameSequence only reads image headers up front; pixels are
+decoded on demand. A background thread decodes the next few frames
+ahead of playback, and a small LRU keeps recently used frames, so memory
+use stays flat no matter how many frames are on disk.
+"""
+
+import queue
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from seamcarving_manim.utils.frame_pack import PackWriter, open_pack
+from seamcarving_manim.utils.image_io import decode_image
+
+
+class FrameSequence:
+    """
+    Sequence of RGB uint8 frames decoded on demand from image files.
+
+    With `max_height` taller frames are downsampled while decoding (see
+    image_io.display_pixel_height for the on-screen size of a scene).
+    """
+
+    def __init__(self, paths, cache_size=16, prefetch=8, mode="RGB", max_height=None):
+        self.paths = [Path(p) for p in paths]
+        if not self.paths:
+            raise FileNotFoundError("FrameSequence needs at least one frame")
+        self.mode = mode
+        self.max_height = max_height
+        self.cache_size = max(cache_size, prefetch + 1)
+        self.prefetch = prefetch
+
+        self._cache = OrderedDict()     # index -> decoded array, LRU order
+        self._pending = set()           # indices queued for the worker
+        self._cond = threading.Condition()
+        self._queue = queue.Queue(maxsize=max(prefetch, 1))
+        self._thread = None
+
+    @classmethod
+    def from_dir(cls, directory, pattern="frame_*.png", **kwargs):
+        directory = Path(directory)
+        paths = sorted(directory.glob(pattern))
+        if not paths:
+            raise FileNotFoundError(f"No frames matching {pattern} in {directory}")
+        return cls(paths, **kwargs)
+
+    # ------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, i):
+        n = len(self.paths)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+
+        with self._cond:
+            while i in self._pending and i not in self._cache:
+                self._cond.wait()
+            frame = self._cache.get(i)
+            if frame is not None:
+                self._cache.move_to_end(i)
+
+        if frame is None:
+            frame = self._decode(i)
+            self._store(i, frame)
+
+        self._schedule(range(i + 1, min(i + 1 + self.prefetch, n)))
+        return frame
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def size(self, i):
+        """(width, height) of frame i, read from the file header only."""
+        with Image.open(self.paths[i]) as im:
+            w, h = im.size
+        if self.max_height is not None and h > self.max_height:
+            return max(1, round(w * self.max_height / h)), self.max_height
+        return w, h
+
+    # ------------------------------------------------------
+    # Decoding + prefetch
+    # ------------------------------------------------------
+    def _decode(self, i):
+        return decode_image(self.paths[i], self.mode, self.max_height)
+
+    def _store(self, i, frame):
+        with self._cond:
+            self._cache[i] = frame
+            self._cache.move_to_end(i)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            self._cond.notify_all()
+
+    def _schedule(self, indices):
+        if self.prefetch <= 0:
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+        with self._cond:
+            for j in indices:
+                if j in self._cache or j in self._pending:
+                    continue
+                try:
+                    self._queue.put_nowait(j)
+                except queue.Full:
+                    break
+                self._pending.add(j)
+
+    def _worker(self):
+        while True:
+            j = self._queue.get()
+            if j is None:
+                return
+            try:
+                self._store(j, self._decode(j))
+            except Exception:
+                pass  # the caller decodes synchronously and sees the error
+            finally:
+                with self._cond:
+                    self._pending.discard(j)
+                    self._cond.notify_all()
+
+    def close(self):
+        """Stop the prefetch thread and drop cached frames."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        with self._cond:
+            self._cache.clear()
+
+
+def open_frames(directory, pattern="frame_*.png", **kwargs):
+    """
+    Frames stored either as a packed `<directory>.frames` file (preferred)
+    or as individual image files inside `directory`.
+    """
+    pack = Path(directory).with_suffix(".frames")
+    if pack.exists():
+        return open_pack(pack)
+    return FrameSequence.from_dir(directory, pattern, **kwargs)
+
+
+class FrameDirWriter:
+    """Writes frame_0000.png, frame_0001.png, ... into a directory."""
+
+    def __init__(self, directory, suffix=".png", **save_kwargs):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.suffix = suffix
+        self.save_kwargs = save_kwargs
+        self.count = 0
+
+    def append(self, frame):
+        path = self.directory / f"frame_{self.count:04d}{self.suffix}"
+        Image.fromarray(np.asarray(frame, dtype=np.uint8)).save(path, **self.save_kwargs)
+        self.count += 1
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_writer(directory, fmt, height, max_width, channels=3, sink=None, **save_kwargs):
+    """
+    Counterpart of open_frames: "pack" -> <directory>.frames, "png" -> directory/.
+    PNG frames are encoded in the background if a FrameSink is given;
+    `save_kwargs` (e.g. compress_level) apply to every PNG. Writing PNGs
+    deletes a <directory>.frames left by an earlier pack run, since
+    open_frames would otherwise keep loading it.
+    """
+    if fmt == "png":
+        Path(directory).with_suffix(".frames").unlink(missing_ok=True)
+        if sink is not None:
+            return sink.output(directory, **save_kwargs)
+        return FrameDirWriter(directory, **save_kwargs)
+    if fmt == "pack":
+        return PackWriter(Path(directory).with_suffix(".frames"), height, max_width, channels)
+    raise ValueError(f"Unknown frame format: {fmt}")
@@ -0,0 +1,149 @@
+"""
+Background image encoding for the pregen scripts.
+
+Saving a PNG/JPEG inside the carving loop stalls the loop on zlib/JPEG
+encoding and disk I/O. A FrameSink hands images to a small pool of
+encoder threads instead (PIL releases the GIL while encoding), so the
+loop continues right away:
+
+    with FrameSink(workers=4, telemetry=tel) as sink:
+        frames = sink.output(out_dir, compress_level=1)   # fast PNGs
+        for ...:
+            frames.append(frame)                         # returns at once
+        sink.save(final, out_dir / "final.png", compress_level=9)
+
+The queue is bounded (`max_pending` images): when the encoders fall
+behind, save() blocks until a slot frees up, so memory stays flat. Save
+options (compress_level, quality, optimize, ...) are given per output
+or per save(). An error in a worker is raised from the next save(),
+flush() or close(). If the `with` block raises, images still in the
+queue are dropped instead of written.
+
+With workers=0 everything is saved synchronously in the caller's thread.
+"""
+
+import queue
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from seamcarving_manim.utils.telemetry import NullTelemetry
+
+
+class FrameSink:
+    def __init__(self, workers=2, max_pending=None, telemetry=None):
+        self.workers = workers
+        self.telemetry = telemetry or NullTelemetry()
+        self._queue = queue.Queue(maxsize=max_pending or max(2 * workers, 1))
+        self._error = None
+        self._dropping = False
+        self._threads = [
+            threading.Thread(target=self._work, name=f"frame-sink-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def save(self, arr, path, copy=True, **save_kwargs):
+        """
+        Queue `arr` to be saved as `path` (format from the suffix). The
+        array is copied unless copy=False, in which case the caller must
+        not modify it afterwards.
+        """
+        self._raise_pending()
+        arr = np.array(arr, dtype=np.uint8) if copy else np.asarray(arr, dtype=np.uint8)
+        job = (arr, Path(path), save_kwargs)
+        if not self._threads:
+            self._encode(*job)
+            return
+        with self.telemetry.span("sink_wait"):   # backpressure shows up here
+            self._queue.put(job)
+
+    def output(self, directory, pattern="frame_{:04d}.png", **save_kwargs):
+        """A FrameDirWriter-like appender saving numbered frames through this sink."""
+        return SinkOutput(self, directory, pattern, save_kwargs)
+
+    def flush(self):
+        """Block until every queued image is written."""
+        if self._threads:
+            self._queue.join()
+        self._raise_pending()
+
+    def close(self):
+        if not self._threads:
+            self._raise_pending()
+            return
+        self._queue.join()
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
+        self._threads = []
+        self._raise_pending()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+            return
+        # Don't encode the rest of a run that failed, and don't let a
+        # worker error hide the one already propagating
+        self._dropping = True
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------
+    def _encode(self, arr, path, save_kwargs):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.telemetry.save_image(arr, path, **save_kwargs)
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                if self._error is None and not self._dropping:
+                    self._encode(*job)
+            except BaseException as e:   # re-raised in the producer thread
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
+class SinkOutput:
+    """Numbered frames in one directory, written through a FrameSink."""
+
+    def __init__(self, sink, directory, pattern="frame_{:04d}.png", save_kwargs=None):
+        self.sink = sink
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.pattern = pattern
+        self.save_kwargs = save_kwargs or {}
+        self.count = 0
+
+    def append(self, frame):
+        self.sink.save(frame, self.directory / self.pattern.format(self.count), **self.save_kwargs)
+        self.count += 1
+
+    def close(self):
+        self.sink.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:   # on error the sink's own __exit__ drops the queue
+            self.close()
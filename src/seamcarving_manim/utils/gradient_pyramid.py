@@ -0,0 +1,109 @@
+"""
+Small gradient fields of an image at several grid sizes, in one file.
+
+s27 draws its arrows and 3x3 blocks on a coarse grid over memory.jpg.
+The fields for one grid (gray, gx, gy, mag) used to be four .npy files
+at a fixed 36x20; a pyramid stores them for every grid size the pregen
+was asked for, so a scene picks its density without rerunning pregen:
+
+    pyramid = load_pyramid(EDGES_DIR / "gradient_pyramid.npz")
+    field = pyramid.level(36, 20)          # or pyramid.nearest(cols=50)
+    gx, gy = field["gx"], field["gy"]      # (rows, cols) float arrays
+
+The file is a regular .npz (np.load reads it) with one member per grid
+and field, named "<cols>x<rows>/<field>.npy". Members are stored
+uncompressed by default, so load_pyramid() memory-maps each one straight
+out of the zip: opening the file reads only the zip directory and the
+.npy headers, and the arrays are read-only views of the page cache.
+Compressed pyramids (compress=True) are smaller but are read in full.
+"""
+
+import struct
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+FIELDS = ("gray", "gx", "gy", "mag")
+
+
+def grid_name(cols, rows):
+    return f"{cols}x{rows}"
+
+
+def save_pyramid(path, levels, compress=False):
+    """
+    Write `levels`, {(cols, rows): {"gray": ..., "gx": ..., "gy": ...,
+    "mag": ...}} with (rows, cols) arrays, as one .npz.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    method = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(path, "w", compression=method) as zf:
+        for (cols, rows), fields in sorted(levels.items()):
+            for name in FIELDS:
+                arr = np.ascontiguousarray(fields[name])
+                if arr.shape != (rows, cols):
+                    raise ValueError(f"{name} of grid {grid_name(cols, rows)} has shape {arr.shape}")
+                with zf.open(f"{grid_name(cols, rows)}/{name}.npy", "w", force_zip64=True) as f:
+                    np.lib.format.write_array(f, arr, allow_pickle=False)
+
+
+def _map_member(path, fp, info):
+    """Memory-map a stored (uncompressed) .npy member of an open zip."""
+    # The local file header is 30 bytes + file name + extra field; its
+    # extra field may differ from the central directory's
+    fp.seek(info.header_offset + 26)
+    name_len, extra_len = struct.unpack("<HH", fp.read(4))
+    fp.seek(info.header_offset + 30 + name_len + extra_len)
+    version = np.lib.format.read_magic(fp)
+    if version == (1, 0):
+        shape, fortran, dtype = np.lib.format.read_array_header_1_0(fp)
+    else:
+        shape, fortran, dtype = np.lib.format.read_array_header_2_0(fp)
+    arr = np.memmap(path, dtype=dtype, mode="r", offset=fp.tell(), shape=shape,
+                    order="F" if fortran else "C")
+    return np.asarray(arr)   # plain ndarray view of the mapping
+
+
+class GradientPyramid:
+    def __init__(self, path, mmap=True):
+        self.path = Path(path)
+        self._levels = {}
+        with zipfile.ZipFile(self.path) as zf, open(self.path, "rb") as fp:
+            for info in zf.infolist():
+                grid, _, member = info.filename.partition("/")
+                name = member.removesuffix(".npy")
+                if name not in FIELDS:
+                    continue
+                cols, rows = (int(n) for n in grid.split("x"))
+                if mmap and info.compress_type == zipfile.ZIP_STORED:
+                    arr = _map_member(self.path, fp, info)
+                else:
+                    with zf.open(info) as f:
+                        arr = np.lib.format.read_array(f, allow_pickle=False)
+                    arr.flags.writeable = False
+                self._levels.setdefault((cols, rows), {})[name] = arr
+
+    @property
+    def grids(self):
+        """(cols, rows) of every level, coarsest first."""
+        return sorted(self._levels, key=lambda g: g[0] * g[1])
+
+    def level(self, cols, rows):
+        try:
+            return dict(self._levels[(cols, rows)])
+        except KeyError:
+            known = ", ".join(grid_name(*g) for g in self.grids)
+            raise KeyError(f"No {grid_name(cols, rows)} grid in {self.path.name}; has {known}") from None
+
+    def nearest(self, cols=None, rows=None):
+        """The level whose column (or row) count is closest to the one asked for."""
+        if (cols is None) == (rows is None):
+            raise ValueError("Pass exactly one of cols or rows")
+        axis, want = (0, cols) if cols is not None else (1, rows)
+        return self.level(*min(self.grids, key=lambda g: abs(g[axis] - want)))
+
+
+def load_pyramid(path, mmap=True):
+    return GradientPyramid(path, mmap=mmap)
@@ -0,0 +1,140 @@
+"""
+Image loading for scenes, sized for the render resolution.
+
+Assets are stored at full resolution (memory.jpg is 2000x1446), but a
+scene shows them a few scene units tall: at 4.5 units that is ~600 px at
+1080p and ~270 px at -ql. load_image() downsamples to the on-screen
+pixel height of the active render quality and keeps the result as a
+.npy proxy under <media_dir>/proxies/<height>p/, so later renders at the
+same quality skip both the full-size decode and the resize.
+
+Decoded arrays are also kept in a process-wide LRU (bounded by bytes),
+so scenes rendered in one process share memory.jpg and the edge maps
+instead of each decoding their own copy. Cached arrays are returned
+read-only; copy before modifying.
+"""
+
+import hashlib
+import math
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+CACHE_MAX_BYTES = 512 * 2**20
+# Proxy heights are rounded up to a multiple of this, so scenes showing
+# the same asset at slightly different sizes share one proxy
+PROXY_STEP = 64
+
+_cache = OrderedDict()   # key -> read-only array, LRU order
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+
+
+def display_pixel_height(display_height):
+    """Pixels covered by `display_height` scene units at the active quality."""
+    from manim import config
+
+    return math.ceil(display_height / config.frame_height * config.pixel_height)
+
+
+def proxy_dir():
+    from manim import config
+
+    return Path(config.media_dir) / "proxies" / f"{config.pixel_height}p"
+
+
+def _proxy_path(path, mode, height, cache_dir):
+    # Source size + mtime in the name: an edited asset gets a new proxy
+    st = path.stat()
+    key = f"{path.resolve()}:{st.st_size}:{st.st_mtime_ns}:{mode}".encode()
+    digest = hashlib.sha1(key).hexdigest()[:12]
+    return Path(cache_dir) / f"{path.stem}-{digest}-{height}.npy"
+
+
+def decode_image(path, mode="RGB", max_height=None):
+    """Decode `path`, shrinking it to at most `max_height` rows if given."""
+    with Image.open(path) as im:
+        if max_height is not None and im.height > max_height:
+            size = (max(1, round(im.width * max_height / im.height)), max_height)
+            im.draft(mode, size)   # JPEG: let the decoder do most of the scaling
+            im = im.convert(mode).resize(size, Image.LANCZOS, reducing_gap=3.0)
+        else:
+            im = im.convert(mode)
+        return np.asarray(im, dtype=np.uint8)
+
+
+def load_image(path, display_height=None, mode="RGB", cache_dir=None):
+    """
+    Decode an image as a read-only uint8 array.
+
+    With `display_height` (scene units) the image is downsampled to (a
+    little over) the pixel height it covers at the current render
+    quality, using and filling the on-disk proxy cache. Images that are
+    already small enough are returned at full size.
+    """
+    path = Path(path)
+    height = None
+    if display_height is not None:
+        height = math.ceil(display_pixel_height(display_height) / PROXY_STEP) * PROXY_STEP
+
+    st = path.stat()
+    key = (str(path.resolve()), st.st_size, st.st_mtime_ns, mode, height)
+    arr = _cache_get(key)
+    if arr is None:
+        arr = _load(path, mode, height, cache_dir)
+        arr.flags.writeable = False
+        _cache_put(key, arr)
+    return arr.view()
+
+
+def _load(path, mode, height, cache_dir):
+    if height is None:
+        return decode_image(path, mode)
+    with Image.open(path) as im:
+        if im.height <= height:
+            return decode_image(path, mode)
+
+    proxy = _proxy_path(path, mode, height, cache_dir or proxy_dir())
+    if proxy.exists():
+        return np.load(proxy)
+
+    arr = decode_image(path, mode, max_height=height)
+    proxy.parent.mkdir(parents=True, exist_ok=True)
+    tmp = proxy.with_suffix(f".{os.getpid()}.tmp.npy")   # parallel renders
+    np.save(tmp, arr)
+    tmp.replace(proxy)
+    return arr
+
+
+# ==========================================================
+# Process-wide LRU
+# ==========================================================
+def _cache_get(key):
+    with _cache_lock:
+        arr = _cache.get(key)
+        if arr is not None:
+            _cache.move_to_end(key)
+        return arr
+
+
+def _cache_put(key, arr):
+    global _cache_bytes
+    with _cache_lock:
+        if key in _cache or arr.nbytes > CACHE_MAX_BYTES:
+            return
+        _cache[key] = arr
+        _cache_bytes += arr.nbytes
+        while _cache_bytes > CACHE_MAX_BYTES:
+            _, old = _cache.popitem(last=False)
+            _cache_bytes -= old.nbytes
+
+
+def clear_image_cache():
+    global _cache_bytes
+    with _cache_lock:
+        _cache.clear()
+        _cache_bytes = 0
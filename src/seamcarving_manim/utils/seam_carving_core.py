@@ -43,3 +43,55 @@ def remove_vertical_seam(img, seam):
         out[i,:j,:]   = img[i,:j,:]
         out[i,j:,:]   = img[i,j+1:,:]
     return out
+
+def find_vertical_seams(img, k):
+    # k successive seams of img, as columns of the original image
+    H, W = img.shape[:2]
+    if not 0 <= k < W:
+        raise ValueError(f"Can find 0 to {W-1} seams in an image {W} wide, not {k}")
+    index_map = np.tile(np.arange(W), (H, 1))  # original column of each pixel
+    rows = np.arange(H)
+    seams = np.zeros((k, H), dtype=int)
+    for n in range(k):
+        M, back = cumulative_min_energy_vertical(energy_map(img))
+        seam = find_vertical_seam(M, back)
+        seams[n] = index_map[rows, seam]
+        img = remove_vertical_seam(img, seam)
+        index_map = remove_vertical_seam(index_map[..., None], seam)[..., 0]
+    return seams
+
+def _pixel_view(a):
+    # (H, W, C) -> (H, W) with one opaque item per pixel, so boolean-mask
+    # copies move whole pixels instead of single channels (~10x faster)
+    H, W, C = a.shape
+    return a.reshape(H, W*C).view(np.dtype((np.void, C * a.itemsize)))
+
+def insert_vertical_seams(img, seams):
+    # After every seam pixel insert the average of it and its right
+    # neighbour. All seams go in at once: a mask marks the inserted
+    # output pixels and both sets are copied in with one pass each
+    H, W, C = img.shape
+    img = np.ascontiguousarray(img)
+    cols = np.sort(np.asarray(seams, dtype=int).reshape(-1, H), axis=0).T  # H x k, left to right
+    k = cols.shape[1]
+    if k and not (0 <= cols.min() and cols.max() < W):
+        raise ValueError(f"Seam columns must be in [0, {W-1}]")
+    if (np.diff(cols, axis=1) == 0).any():  # would mark one output pixel twice
+        raise ValueError("Seams must use a different column in every row")
+    rows = np.arange(H)[:, None]
+    inserted = np.zeros((H, W+k), dtype=bool)
+    inserted[rows, cols + np.arange(1, k+1)] = True  # the n-th insert of a row is shifted by n
+    avg = img[rows, cols].astype(np.result_type(img.dtype, np.float32))
+    avg += img[rows, np.minimum(cols+1, W-1)]
+    avg /= 2
+    if np.issubdtype(img.dtype, np.integer):
+        avg = np.rint(avg)
+    avg = np.ascontiguousarray(avg, dtype=img.dtype)
+    out = np.empty((H, W+k, C), dtype=img.dtype)
+    out_px = _pixel_view(out)
+    out_px[~inserted] = _pixel_view(img).ravel()
+    out_px[inserted] = _pixel_view(avg).ravel()
+    return out
+
+def enlarge_vertical(img, k):
+    return insert_vertical_seams(img, find_vertical_seams(img, k))
@@ -0,0 +1,190 @@
+"""
+Stage timings and throughput for the pregen scripts.
+
+A Telemetry object times the stages of a run (load, energy, dp,
+backtrack, remove, encode, write, ...) as spans, keeps counters, and at
+the end prints a per-stage summary with throughput (seams/s, MP/s), so
+it is visible whether e.g. PNG encoding or the DP dominates:
+
+    tel = Telemetry("purple_seam_pregen", trace=args.trace)
+    with tel.span("dp", pixels=E.size):
+        dp = compute_dp_energy(E)
+    tel.count("seams")
+    tel.close()
+
+With a trace path (or SEAMCARVING_TRACE naming a directory) every span
+is also written as one JSON line:
+
+    {"type": "span", "stage": "dp", "t": 1.92, "dur_s": 0.41, "pixels": 2892000}
+
+followed by a final {"type": "summary", ...} record. Spans may nest;
+nested stages are counted in their own row and in the enclosing one.
+Spans from other threads (e.g. FrameSink encoders) overlap the main
+thread's, so stage shares can add up to more than 100%.
+"""
+
+import io
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+from PIL import Image
+
+ENV_VAR = "SEAMCARVING_TRACE"
+
+
+def trace_path(run):
+    """<SEAMCARVING_TRACE>/<run>-<timestamp>.jsonl, or None if the variable is unset."""
+    directory = os.environ.get(ENV_VAR, "").strip()
+    if not directory:
+        return None
+    return Path(directory) / f"{run}-{time.strftime('%Y%m%d-%H%M%S')}.jsonl"
+
+
+class Telemetry:
+    def __init__(self, run, trace=None, stream=sys.stdout):
+        self.run = run
+        self.stream = stream
+        self.stages = {}         # stage -> [calls, seconds, pixels]
+        self.counters = Counter()
+        self.start = time.perf_counter()
+        self._last_progress = 0.0
+        self._lock = threading.Lock()   # spans may end on encoder threads
+
+        path = Path(trace) if trace else trace_path(run)
+        self.trace = path
+        self._file = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "w")
+        self._emit({"type": "start", "run": run, "time": time.time(), "pid": os.getpid(),
+                    "argv": sys.argv})
+
+    def _emit(self, record):
+        if self._file is not None:
+            self._file.write(json.dumps(record) + "\n")
+
+    # ------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------
+    @contextmanager
+    def span(self, stage, pixels=0, **attrs):
+        """Time the enclosed block as one call of `stage`."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            dur = time.perf_counter() - t0
+            with self._lock:
+                stats = self.stages.setdefault(stage, [0, 0.0, 0])
+                stats[0] += 1
+                stats[1] += dur
+                stats[2] += pixels
+                self._emit({"type": "span", "stage": stage, "t": round(t0 - self.start, 6),
+                            "dur_s": round(dur, 6), "pixels": pixels, **attrs})
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+
+    def save_image(self, arr, path, **save_kwargs):
+        """Image.save split into an `encode` span (in memory) and a `write` span."""
+        path = Path(path)
+        buf = io.BytesIO()
+        with self.span("encode", pixels=arr.shape[0] * arr.shape[1], file=path.name):
+            Image.fromarray(arr).save(buf, format=Image.registered_extensions().get(path.suffix.lower()),
+                                      **save_kwargs)
+        data = buf.getbuffer()
+        with self.span("write", bytes=len(data), file=path.name):
+            path.write_bytes(data)
+        self.count("bytes_written", len(data))
+
+    def progress(self, label, done, total, every=1.0):
+        """`label done/total` with rate and ETA, at most once per `every` seconds."""
+        now = time.perf_counter()
+        if done == 0 or (done < total and now - self._last_progress < every):
+            return
+        self._last_progress = now
+        elapsed = now - self.start
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / rate if rate > 0 else float("inf")
+        print(f"{label} {done}/{total}  {rate:.2f}/s  eta {eta:.0f}s", file=self.stream, flush=True)
+
+    # ------------------------------------------------------
+    # Summary
+    # ------------------------------------------------------
+    def summary(self):
+        wall = time.perf_counter() - self.start
+        stages = {
+            stage: {
+                "calls": calls,
+                "seconds": seconds,
+                "share": seconds / wall if wall > 0 else 0.0,
+                "mp_per_s": pixels / 1e6 / seconds if pixels and seconds > 0 else None,
+            }
+            for stage, (calls, seconds, pixels) in self.stages.items()
+        }
+        rates = {}
+        if self.counters["seams"]:
+            rates["seams_per_s"] = self.counters["seams"] / wall
+        if self.counters["pixels"]:
+            rates["mp_per_s"] = self.counters["pixels"] / 1e6 / wall
+        return {"type": "summary", "run": self.run, "wall_s": wall, "stages": stages,
+                "counters": dict(self.counters), "throughput": rates}
+
+    def format_summary(self, summary):
+        lines = [f"{self.run}: {summary['wall_s']:.2f} s",
+                 f"  {'stage':<20}{'calls':>8}{'seconds':>10}{'share':>8}{'MP/s':>9}"]
+        by_time = sorted(summary["stages"].items(), key=lambda kv: kv[1]["seconds"], reverse=True)
+        for stage, s in by_time:
+            mps = f"{s['mp_per_s']:.1f}" if s["mp_per_s"] is not None else "-"
+            lines.append(f"  {stage:<20}{s['calls']:>8}{s['seconds']:>10.2f}{s['share']:>8.1%}{mps:>9}")
+        for name, n in sorted(summary["counters"].items()):
+            lines.append(f"  {name}: {n}")
+        for name, v in summary["throughput"].items():
+            lines.append(f"  {name.replace('_per_s', '/s').replace('mp', 'MP')}: {v:.2f}")
+        return "\n".join(lines)
+
+    def close(self):
+        summary = self.summary()
+        self._emit(summary)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        print(self.format_summary(summary), file=self.stream, flush=True)
+        if self.trace is not None:
+            print(f"  trace: {self.trace}", file=self.stream, flush=True)
+        return summary
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class NullTelemetry(Telemetry):
+    """Telemetry that records nothing, for library functions called without one."""
+
+    def __init__(self):
+        self.counters = Counter()
+
+    def span(self, stage, pixels=0, **attrs):
+        return nullcontext()
+
+    def count(self, name, n=1):
+        pass
+
+    def save_image(self, arr, path, **save_kwargs):
+        Image.fromarray(arr).save(path, **save_kwargs)
+
+    def progress(self, label, done, total, every=1.0):
+        pass
+
+    def close(self):
+        return None
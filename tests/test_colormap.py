@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from seamcarving_manim.utils.colormap import colorize, ramp_lut, scale_lut
+
+
+@pytest.mark.parametrize("color", [(255, 165, 0), (120, 190, 255), (0, 0, 0)])
+def test_scale_lut_matches_float_tint(color):
+    rng = np.random.default_rng(0)
+    values = np.cumsum(np.abs(rng.normal(size=(200, 300))), axis=0)
+    values[0, 0] = 0.0
+    vmax = float(values.max())
+    expected = (values[..., None] / vmax * np.asarray(color, dtype=np.float32)).astype(np.uint8)
+
+    assert np.array_equal(colorize(values, scale_lut(color)), expected)
+
+
+def test_ramp_lut_matches_uint8_map():
+    rng = np.random.default_rng(1)
+    energy = np.abs(rng.normal(size=(120, 160)))
+    level = (energy / energy.max() * 255).astype(np.uint8)
+    expected = np.stack([level, level, 255 - level], axis=-1)
+
+    assert np.array_equal(colorize(energy, ramp_lut((0, 0, 255), (255, 255, 0))), expected)
@@ -0,0 +1,38 @@
+import numpy as np
+
+from seamcarving_manim.utils.frame_sequence import open_frames, open_writer
+
+
+def _frames(value, count=3):
+    return [np.full((4, 6, 3), value + i, dtype=np.uint8) for i in range(count)]
+
+
+def test_png_run_replaces_an_older_pack(tmp_path):
+    directory = tmp_path / "seam"
+    with open_writer(directory, "pack", 4, 6) as out:
+        for frame in _frames(10):
+            out.append(frame)
+    with open_writer(directory, "png", 4, 6) as out:
+        for frame in _frames(200, count=2):
+            out.append(frame)
+
+    assert not directory.with_suffix(".frames").exists()
+    frames = open_frames(directory)
+    assert len(frames) == 2
+    assert np.array_equal(np.asarray(frames[1]), _frames(200, count=2)[1])
+
+
+def test_failed_pack_keeps_the_previous_one(tmp_path):
+    directory = tmp_path / "seam"
+    with open_writer(directory, "pack", 4, 6) as out:
+        for frame in _frames(10):
+            out.append(frame)
+    try:
+        with open_writer(directory, "pack", 4, 6) as out:
+            out.append(_frames(50)[0])
+            raise RuntimeError
+    except RuntimeError:
+        pass
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["seam.frames"]
+    assert len(open_frames(directory)) == 3
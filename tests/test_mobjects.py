@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from seamcarving_manim.mobjects import NumberLabel  # noqa: E402
+
+
+def test_number_label_family_is_fixed_across_set_value():
+    label = NumberLabel(0, "{} / 27", prefix="Enumerating seams: ")
+    before = label.get_family()
+
+    label.set_value(27)
+
+    after = label.get_family()
+    assert {id(m) for m in after} == {id(m) for m in before}
+    assert len(after) == len(before)
+
+
+def test_number_label_string_value_keeps_family():
+    label = NumberLabel("–", "{:.1f}", prefix="Best energy so far = ")
+    before = {id(m) for m in label.get_family()}
+
+    label.set_value(123.4)
+    label.set_value("–")
+
+    assert {id(m) for m in label.get_family()} == before
+
+
+def test_number_label_rejects_values_longer_than_its_pool():
+    label = NumberLabel(0, max_chars=2)
+    with pytest.raises(ValueError):
+        label.set_value(123)
+
+
+def test_static_number_label_has_one_slot_per_glyph():
+    label = NumberLabel(0.5, "{:.1f}")   # "0.5": three glyphs
+
+    # the origin and scale probe points, then the glyph slots
+    assert len(label.submobjects) == 2 + 3
@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from seamcarving_manim.profiling import _Timers  # noqa: E402
+
+
+def test_write_frame_counts_num_frames():
+    timers = _Timers()
+    calls = []
+    write_frame = timers.wrap(lambda frame, num_frames=1: calls.append(num_frames), "encode",
+                              counts_frame=True)
+
+    write_frame("frame", num_frames=5)
+    write_frame("frame")
+
+    assert calls == [5, 1]
+    assert timers.frames == 6
+
+
+def test_write_frame_counts_repeat():
+    timers = _Timers()
+    write_frame = timers.wrap(lambda frame, repeat=1: None, "encode", counts_frame=True)
+
+    write_frame("frame", repeat=3)
+
+    assert timers.frames == 3
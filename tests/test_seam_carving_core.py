@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from seamcarving_manim.utils.seam_carving_core import (
+    enlarge_vertical,
+    find_vertical_seams,
+    insert_vertical_seams,
+)
+
+
+def naive_insert(img, seams):
+    # One row at a time, right to left so earlier inserts don't shift the
+    # columns still to come
+    H, W, _ = img.shape
+    out = []
+    for i in range(H):
+        row = list(img[i])
+        for j in sorted((int(s[i]) for s in seams), reverse=True):
+            avg = (img[i, j].astype(np.float64) + img[i, min(j + 1, W - 1)]) / 2
+            if np.issubdtype(img.dtype, np.integer):
+                avg = np.rint(avg)
+            row.insert(j + 1, avg.astype(img.dtype))
+        out.append(row)
+    return np.array(out, dtype=img.dtype)
+
+
+def random_seams(rng, H, W, k):
+    return np.stack([rng.choice(W, size=k, replace=False) for _ in range(H)], axis=1)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.float32, np.float64])
+def test_matches_naive_insertion(dtype):
+    rng = np.random.default_rng(0)
+    img = (rng.random((7, 9, 3)) * 255).astype(dtype)
+    seams = random_seams(rng, 7, 9, 4)
+
+    out = insert_vertical_seams(img, seams)
+
+    assert out.shape == (7, 13, 3)
+    assert out.dtype == img.dtype
+    np.testing.assert_allclose(out, naive_insert(img, seams), rtol=1e-6)
+
+
+def test_no_seams_returns_a_copy():
+    img = np.arange(5 * 4 * 3, dtype=np.uint8).reshape(5, 4, 3)
+
+    out = insert_vertical_seams(img, np.zeros((0, 5), dtype=int))
+
+    assert np.array_equal(out, img)
+    assert out is not img
+
+
+def test_seam_at_the_last_column_duplicates_it():
+    rng = np.random.default_rng(1)
+    img = rng.integers(0, 256, size=(4, 6, 3), dtype=np.uint8)
+    seams = np.array([[5, 5, 5, 5], [0, 2, 4, 1]])
+
+    out = insert_vertical_seams(img, seams)
+
+    assert np.array_equal(out, naive_insert(img, seams))
+    assert np.array_equal(out[:, -1], img[:, -1])
+    assert np.array_equal(out[:2, -2], img[:2, -1])
+
+
+def test_rejects_repeated_columns():
+    img = np.zeros((3, 5, 3), dtype=np.uint8)
+    seams = np.array([[1, 2, 3], [1, 4, 3]])  # both seams use column 1 in row 0
+
+    with pytest.raises(ValueError):
+        insert_vertical_seams(img, seams)
+
+
+def test_rejects_columns_outside_the_image():
+    img = np.zeros((3, 5, 3), dtype=np.uint8)
+
+    with pytest.raises(ValueError):
+        insert_vertical_seams(img, np.array([[0, 1, 5]]))
+
+
+def test_enlarge_vertical():
+    rng = np.random.default_rng(2)
+    img = rng.integers(0, 256, size=(8, 10, 3), dtype=np.uint8)
+
+    seams = find_vertical_seams(img, 3)
+    out = enlarge_vertical(img, 3)
+
+    assert seams.shape == (3, 8)
+    assert np.array_equal(out, naive_insert(img, seams))